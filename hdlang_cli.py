@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HDLang komut satırı aracı - editörü açmadan çıkarma, uygulama ve arama
+
+Kullanım:
+    python hdlang_cli.py extract oyun.hdlang -o oyun.txt
+    python hdlang_cli.py apply oyun.hdlang ceviri.txt -o oyun_tr.hdlang
+    python hdlang_cli.py stats oyun.hdlang
+    python hdlang_cli.py search "new game" oyunlar/
+
+Editörle aynı ayar dosyasını (hdlang_settings.json) ve aynı çekirdek
+fonksiyonları (hdlang_core) kullanır; tkinter gerekmez.
+"""
+
+import argparse
+import json
+import os
+import sys
+import multiprocessing
+
+from hdlang_core import (
+    BACKUP_DIR, BACKUP_FULL_EVERY, FOLDER_SEARCH_MATCH_LIMIT, BackupStore, StringTooLongError,
+    build_string_table, find_hdlang_files, map_file, modified_path, process_pool,
+    save_string_table, search_file, table_options,
+)
+
+SETTINGS_FILE = 'hdlang_settings.json'
+
+
+def load_settings(path):
+    """Editörün ayar dosyası (yoksa boş - varsayılanlar kullanılır)"""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def open_table(file_path, settings, use_mmap=True):
+    """Dosyayı editörle aynı yoldan aç: önbellek -> yapısal tablo -> sezgisel tarama"""
+    data = map_file(file_path, use_mmap and settings.get("use_mmap", True))
+    table, _ = build_string_table(file_path, data, **table_options(settings))
+    return table
+
+
+def read_translations(path):
+    """Çeviri dosyası: .json ise liste, değilse satır başına bir string
+    
+    JSON listesi ya metinlerden ya da {"index": ..., "text": ...}
+    kayıtlarından oluşur (extract --json çıktısı doğrudan kullanılabilir).
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if path.lower().endswith(".json"):
+            return json.load(f)
+        content = f.read()
+    if content.endswith("\n"):
+        content = content[:-1]
+    return content.split("\n") if content else []
+
+
+def cmd_extract(args, settings):
+    """Güncel stringleri satır başına bir tane (ya da JSON) olarak yaz"""
+    table = open_table(args.file, settings)
+    out = open(args.output, "w", encoding="utf-8", newline="\n") if args.output else sys.stdout
+    try:
+        if args.json:
+            records = [{"index": index, "offset": start, "text": table.get(index)}
+                       for index, (start, _) in enumerate(table.positions)]
+            json.dump(records, out, ensure_ascii=False, indent=1)
+            out.write("\n")
+        else:
+            for text in table.current:
+                out.write(text)
+                out.write("\n")
+    finally:
+        if args.output:
+            out.close()
+    
+    print(f"{len(table):,} string çıkarıldı ({table.layout.name})", file=sys.stderr)
+    return 0
+
+
+def cmd_apply(args, settings):
+    """Çevirileri uygula ve dosyayı editörün kaydetme yoluyla yaz"""
+    output = args.output or modified_path(args.file)
+    in_place = os.path.abspath(output) == os.path.abspath(args.file)
+    
+    # Yerinde kaydetmede eşlenmiş dosyanın üzerine yazılmaz - belleğe okunur
+    table = open_table(args.file, settings, use_mmap=not in_place)
+    translations = read_translations(args.translations)
+    
+    if translations and isinstance(translations[0], dict):
+        changed = 0
+        for item in translations:
+            index = item["index"]
+            if not 0 <= index < len(table):
+                raise ValueError(f"Geçersiz string indeksi: {index}")
+            if item["text"] != table.get(index):
+                table.set(index, item["text"])
+                changed += 1
+    else:
+        if len(translations) != len(table) and not args.force:
+            print(f"hata: satır sayısı değişti (orijinal: {len(table):,} string, "
+                  f"yeni: {len(translations):,} satır)\n"
+                  f"--force ile eksik satırlar boş string olur, fazlası yok sayılır", file=sys.stderr)
+            return 1
+        changed = table.sync(translations)
+    
+    dynamic = settings.get("dynamic_sizing", True) if args.dynamic is None else args.dynamic
+    store = None
+    if args.backup:
+        store = BackupStore(args.backup_dir, settings.get("backup_compression", "zlib"),
+                            settings.get("backup_level", 6))
+        store.backup_file(args.file)
+    
+    try:
+        size = save_string_table(table, output, dynamic, None if in_place else args.file)
+    except StringTooLongError as e:
+        print(f"hata: '{e.text}' metni çok uzun ({e.actual} > {e.limit}); "
+              f"--dynamic ile kaydedin", file=sys.stderr)
+        return 1
+    
+    if store is not None:
+        # Editördeki gibi kaydedilen sürümün fark yedeği
+        store.backup_file(output, delta=True,
+                          full_every=settings.get("backup_full_every", BACKUP_FULL_EVERY))
+    
+    print(f"{changed:,} string değişti -> {output} ({size:,} byte)", file=sys.stderr)
+    return 0
+
+
+def cmd_stats(args, settings):
+    """String sayısı ve uzunluk özeti"""
+    table = open_table(args.file, settings)
+    stats = table.stats
+    info = {
+        "file": args.file,
+        "size": len(table.data),
+        "layout": table.layout.name,
+        "strings": len(table),
+        "min_length": stats.min_length,
+        "max_length": stats.max_length,
+        "mean_length": round(stats.mean, 1),
+        "total_chars": stats.total_chars,
+        "percentiles": {f"p{point}": length for point, length in stats.percentiles().items()},
+    }
+    if args.json:
+        json.dump(info, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return 0
+    
+    print(f"Dosya:        {info['file']} ({info['size']:,} byte, {info['layout']})")
+    print(f"String:       {info['strings']:,}")
+    print(f"Uzunluk:      en kısa {info['min_length']:,}, en uzun {info['max_length']:,}, "
+          f"ortalama {info['mean_length']}")
+    print(f"Toplam:       {info['total_chars']:,} karakter")
+    print("Yüzdelikler:  " + ", ".join(f"{key.upper()} {value:,}"
+                                       for key, value in info["percentiles"].items()))
+    buckets = stats.buckets()
+    if buckets:
+        largest = max(count for _, _, count in buckets)
+        for low, high, count in buckets:
+            bar = "#" * max(1, round(count / largest * 25))
+            print(f"  {low:>6}-{high:<6} {bar} {count:,}")
+    return 0
+
+
+def iter_search_results(tasks, jobs):
+    """search_file sonuçlarını dosya sırasıyla üret; hata veren dosya (yol, hata) olur"""
+    if jobs <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            try:
+                yield search_file(task), None
+            except (OSError, ValueError) as e:
+                yield None, (task[0], e)
+        return
+    
+    with process_pool(min(jobs, len(tasks))) as pool:
+        futures = [pool.submit(search_file, task) for task in tasks]
+        for task, future in zip(tasks, futures):
+            try:
+                yield future.result(), None
+            except Exception as e:
+                yield None, (task[0], e)
+
+
+def cmd_search(args, settings):
+    """Dosyalarda / klasörlerde büyük-küçük harf duyarsız ara (grep biçiminde çıktı)"""
+    files = []
+    for path in args.paths:
+        files.extend(find_hdlang_files(path) if os.path.isdir(path) else [path])
+    
+    # İşçiler her dosyayı seri tarar; paralellik dosyalar arasındadır
+    options = dict(table_options(settings), workers=1)
+    tasks = [(path, args.keyword, options) for path in files]
+    jobs = args.jobs or os.cpu_count() or 1
+    
+    total = 0
+    for result, error in iter_search_results(tasks, jobs):
+        if error is not None:
+            print(f"hata: {error[0]}: {error[1]}", file=sys.stderr)
+            continue
+        path, _, match_count, matches = result
+        for index, text in matches:
+            print(f"{path}:{index + 1}: {text}")
+        if len(matches) == FOLDER_SEARCH_MATCH_LIMIT:
+            print(f"{path}: ilk {FOLDER_SEARCH_MATCH_LIMIT:,} string gösterildi", file=sys.stderr)
+        total += match_count
+    
+    print(f"{total:,} eşleşme, {len(files):,} dosya", file=sys.stderr)
+    return 0 if total else 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="hdlang_cli", description="HDLang dosyalarını editörsüz işle")
+    parser.add_argument("--settings", default=SETTINGS_FILE,
+                        help=f"editör ayar dosyası (varsayılan: {SETTINGS_FILE})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    extract = commands.add_parser("extract", help="stringleri çıkar")
+    extract.add_argument("file")
+    extract.add_argument("-o", "--output", help="çıktı dosyası (varsayılan: standart çıktı)")
+    extract.add_argument("--json", action="store_true", help="index/offset/text kayıtları olarak yaz")
+    extract.set_defaults(handler=cmd_extract)
+    
+    apply = commands.add_parser("apply", help="çevirileri uygula ve kaydet")
+    apply.add_argument("file")
+    apply.add_argument("translations", help="satır başına bir string ya da extract --json çıktısı")
+    apply.add_argument("-o", "--output", help="çıktı dosyası (varsayılan: *_modified.hdlang)")
+    sizing = apply.add_mutually_exclusive_group()
+    sizing.add_argument("--dynamic", dest="dynamic", action="store_true", default=None,
+                        help="dinamik boyutlandırma (uzunluk sınırı yok)")
+    sizing.add_argument("--fixed", dest="dynamic", action="store_false",
+                        help="sabit boyut (orijinal uzunluk aşılamaz)")
+    apply.add_argument("--force", action="store_true", help="satır sayısı farklı olsa da uygula")
+    apply.add_argument("--backup", action="store_true", help="kaynak ve çıktının yedeğini al")
+    apply.add_argument("--backup-dir", default=BACKUP_DIR)
+    apply.set_defaults(handler=cmd_apply)
+    
+    stats = commands.add_parser("stats", help="string istatistikleri")
+    stats.add_argument("file")
+    stats.add_argument("--json", action="store_true")
+    stats.set_defaults(handler=cmd_stats)
+    
+    search = commands.add_parser("search", help="dosyalarda ve klasörlerde ara")
+    search.add_argument("keyword")
+    search.add_argument("paths", nargs="+", help=".hdlang dosyaları ya da klasörler")
+    search.add_argument("-j", "--jobs", type=int, default=0, help="paralel işçi sayısı (0 = tüm çekirdekler)")
+    search.set_defaults(handler=cmd_search)
+    
+    args = parser.parse_args(argv)
+    try:
+        return args.handler(args, load_settings(args.settings))
+    except BrokenPipeError:
+        # Çıktı erken kapandı (ör. | head) - sessizce çık
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"hata: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    # Paketlenmiş (frozen) sürümde paralel tarama işçileri için gerekli
+    multiprocessing.freeze_support()
+    sys.exit(main())
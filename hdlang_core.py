@@ -0,0 +1,1909 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HDLang Editor çekirdeği - Tk gerektirmeyen kütüphane
+
+String çıkarma, string modeli (StringTable), sabit/dinamik kaydetme,
+arama/değiştirme ve yedekleme burada bulunur. Masaüstü editörü ve komut
+satırı aracı (hdlang_cli.py) aynı fonksiyonları kullanır; tkinter
+gerektirmediği için derleme sunucularında da çalışır.
+
+Örnek:
+    data = map_file("oyun.hdlang")
+    table, _ = build_string_table("oyun.hdlang", data)
+    table.set(0, "yeni bir oyuna başla")
+    save_string_table(table, modified_path("oyun.hdlang"))
+"""
+
+import os
+import sys
+import json
+import datetime
+import hashlib
+import zlib
+import struct
+import itertools
+import functools
+import heapq
+import difflib
+import mmap
+import shutil
+import tempfile
+import threading
+import contextlib
+import importlib.util
+import multiprocessing
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+import re
+import operator
+
+# NumPy isteğe bağlıdır (yoksa regex motoru kullanılır) ve ilk kullanımda
+# yüklenir; çekirdeği içe aktaran CLI ve süreç işçileri bedelini ödemez
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+# String çıkarma motorları
+# Hepsi aynı kuralı uygular: en az 2 karakterlik ASCII yazdırılabilir (32-126)
+# diziler alınır; 2 karakterlik diziler yalnızca harf içeriyorsa kabul edilir.
+PRINTABLE_RUN_RE = re.compile(
+    rb'[\x20-\x7e]{3,}'                                # 3+ karakterlik tüm diziler
+    rb'|(?:[A-Za-z][\x20-\x7e]|[\x20-\x7e][A-Za-z])'  # harf içeren 2'li diziler
+    rb'(?![\x20-\x7e])'
+)
+
+
+def extract_strings_python(data):
+    """Bayt bayt tarayan referans motor (eski davranış)"""
+    strings = []
+    positions = []
+    i = 0
+
+    while i < len(data):
+        if 32 <= data[i] <= 126:  # ASCII yazdırılabilir karakterler
+            start = i
+            while i < len(data) and 32 <= data[i] <= 126:
+                i += 1
+
+            # En az 2 karakter uzunluğundaki stringleri al
+            if i - start >= 2:
+                try:
+                    string_content = data[start:i].decode("ascii", errors="ignore")
+                    # Sadece anlamlı stringler (en az bir harf içeren)
+                    if any(c.isalpha() for c in string_content) or len(string_content) >= 3:
+                        strings.append(string_content)
+                        positions.append((start, i))
+                except:
+                    pass
+        else:
+            i += 1
+
+    return strings, positions
+
+
+def extract_strings_regex(data):
+    """Derlenmiş bytes regex ile toplu tarama"""
+    strings = []
+    positions = []
+
+    for match in PRINTABLE_RUN_RE.finditer(data):
+        strings.append(match.group().decode("ascii"))
+        positions.append(match.span())
+
+    return strings, positions
+
+
+def extract_strings_numpy(data):
+    """NumPy ile vektörel tarama"""
+    if not len(data):
+        return [], []
+    import numpy as np
+
+    arr = np.frombuffer(data, dtype=np.uint8)
+    printable = (arr >= 32) & (arr <= 126)
+
+    # Yazdırılabilir dizilerin başlangıç/bitiş sınırları
+    padded = np.concatenate(([False], printable, [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    starts = edges[0::2]
+    ends = edges[1::2]
+    lengths = ends - starts
+
+    keep = lengths >= 3
+    pairs = np.flatnonzero(lengths == 2)
+    if len(pairs):
+        folded = arr | 0x20  # büyük harfleri küçüğe katla
+        is_alpha = (folded >= 97) & (folded <= 122)
+        pair_starts = starts[pairs]
+        keep[pairs] = is_alpha[pair_starts] | is_alpha[pair_starts + 1]
+
+    starts = starts[keep].tolist()
+    ends = ends[keep].tolist()
+    strings = [bytes(data[s:e]).decode("ascii") for s, e in zip(starts, ends)]
+    return strings, list(zip(starts, ends))
+
+
+EXTRACT_ENGINES = {
+    "python": extract_strings_python,
+    "regex": extract_strings_regex,
+}
+if HAS_NUMPY:
+    EXTRACT_ENGINES["numpy"] = extract_strings_numpy
+
+
+def get_extract_engine(name="auto"):
+    """İsme göre çıkarma motorunu döndür ('auto' en hızlısını seçer)"""
+    if name == "auto":
+        name = "numpy" if "numpy" in EXTRACT_ENGINES else "regex"
+    return EXTRACT_ENGINES.get(name, extract_strings_regex)
+
+
+# Dosya düzenleri (layout)
+# Her düzen bir stringin nasıl çözüleceğini ve kaydederken hangi bayt
+# aralığının hangi baytlarla değiştirileceğini bilir.
+class StringTooLongError(ValueError):
+    """Sabit boyut modunda yeni string orijinal alana sığmıyor"""
+    
+    def __init__(self, text, limit, actual):
+        super().__init__(f"'{text}' metni çok uzun ({actual} > {limit})")
+        self.text = text
+        self.limit = limit
+        self.actual = actual
+
+
+class HeuristicLayout:
+    """Sezgisel tarama: yazdırılabilir ASCII dizileri yerinde değiştirilir"""
+    name = "heuristic"
+    byte_lengths = True  # karakter sayısı = bayt sayısı (çözmeden uzunluk)
+    
+    def decode(self, raw):
+        return raw.decode("ascii", errors="ignore")
+    
+    def replacement(self, start, end, text, dynamic=True):
+        """(aralık başı, aralık sonu, yeni baytlar) döndür"""
+        if dynamic:
+            # UTF-8 ile kodla (daha fazla karakter desteği)
+            return start, end, text.encode("utf-8", errors="ignore")
+        
+        # Sabit boyut: ASCII + NUL dolgusu, orijinal uzunluğu aşamaz
+        encoded = text.encode("ascii", errors="ignore")
+        length = end - start
+        if len(encoded) > length:
+            raise StringTooLongError(text, length, len(encoded))
+        return start, end, encoded + b"\x00" * (length - len(encoded))
+
+
+_ESCAPES = {"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+_UNESCAPES = {"\\": "\\", "n": "\n", "r": "\r", "t": "\t"}
+_ESCAPE_RE = re.compile(r'[\\\n\r\t]')
+_UNESCAPE_RE = re.compile(r'\\(.)')
+_CONTROL_BYTES_RE = re.compile(rb'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+_U32 = struct.Struct("<I")
+
+# Yapısal tablo ancak bu kadar kayıt içerir ve dosyanın bu kadarını
+# kaplarsa kullanılır; başlıktaki küçük diziler (ör. 2 anahtarlık bir
+# liste) sezgisel taramanın bulacağı binlerce stringin yerini almasın
+STRUCTURED_MIN_STRINGS = 3
+STRUCTURED_MIN_COVERAGE = 0.5
+
+
+class LengthPrefixedLayout:
+    """Yapısal string tablosu: int32 uzunluk + UTF-8 baytlar + hizalama dolgusu
+    
+    Satır sonu içeren metinler editörde tek satırda kalması için kaçışlı
+    (\\n, \\t ...) gösterilir ve kaydederken geri çevrilir. Sabit boyut
+    modunda kısalan metin kaydın içinde NUL ile doldurulur (uzunluk alanı
+    ve kayıt boyu korunur); sondaki NUL'lar metne dahil edilmez.
+    """
+    name = "length_prefixed"
+    byte_lengths = False  # UTF-8 ve kaçışlar yüzünden uzunluk çözülerek bulunur
+    
+    def __init__(self, align=4):
+        self.align = align
+    
+    def padded(self, length):
+        return -(-length // self.align) * self.align
+    
+    def decode(self, raw):
+        text = bytes(raw).rstrip(b"\x00").decode("utf-8", errors="replace")
+        return _ESCAPE_RE.sub(lambda m: _ESCAPES[m.group()], text)
+    
+    def encode(self, text):
+        text = _UNESCAPE_RE.sub(lambda m: _UNESCAPES.get(m.group(1), m.group()), text)
+        return text.encode("utf-8", errors="ignore")
+    
+    def replacement(self, start, end, text, dynamic=True):
+        """Uzunluk alanı dahil tüm kaydı yeniden yaz"""
+        encoded = self.encode(text)
+        record_start = start - _U32.size
+        record_end = start + self.padded(end - start)
+        
+        if dynamic:
+            capacity = self.padded(len(encoded))
+            length = len(encoded)
+        else:
+            capacity = record_end - start
+            if len(encoded) > capacity:
+                raise StringTooLongError(text, capacity, len(encoded))
+            # Uzunluk alanı kısalmaz: kayıt aynı hizalı boyda okunmalı
+            length = max(len(encoded), end - start)
+        
+        padding = b"\x00" * (capacity - len(encoded))
+        return record_start, record_end, _U32.pack(length) + encoded + padding
+
+
+LAYOUTS = {
+    HeuristicLayout.name: HeuristicLayout(),
+    LengthPrefixedLayout.name: LengthPrefixedLayout(),
+}
+
+
+def _read_length_prefixed_table(data, offset, layout, min_strings=STRUCTURED_MIN_STRINGS):
+    """Verilen konumda [sayı][uzunluk+metin]... tablosu varsa oku"""
+    size = len(data)
+    if offset + _U32.size > size:
+        return None
+    
+    count, = _U32.unpack_from(data, offset)
+    if count < min_strings or count > (size - offset - _U32.size) // _U32.size:
+        return None
+    
+    starts = array('Q')
+    ends = array('Q')
+    text_bytes = 0
+    non_empty = 0
+    pos = offset + _U32.size
+    
+    for _ in range(count):
+        if pos + _U32.size > size:
+            return None
+        length, = _U32.unpack_from(data, pos)
+        start = pos + _U32.size
+        end = start + length
+        record_end = start + layout.padded(length)
+        if record_end > size:
+            return None
+        
+        raw = bytes(data[start:end]).rstrip(b"\x00")  # sabit boyut dolgusu
+        if _CONTROL_BYTES_RE.search(raw) or any(data[end:record_end]):
+            return None
+        try:
+            raw.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+        
+        starts.append(start)
+        ends.append(end)
+        text_bytes += len(raw)
+        non_empty += len(raw) > 0
+        pos = record_end
+    
+    # Sıfırlarla dolu başlık alanlarını tablo sanmamak için
+    if non_empty * 2 < count or text_bytes < 2 * count:
+        return None
+    return starts, ends, pos
+
+
+def covers_file(size, starts, ends):
+    """Tablo dosyanın yeterince büyük bir kısmını kaplıyor mu"""
+    if len(starts) < STRUCTURED_MIN_STRINGS:
+        return False
+    return ends[-1] - starts[0] >= size * STRUCTURED_MIN_COVERAGE
+
+
+def read_string_table(data, scan_limit=4096):
+    """Başlıktan sonra gelen yapısal string tablolarını O(string sayısı) sürede oku
+    
+    Tablonun başı dosyanın ilk scan_limit baytında hizalı konumlarda aranır;
+    ardışık tablolar (ör. anahtar + değer dizileri) birlikte okunur.
+    Tanınmayan ya da dosyanın küçük bir kısmını kaplayan tablolarda None
+    döner ve sezgisel taramaya geçilir.
+    """
+    layout = LAYOUTS[LengthPrefixedLayout.name]
+    limit = min(scan_limit, max(0, len(data) - _U32.size))
+    
+    for offset in range(0, limit + 1, layout.align):
+        found = _read_length_prefixed_table(data, offset, layout)
+        if not found:
+            continue
+        
+        starts, ends, table_end = found
+        while True:
+            following = _read_length_prefixed_table(data, table_end, layout)
+            if not following:
+                break
+            starts.extend(following[0])
+            ends.extend(following[1])
+            table_end = following[2]
+        if covers_file(len(data), starts, ends):
+            return layout, starts, ends
+    
+    return None
+
+
+PRINTABLE_PREFIX_RE = re.compile(rb'[\x20-\x7e]*')
+
+
+def _is_printable_at(data, index):
+    """Verilen konumdaki bayt ASCII yazdırılabilir mi"""
+    return 0 <= index < len(data) and 32 <= data[index] <= 126
+
+
+def _extract_segment(task):
+    """Süreç havuzu işçisi: dosyanın bir bölümünü tarayıp konumları döndür
+    
+    Veri aktarılmaz; her işçi dosyayı kendisi eşler (sayfa önbelleği ortaktır).
+    Bölüm sınırlarında dikiş: önceki bölümden taşan dizi atlanır, bölüm
+    sonunu aşan dizi ise bitene kadar okunur. Böylece her dizi tam olarak
+    bir işçi tarafından, seri taramayla aynı şekilde bulunur.
+    """
+    file_path, seg_start, seg_end, engine_name = task
+    positions = array('Q')
+    
+    with open(file_path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    try:
+        start = seg_start
+        if _is_printable_at(data, start - 1):
+            start = PRINTABLE_PREFIX_RE.match(data, start).end()
+        
+        end = seg_end
+        if start < end and _is_printable_at(data, end - 1):
+            end = PRINTABLE_PREFIX_RE.match(data, end).end()
+        
+        if start < end:
+            _, found = get_extract_engine(engine_name)(data[start:end])
+            for s, e in found:
+                positions.append(start + s)
+                positions.append(start + e)
+    finally:
+        data.close()
+    
+    return positions
+
+
+def process_pool(workers):
+    """Süreç havuzu (fork yerine spawn)
+    
+    Editörde havuz Tk ve arka plan iş parçacıkları (yedekleme, kaydetme)
+    çalışırken kurulur; çok iş parçacıklı süreci fork etmek çocukta
+    kilitlenmeye yol açabilir. İşçi fonksiyonları bu modülde olduğundan
+    spawn ile yeniden içe aktarılabilir.
+    """
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def extract_strings_parallel(data, file_path, workers, engine_name="auto"):
+    """Dosyayı N bölüme ayırıp süreç havuzunda tara, sonuçları birleştir"""
+    size = len(data)
+    segment = -(-size // workers)  # yukarı yuvarlanmış bölüm boyu
+    tasks = [(file_path, i * segment, min(size, (i + 1) * segment), engine_name)
+             for i in range(workers) if i * segment < size]
+    
+    positions = []
+    with process_pool(len(tasks)) as executor:
+        for found in executor.map(_extract_segment, tasks):
+            positions.extend(zip(found[0::2], found[1::2]))
+    
+    strings = [data[s:e].decode("ascii") for s, e in positions]
+    return strings, positions
+
+
+# Kalıcı çıkarma indeksi önbelleği (.hdidx)
+INDEX_CACHE_DIR = 'hdlang_cache'
+INDEX_CACHE_MAGIC = b"HDIDX2"
+# sihirli değer, dosya boyutu, mtime (ns), string sayısı, içerik özeti, düzen
+INDEX_CACHE_HEADER = struct.Struct("<6sQqQ16s16s")
+
+
+def content_digest(data):
+    """Dosya içeriğinin hızlı özeti (BLAKE2b, 128 bit)"""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def index_cache_path(file_path, cache_dir=INDEX_CACHE_DIR):
+    """Dosyanın önbellek indeksinin yolu (mutlak yola göre adlandırılır)"""
+    key = hashlib.blake2b(os.path.abspath(file_path).encode("utf-8"), digest_size=16)
+    return os.path.join(cache_dir, key.hexdigest() + ".hdidx")
+
+
+def read_index_cache(file_path, data, cache_dir=INDEX_CACHE_DIR, with_strings=False):
+    """Önbellekteki indeksi (başlangıçlar, bitişler, düzen adı, stringler) olarak oku
+    
+    Dosya değişmişse veya indeks yoksa None döndürür. Stringler yalnızca
+    istenirse çözülür; aksi halde None gelir ve tampondan dilimlenir.
+    """
+    cache_path = index_cache_path(file_path, cache_dir)
+    try:
+        stat = os.stat(file_path)
+        with open(cache_path, "rb") as f:
+            magic, size, mtime_ns, count, digest, layout_name = INDEX_CACHE_HEADER.unpack(
+                f.read(INDEX_CACHE_HEADER.size))
+            layout_name = layout_name.rstrip(b"\x00").decode("ascii", errors="ignore")
+            if (magic != INDEX_CACHE_MAGIC or size != stat.st_size or size != len(data)
+                    or mtime_ns != stat.st_mtime_ns or layout_name not in LAYOUTS):
+                return None
+            if digest != content_digest(data):
+                return None
+            
+            flat = array('Q')
+            flat.frombytes(f.read(count * 2 * flat.itemsize))
+            blob = f.read() if with_strings else None
+    except (OSError, struct.error, ValueError):
+        return None
+    
+    if sys.byteorder == "big":
+        flat.byteswap()
+    
+    starts = flat[0::2]
+    ends = flat[1::2]
+    if len(starts) != count:
+        return None  # Bozuk/yarım indeks
+    
+    strings = None
+    if with_strings:
+        decode = LAYOUTS[layout_name].decode
+        strings = []
+        cursor = 0
+        for start, end in zip(starts, ends):
+            strings.append(decode(blob[cursor:cursor + end - start]))
+            cursor += end - start
+        if cursor != len(blob):
+            return None
+    
+    # LRU için son kullanım zamanını güncelle
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return starts, ends, layout_name, strings
+
+
+def write_index_cache(file_path, data, positions, layout_name=HeuristicLayout.name,
+                      cache_dir=INDEX_CACHE_DIR, max_bytes=None):
+    """Çıkarma sonucunu kompakt ikili indeks olarak önbelleğe yaz"""
+    os.makedirs(cache_dir, exist_ok=True)
+    cache_path = index_cache_path(file_path, cache_dir)
+    stat = os.stat(file_path)
+    
+    flat = array('Q', itertools.chain.from_iterable(positions))
+    if sys.byteorder == "big":
+        flat.byteswap()
+    
+    header = INDEX_CACHE_HEADER.pack(INDEX_CACHE_MAGIC, stat.st_size, stat.st_mtime_ns,
+                                     len(positions), content_digest(data),
+                                     layout_name.encode("ascii"))
+    
+    # Yarım yazılmış indeks bırakmamak için önce geçici dosyaya yaz; aynı
+    # dosyanın indeksini aynı anda yazan süreçler (klasör araması, CLI,
+    # editör) çakışmasın diye ad yazana özgüdür
+    temp_path = f"{cache_path}.{os.getpid()}_{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(header)
+            f.write(flat.tobytes())
+            # Ham string baytları (düzenden bağımsız)
+            for start, end in positions:
+                f.write(data[start:end])
+        os.replace(temp_path, cache_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+    
+    if max_bytes:
+        evict_index_cache(cache_dir, max_bytes)
+    return cache_path
+
+
+def evict_index_cache(cache_dir, max_bytes):
+    """Toplam boyut sınırı aşılırsa en uzun süredir kullanılmayan indeksleri sil"""
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(".hdidx"):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+def clear_index_cache(cache_dir=INDEX_CACHE_DIR):
+    """Önbellek klasörünü boşalt; silinen dosya sayısı ve boyutunu döndür"""
+    count = 0
+    freed = 0
+    if not os.path.isdir(cache_dir):
+        return count, freed
+    
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and (entry.name.endswith(".hdidx") or entry.name.endswith(".tmp")):
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                count += 1
+                freed += size
+            except OSError:
+                pass
+    return count, freed
+
+
+_PRINTABLE_BYTES = bytes(range(32, 127))
+_NON_PRINTABLE_RE = re.compile(rb'[^\x20-\x7e]')
+
+
+def _buffer_strings(engine, buf, base):
+    """Tampondaki dizileri dosya konumlarıyla üret"""
+    strings, positions = engine(buf)
+    for text, (start, end) in zip(strings, positions):
+        yield base + start, base + end, text
+
+
+def iter_strings_chunked(file_path, chunk_size=8 * 1024 * 1024, engine=None):
+    """Dosyayı sabit boyutlu parçalarla okuyup (başlangıç, bitiş, metin) üret
+    
+    Parça sınırını aşan dizinin parçaları, dizi bitene kadar bir listede
+    biriktirilir ve bir kez birleştirilir; böylece sonuç tüm dosyanın tek
+    seferde taranmasıyla aynıdır, bellek kullanımı ise parça boyutu ve en
+    uzun dizi ile sınırlı kalır. Dizi sınırları C seviyesinde bulunur.
+    """
+    engine = engine or extract_strings_regex
+    offset = 0  # okunan parçanın dosyadaki konumu
+    run = []  # henüz bitmemiş dizinin önceki parçalardaki kısımları
+    run_start = 0
+    
+    with open(file_path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            body = 0  # parçada açık diziden sonra gelen ilk konum
+            
+            if run:
+                found = _NON_PRINTABLE_RE.search(chunk)
+                if found is None and chunk:
+                    run.append(chunk)  # dizi bu parçayı da tamamen kaplıyor
+                    offset += len(chunk)
+                    continue
+                body = found.start() if found else 0
+                run.append(chunk[:body])
+                yield from _buffer_strings(engine, b"".join(run), run_start)
+                run = []
+            
+            if not chunk:
+                break
+            
+            # Son yazdırılamayan bayta kadar olan diziler kesinleşmiştir
+            cut = len(chunk.rstrip(_PRINTABLE_BYTES))
+            if body < cut:
+                yield from _buffer_strings(engine, chunk[body:cut], offset + body)
+            if cut < len(chunk):
+                run = [chunk[cut:]]
+                run_start = offset + cut
+            offset += len(chunk)
+
+
+class LengthStats:
+    """String uzunluklarının artımlı özeti (histogram + toplamlar)
+    
+    Her düzenleme eski uzunluğu çıkarıp yenisini ekler; toplam, ortalama
+    O(1), en kısa/en uzun yalnızca uç kova boşaldığında histogramdan
+    yeniden bulunur. Yüzdelikler ve dağılım aynı histogramdan hesaplanır.
+    """
+    
+    def __init__(self, lengths=()):
+        self.histogram = Counter(lengths)
+        self.count = sum(self.histogram.values())
+        self.total_chars = sum(length * n for length, n in self.histogram.items())
+        self._min = min(self.histogram) if self.histogram else None
+        self._max = max(self.histogram) if self.histogram else None
+    
+    def add(self, length):
+        self.histogram[length] += 1
+        self.count += 1
+        self.total_chars += length
+        if self._min is None or length < self._min:
+            self._min = length
+        if self._max is None or length > self._max:
+            self._max = length
+    
+    def remove(self, length):
+        remaining = self.histogram[length] - 1
+        if remaining:
+            self.histogram[length] = remaining
+        else:
+            del self.histogram[length]
+            # Uç kova boşaldıysa sınırı yeniden bul
+            if length == self._min:
+                self._min = min(self.histogram) if self.histogram else None
+            if length == self._max:
+                self._max = max(self.histogram) if self.histogram else None
+        self.count -= 1
+        self.total_chars -= length
+    
+    def replace(self, old_length, new_length):
+        if old_length != new_length:
+            self.remove(old_length)
+            self.add(new_length)
+    
+    @property
+    def min_length(self):
+        return self._min or 0
+    
+    @property
+    def max_length(self):
+        return self._max or 0
+    
+    @property
+    def mean(self):
+        return self.total_chars / self.count if self.count else 0
+    
+    def percentiles(self, points=(10, 25, 50, 75, 90, 99)):
+        """{yüzde: uzunluk} - sıralı kovalar üzerinde tek geçiş"""
+        result = {}
+        if not self.count:
+            return result
+        targets = sorted(points)
+        seen = 0
+        for length in sorted(self.histogram):
+            seen += self.histogram[length]
+            while targets and seen * 100 >= targets[0] * self.count:
+                result[targets.pop(0)] = length
+            if not targets:
+                break
+        return result
+    
+    def buckets(self):
+        """Uzunlukları 2'nin kuvveti aralıklarında grupla: [(alt, üst, adet)]"""
+        groups = Counter()
+        for length, n in self.histogram.items():
+            groups[length.bit_length()] += n
+        return [(0 if bits == 0 else 1 << (bits - 1), (1 << bits) - 1, groups[bits])
+                for bits in sorted(groups)]
+
+
+class _StringView(Sequence):
+    """String tablosunun salt okunur liste görünümü"""
+    
+    def __init__(self, table, getter):
+        self._table = table
+        self._getter = getter
+    
+    def __len__(self):
+        return len(self._table)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._getter(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._getter(index)
+    
+    def __iter__(self):
+        getter = self._getter
+        return (getter(i) for i in range(len(self._table)))
+
+
+class _PositionView(_StringView):
+    """(başlangıç, bitiş) konumlarının liste görünümü"""
+    
+    def __init__(self, table):
+        super().__init__(table, lambda i: (table.starts[i], table.ends[i]))
+    
+    def __iter__(self):
+        return zip(self._table.starts, self._table.ends)
+
+
+class StringTable:
+    """Dosya tamponu üzerinde kompakt string tablosu
+    
+    Konumlar array('Q') dizilerinde tutulur, orijinal metinler istendiğinde
+    tampondan dilimlenir; düzenlenen stringler yalnızca seyrek bir katmanda
+    (edits) saklanır. original/current/positions liste gibi kullanılabilir.
+    """
+    
+    def __init__(self, data=None, starts=None, ends=None, layout=None):
+        self.data = data
+        self.starts = starts if starts is not None else array('Q')
+        self.ends = ends if ends is not None else array('Q')
+        self.layout = layout or LAYOUTS[HeuristicLayout.name]
+        self.edits = {}  # indeks -> güncel metin (yalnızca değişenler)
+        self._stats = None  # LengthStats - ilk istendiğinde bir kez hesaplanır
+        self.listeners = []  # set() sonrası listener(indeks) çağrılır (arama indeksi vb.)
+        self.version = 0  # her set() çağrısında artar (önceki arama sonuçları hâlâ geçerli mi?)
+        
+        self.original = _StringView(self, self.original_at)
+        self.current = _StringView(self, self.get)
+        self.positions = _PositionView(self)
+    
+    @classmethod
+    def from_positions(cls, data, positions, layout=None):
+        """(başlangıç, bitiş) listesinden tablo oluştur"""
+        starts = array('Q', [start for start, _ in positions])
+        ends = array('Q', [end for _, end in positions])
+        return cls(data, starts, ends, layout)
+    
+    def __len__(self):
+        return len(self.starts)
+    
+    def original_at(self, index):
+        """Orijinal stringi dosya tamponundan çöz"""
+        return self.layout.decode(self.data[self.starts[index]:self.ends[index]])
+    
+    def get(self, index):
+        """Güncel (düzenlenmişse yeni) stringi döndür"""
+        text = self.edits.get(index)
+        return self.original_at(index) if text is None else text
+    
+    def set(self, index, text):
+        """Stringi güncelle; orijinaline dönen stringler katmandan çıkarılır"""
+        original = self.original_at(index)
+        if self._stats is not None:
+            self._stats.replace(len(self.edits.get(index, original)), len(text))
+        if text == original:
+            self.edits.pop(index, None)
+        else:
+            self.edits[index] = text
+        self.version += 1
+        for listener in self.listeners:
+            listener(index)
+    
+    @property
+    def stats(self):
+        """Güncel stringlerin uzunluk özeti (sonrasında set() ile güncel tutulur)"""
+        if self._stats is None:
+            if self.layout.byte_lengths:
+                # Çözmeden: orijinal uzunluklar konum farklarından gelir
+                lengths = map(operator.sub, self.ends, self.starts)
+            else:
+                lengths = (len(self.original_at(i)) for i in range(len(self)))
+            stats = LengthStats(lengths)
+            for index, text in self.edits.items():
+                stats.replace(len(self.original_at(index)), len(text))
+            self._stats = stats
+        return self._stats
+    
+    def is_modified(self, index):
+        return index in self.edits
+    
+    def modified_indices(self):
+        return sorted(self.edits)
+    
+    def sync(self, lines):
+        """Satır listesini tabloya uygula (eksik satırlar boş, fazlası yok sayılır)"""
+        changed = 0
+        for index in range(len(self)):
+            text = lines[index] if index < len(lines) else ""
+            if text != self.get(index):
+                self.set(index, text)
+                changed += 1
+        return changed
+    
+    def snapshot(self):
+        """Arka plan işleri için düzenlemelerin sabit bir kopyası"""
+        table = StringTable(self.data, self.starts, self.ends, self.layout)
+        table.edits = dict(self.edits)
+        return table
+
+
+# Trigram arama indeksi
+NGRAM_SIZE = 3
+NGRAM_CHUNK = 262144  # indeks oluştururken bir seferde işlenen string sayısı
+_EMPTY_POSTINGS = array('I')
+
+
+def _sorted_contains(postings, value):
+    """Sıralı array içinde ikili arama ile üyelik testi"""
+    i = bisect_left(postings, value)
+    return i < len(postings) and postings[i] == value
+
+
+def _ngrams(text):
+    """Küçük harfe çevrilmiş metnin UTF-8 bayt trigramları"""
+    data = text.lower().encode("utf-8")
+    return {data[i:i + NGRAM_SIZE] for i in range(len(data) - NGRAM_SIZE + 1)}
+
+
+class NgramIndex:
+    """String tablosu üzerinde trigram indeksi (aday bul, sonra doğrula)
+    
+    Orijinal stringlerin her trigramı için geçtiği string indeksleri sıralı
+    array('I') listelerinde tutulur. Düzenlenen stringler tabloya bağlı
+    dinleyici ile kirli olarak işaretlenir ve ilk sorguda trigramları ek
+    (extra) kümelere eklenir; eski kayıtlar silinmez, adaylar her zaman
+    güncel metinle doğrulandığı için yanlış pozitifler sonuçlara girmez.
+    Trigramdan kısa sorgular için indeks kullanılmaz (None döner).
+    """
+    
+    def __init__(self, table):
+        self.table = table
+        self.postings = {}  # trigram baytları -> array('I') string indeksleri
+        self.extra = {}  # trigram -> düzenlenmiş string indeksleri kümesi
+        self.dirty = set(table.edits)
+        self.ready = False
+        table.listeners.append(self.dirty.add)
+    
+    def detach(self):
+        """Tablo dinleyicisini kaldır (indeks artık kullanılmayacak)"""
+        if self.dirty.add in self.table.listeners:
+            self.table.listeners.remove(self.dirty.add)
+    
+    def build(self, check=None):
+        """Orijinal stringlerden indeksi oluştur (arka plan iş parçacığında çalışabilir)"""
+        count = len(self.table)
+        for first in range(0, count, NGRAM_CHUNK):
+            if check:
+                check()
+            last = min(first + NGRAM_CHUNK, count)
+            if HAS_NUMPY:
+                self._add_chunk_numpy(first, last)
+            else:
+                self._add_chunk_python(first, last, check)
+        self.ready = True
+        return self
+    
+    def _append(self, gram, values):
+        postings = self.postings.get(gram)
+        if postings is None:
+            postings = self.postings[gram] = array('I')
+        postings.extend(values)
+    
+    def _add_chunk_python(self, first, last, check=None):
+        original_at = self.table.original_at
+        for index in range(first, last):
+            if check and index % 20000 == 0:
+                check()
+            for gram in _ngrams(original_at(index)):
+                self._append(gram, (index,))
+    
+    def _add_chunk_numpy(self, first, last):
+        """Vektörel oluşturma: (trigram kodu, satır) çiftleri sıralanıp tekilleştirilir"""
+        import numpy as np
+        original_at = self.table.original_at
+        corpus = "\n".join(original_at(i) for i in range(first, last)).lower().encode("utf-8")
+        buf = np.frombuffer(corpus, dtype=np.uint8)
+        if len(buf) < NGRAM_SIZE:
+            return
+        
+        # Her baytın ait olduğu satır (string) numarası
+        newline = buf == 10
+        lines = np.cumsum(newline, dtype=np.uint32) + np.uint32(first)
+        a, b, c = buf[:-2], buf[1:-1], buf[2:]
+        valid = ~(newline[:-2] | newline[1:-1] | newline[2:])
+        shift = np.uint64(32)
+        codes = (a.astype(np.uint64) << np.uint64(16)) | (b.astype(np.uint64) << np.uint64(8)) | c
+        keys = np.sort((codes[valid] << shift) | lines[:-2][valid])
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]  # tekrarları at
+        
+        gram_codes = keys >> shift
+        rows = (keys & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+        bounds = np.flatnonzero(np.diff(gram_codes)) + 1
+        for code, part in zip(gram_codes[np.concatenate(([0], bounds))].tolist(), np.split(rows, bounds)):
+            self._append(code.to_bytes(3, "big"), array('I', part.tobytes()))
+    
+    def refresh(self):
+        """Kirli (düzenlenmiş) stringlerin güncel trigramlarını ekle"""
+        while self.dirty:
+            index = self.dirty.pop()
+            if index < len(self.table):
+                for gram in _ngrams(self.table.get(index)):
+                    self.extra.setdefault(gram, set()).add(index)
+    
+    def candidates(self, query, verify_below=32):
+        """Sorguyu içerebilecek string indeksleri (sıralı) veya None"""
+        grams = _ngrams(query)
+        if not self.ready or not grams:
+            return None
+        self.refresh()
+        
+        # En seyrek trigramdan başla; küme küçülünce doğrulamak daha ucuz
+        lists = sorted(((self.postings.get(gram, _EMPTY_POSTINGS), self.extra.get(gram, ()))
+                        for gram in grams), key=lambda pair: len(pair[0]) + len(pair[1]))
+        postings, extra = lists[0]
+        result = set(postings)
+        result.update(extra)
+        for postings, extra in lists[1:]:
+            if len(result) <= verify_below:
+                break
+            result = {i for i in result if i in extra or _sorted_contains(postings, i)}
+        return sorted(result)
+    
+    def similar(self, query, top_k=20, exclude=None, max_postings=None, pool=200):
+        """Sorguya en benzer stringler: [(benzerlik, indeks, metin)]
+        
+        Adaylar ortak trigram sayısıyla (postings üzerinde C seviyesinde
+        sayım) seçilir; çok yaygın trigramlar atlanır. En iyi adaylar
+        SequenceMatcher oranıyla yeniden sıralanır.
+        """
+        grams = _ngrams(query)
+        if not self.ready or not grams:
+            return None
+        self.refresh()
+        
+        limit = max_postings or max(1000, len(self.table) // 20)
+        lists = [(self.postings.get(gram, _EMPTY_POSTINGS), self.extra.get(gram, ())) for gram in grams]
+        rare = [pair for pair in lists if len(pair[0]) <= limit] or \
+            sorted(lists, key=lambda pair: len(pair[0]))[:3]  # hepsi yaygınsa en seyrekleri
+        
+        counts = Counter()
+        for postings, extra in rare:
+            counts.update(postings)
+            counts.update(extra)
+        if exclude is not None:
+            counts.pop(exclude, None)
+        
+        candidates = [index for index, _ in heapq.nlargest(pool, counts.items(), key=operator.itemgetter(1))]
+        return rank_similar(query, ((index, self.table.get(index)) for index in candidates), top_k)
+
+
+def similarity(a, b):
+    """İki metnin büyük/küçük harf duyarsız benzerliği (0..1)"""
+    return difflib.SequenceMatcher(None, a.lower(), b.lower(), autojunk=False).ratio()
+
+
+def rank_similar(query, items, top_k=20, min_score=0.3):
+    """(indeks, metin) çiftlerini benzerliğe göre sırala: [(benzerlik, indeks, metin)]"""
+    query_lower = query.lower()
+    scored = []
+    for index, text in items:
+        matcher = difflib.SequenceMatcher(None, query_lower, text.lower(), autojunk=False)
+        # Ucuz üst sınırlar tutmuyorsa tam oranı hesaplamaya gerek yok
+        if matcher.real_quick_ratio() < min_score or matcher.quick_ratio() < min_score:
+            continue
+        score = matcher.ratio()
+        if score >= min_score:
+            scored.append((score, index, text))
+    return heapq.nlargest(top_k, scored, key=operator.itemgetter(0))
+
+
+# Dosya yükleme - editör ve komut satırı aynı yolu kullanır
+PARALLEL_MIN_SIZE = 32 * 1024 * 1024  # paralel tarama için en küçük dosya boyutu
+
+
+def map_file(file_path, use_mmap=True):
+    """Dosyayı salt okunur bellek eşlemesiyle aç (kopya oluşturmadan)"""
+    if use_mmap:
+        try:
+            with open(file_path, "rb") as f:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            pass  # Boş dosya veya eşleme desteklenmiyor - normal okumaya dön
+    
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
+def table_options(settings):
+    """Editör ayarlarından build_string_table seçenekleri"""
+    return {
+        "use_cache": settings.get("index_cache", True),
+        "format_mode": settings.get("format_mode", "auto"),
+        "engine_name": settings.get("extract_engine", "auto"),
+        "max_bytes": settings.get("cache_max_mb", 512) * 1024 * 1024,
+        "workers": settings.get("extract_workers", 1) or os.cpu_count() or 1,
+        "parallel_min_size": settings.get("parallel_min_mb", 32) * 1024 * 1024,
+    }
+
+
+def modified_path(file_path):
+    """Kaydedilen dosyanın varsayılan yolu (oyun.hdlang -> oyun_modified.hdlang)"""
+    return file_path.replace(".hdlang", "_modified.hdlang")
+
+
+def scan_string_table(data, file_path=None, engine_name="auto", workers=1,
+                      parallel_min_size=PARALLEL_MIN_SIZE):
+    """Sezgisel tarama ile tablo kur (büyük dosyalarda isteğe bağlı çok çekirdekli)"""
+    if file_path and workers > 1 and len(data) >= parallel_min_size:
+        try:
+            _, positions = extract_strings_parallel(data, file_path, workers, engine_name)
+            return StringTable.from_positions(data, positions)
+        except Exception:
+            pass  # Süreç havuzu kurulamadı - seri taramaya dön
+    
+    _, positions = get_extract_engine(engine_name)(data)
+    return StringTable.from_positions(data, positions)
+
+
+def build_string_table(file_path, data, use_cache=True, format_mode="auto", engine_name="auto",
+                       cache_dir=INDEX_CACHE_DIR, max_bytes=None, workers=1,
+                       parallel_min_size=PARALLEL_MIN_SIZE, scan=None):
+    """Dosya için string tablosunu kur: önbellek -> yapısal tablo -> sezgisel tarama
+    
+    (tablo, önbellekten mi) döndürür; önbellek dışından kurulan tablolar
+    sonraki açılışlar için önbelleğe yazılır. scan(data) verilirse
+    sezgisel tarama onunla yapılır (editörün akışlı taraması gibi).
+    """
+    if use_cache:
+        cached = read_index_cache(file_path, data, cache_dir)
+        if cached is not None:
+            starts, ends, layout_name, _ = cached
+            # Eski sürümlerin önbelleğe yazdığı küçük başlık tabloları atlanır
+            if layout_name == HeuristicLayout.name or (format_mode != "heuristic"
+                                                       and covers_file(len(data), starts, ends)):
+                return StringTable(data, starts, ends, LAYOUTS[layout_name]), True
+    
+    found = read_string_table(data) if format_mode != "heuristic" else None
+    if found is not None:
+        layout, starts, ends = found
+        table = StringTable(data, starts, ends, layout)
+    elif scan is not None:
+        table = scan(data)
+    else:
+        table = scan_string_table(data, file_path, engine_name, workers, parallel_min_size)
+    
+    if use_cache:
+        try:
+            write_index_cache(file_path, data, table.positions, table.layout.name,
+                              cache_dir, max_bytes)
+        except OSError:
+            pass  # Önbellek isteğe bağlıdır
+    return table, False
+
+
+# Klasörde arama
+FOLDER_SEARCH_MATCH_LIMIT = 1000  # dosya başına gösterilen en fazla eşleşen string
+
+
+def find_hdlang_files(folder):
+    """Klasör ve alt klasörlerdeki .hdlang dosyaları (sıralı)"""
+    found = []
+    for root, _, files in os.walk(folder):
+        found.extend(os.path.join(root, name) for name in files
+                     if name.lower().endswith(".hdlang"))
+    return sorted(found)
+
+
+def search_file(task):
+    """Süreç havuzu işçisi: bir dosyada ara
+    
+    (yol, string sayısı, eşleşme sayısı, [(indeks, metin)]) döndürür.
+    Dosya her işçide yeniden eşlenir; geçerli indeks önbelleği varsa
+    çıkarma yapılmaz.
+    """
+    file_path, keyword, options = task
+    with open(file_path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # boş dosya eşlenemez
+            data = f.read()
+    
+    try:
+        table, _ = build_string_table(file_path, data, **options)
+        results = search_lines(table, range(1, len(table) + 1), keyword)
+        lines = sorted({line_num for line_num, _, _ in results})
+        matches = [(line_num - 1, table.get(line_num - 1))
+                   for line_num in lines[:FOLDER_SEARCH_MATCH_LIMIT]]
+        return file_path, len(table), len(results), matches
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+
+# Bul / değiştir motoru
+@functools.lru_cache(maxsize=64)
+def compile_pattern(text, regex=False, ignore_case=True):
+    """Arama desenini derle (sonuçlar önbellekte tutulur)"""
+    flags = re.IGNORECASE if ignore_case else 0
+    return re.compile(text if regex else re.escape(text), flags)
+
+
+def plan_replacements(table, pattern, replacement, indices=None, literal=True):
+    """Değişiklikleri tek geçişte hesapla, tabloya dokunmadan
+    
+    [(indeks, önce, sonra, adet)] ve toplam değişiklik sayısını döndürür.
+    Düz metin modunda yeni metindeki ters bölü/grup başvuruları yorumlanmaz.
+    Geçersiz şablon (ör. grubu olmayan desende \\1) re.error verir.
+    """
+    if literal:
+        replacement = replacement.replace("\\", "\\\\")
+    try:
+        pattern.sub(replacement, "")  # şablon eşleşme olmasa da burada derlenir
+    except IndexError as e:  # Python < 3.12 bilinmeyen grup adında IndexError verir
+        raise re.error(str(e)) from e
+    indices = range(len(table)) if indices is None else indices
+    get = table.get
+    subn = pattern.subn
+    changes = []
+    total = 0
+    for index in indices:
+        before = get(index)
+        after, count = subn(replacement, before)
+        if count and after != before:
+            changes.append((index, before, after, count))
+            total += count
+    return changes, total
+
+
+def apply_replacements(table, changes):
+    """plan_replacements sonucunu tabloya uygula"""
+    for index, _, after, _ in changes:
+        table.set(index, after)
+
+
+def search_lines(table, lines, keyword, on_batch=None, check=None, batch_lines=5000):
+    """Verilen satırlarda büyük/küçük harf duyarsız ara
+    
+    (satır no, konum, uzunluk) listesi döndürür. on_batch verilirse her
+    batch_lines satırda o ana kadar bulunan yeni sonuçlarla
+    on_batch(sonuçlar, taranan satır) çağrılır; check iptal denetimi içindir.
+    """
+    keyword_lower = keyword.lower()
+    length = len(keyword)
+    get = table.get
+    results = []
+    sent = 0
+    done = 0
+    for done, line_num in enumerate(lines, 1):
+        text = get(line_num - 1).lower()
+        pos = text.find(keyword_lower)
+        while pos != -1:
+            results.append((line_num, pos, length))
+            pos = text.find(keyword_lower, pos + 1)
+        
+        if done % batch_lines == 0:
+            if check:
+                check()
+            if on_batch and len(results) > sent:
+                on_batch(results[sent:], done)
+                sent = len(results)
+    
+    if on_batch and len(results) > sent:
+        on_batch(results[sent:], done)
+    return results
+
+
+# Fark (delta) tabanlı kaydetme
+def iter_save_segments(table, dynamic=True):
+    """Kaydedilecek dosyayı oluşturan parçaları sırayla üret
+    
+    Yalnızca değişen stringler yeniden kodlanır; aradaki değişmemiş bölümler
+    orijinal tampondan kopyasız memoryview dilimleri olarak gelir.
+    """
+    layout = table.layout
+    view = memoryview(table.data)  # dilimler yazıldıkça serbest kalır
+    last_end = 0
+    for index in table.modified_indices():
+        span_start, span_end, encoded = layout.replacement(
+            table.starts[index], table.ends[index], table.edits[index], dynamic)
+        if span_start > last_end:
+            yield view[last_end:span_start]
+        yield encoded
+        last_end = span_end
+    
+    if last_end < len(view):
+        yield view[last_end:]
+
+
+def _pwrite(f, data, offset):
+    """Dosyada verilen konuma yaz (pwrite yoksa seek + write)"""
+    if hasattr(os, "pwrite"):
+        os.pwrite(f.fileno(), data, offset)
+    else:
+        f.seek(offset)
+        f.write(data)
+
+
+try:
+    _IOV_MAX = min(os.sysconf("SC_IOV_MAX"), 1024)
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+
+def _write_all(fd, buffers):
+    """Tamponları vektörel yazımla (writev) eksiksiz dosyaya aktar"""
+    index = 0
+    while index < len(buffers):
+        batch = buffers[index:index + _IOV_MAX]
+        if hasattr(os, "writev"):
+            written = os.writev(fd, batch)
+        else:
+            written = os.write(fd, batch[0])
+        
+        for buf in batch:
+            if written < len(buf):
+                break
+            written -= len(buf)
+            index += 1
+        
+        if written:
+            # Kısmi yazım: tamponun kalanını tekrar dene
+            buffers[index] = memoryview(buffers[index])[written:]
+
+
+def _default_file_mode():
+    """Yeni dosyalar için umask'e göre varsayılan izinler"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+@contextlib.contextmanager
+def atomic_replace(save_path):
+    """Aynı klasördeki geçici dosyaya yazdır, başarılıysa hedefin yerine koy
+    
+    Yazma yarıda kesilirse (hata, iptal, çökme) hedef dosyaya hiç
+    dokunulmamış olur; geçici dosya silinir.
+    """
+    directory = os.path.dirname(os.path.abspath(save_path))
+    fd, temp_path = tempfile.mkstemp(prefix=".hdlang_", suffix=".tmp", dir=directory)
+    os.close(fd)
+    try:
+        yield temp_path
+        
+        # mkstemp 0600 ile oluşturur - mevcut dosyanın izinlerini koru
+        if os.path.exists(save_path):
+            shutil.copymode(save_path, temp_path)
+        else:
+            os.chmod(temp_path, _default_file_mode())
+        os.replace(temp_path, save_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_segments(path, segments, progress=None, total=None, batch_size=256):
+    """Parçaları biriktirip writev ile dosyaya akıt, yazılan boyutu döndür
+    
+    Bellekte en fazla batch_size parça tutulur; memoryview parçaları
+    orijinal tamponu gösterdiği için kopya oluşmaz.
+    """
+    written = 0
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0))
+    try:
+        pending = []
+        for segment in segments:
+            if not len(segment):
+                continue
+            pending.append(segment)
+            written += len(segment)
+            if len(pending) >= batch_size:
+                _write_all(fd, pending)
+                pending = []
+                if progress:
+                    progress(written, total)
+        
+        _write_all(fd, pending)
+        del pending
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    
+    if progress:
+        progress(written, total)
+    return written
+
+
+def save_string_table(table, save_path, dynamic=True, source_path=None, progress=None):
+    """String tablosunu değişiklikleriyle birlikte kaydet, yazılan boyutu döndür
+    
+    Çıktı önce geçici dosyaya yazılır ve ancak tamamlanınca hedefin yerine
+    konur. Dinamik modda dosya parçalar halinde writev ile akıtılır; bellek
+    kullanımı dosya boyutundan bağımsızdır. Sabit boyut modunda source_path
+    verilirse dosya çekirdek düzeyinde kopyalanır ve yalnızca değişen
+    kayıtlar yerinde yamalanır. progress(yazılan, toplam) ilerleme içindir.
+    """
+    total = len(table.data)
+    
+    if dynamic:
+        with atomic_replace(save_path) as temp_path:
+            return write_segments(temp_path, iter_save_segments(table, dynamic=True),
+                                  progress, total)
+    
+    # Sabit boyut: önce tüm kayıtları doğrula (taşan varsa dosyaya dokunma)
+    patches = [table.layout.replacement(table.starts[index], table.ends[index],
+                                        table.edits[index], dynamic=False)
+               for index in table.modified_indices()]
+    
+    with atomic_replace(save_path) as temp_path:
+        if source_path:
+            shutil.copyfile(source_path, temp_path)
+        else:
+            write_segments(temp_path, [memoryview(table.data)])
+        
+        with open(temp_path, "r+b") as f:
+            for done, (span_start, _, encoded) in enumerate(patches, 1):
+                _pwrite(f, encoded, span_start)
+                if progress:
+                    progress(done, len(patches))
+            f.flush()
+            os.fsync(f.fileno())
+    return total
+
+
+# İçerik adresli yedek deposu
+BACKUP_DIR = 'hdlang_backups'
+CHUNK_MIN_SIZE = 2 * 1024
+CHUNK_MAX_SIZE = 64 * 1024
+CHUNK_BLOCK_SIZE = 4 * 1024 * 1024  # kayan özeti bir seferde hesaplanan blok
+CHUNK_WINDOW = 8  # kayan özetin baktığı bayt sayısı
+BACKUP_FULL_EVERY = 10  # fark yedeklerinde her N yedekte bir tam yedek
+BACKUP_INDEX_VERSION = 2  # şema değişince indeks diskten yeniden kurulur
+
+# Yedek indeksi: listeleme, süzme ve saklama kuralları manifest okumadan
+# buradan yapılır; parça sayaçları gc'yi klasör taramasından kurtarır
+BACKUP_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS backups (
+    path TEXT PRIMARY KEY,  -- depo köküne göre manifest (ya da eski .backup) yolu
+    name TEXT, source TEXT, created TEXT, size INTEGER, digest TEXT,
+    kind TEXT, base TEXT, stored INTEGER
+);
+CREATE INDEX IF NOT EXISTS backups_created ON backups (created);
+CREATE INDEX IF NOT EXISTS backups_source ON backups (source, created);
+CREATE INDEX IF NOT EXISTS backups_base ON backups (base);
+CREATE TABLE IF NOT EXISTS chunks (digest TEXT PRIMARY KEY, stored INTEGER, refs INTEGER);
+CREATE TABLE IF NOT EXISTS backup_chunks (path TEXT, digest TEXT, UNIQUE (path, digest));
+"""
+
+# Her konum, ardından gelen CHUNK_WINDOW baytın 8 bitlik kayan özetine
+# eşlenir. Sınır, özeti 0 olan konumu özeti 16'dan küçük bir konum
+# izlediğinde konur (olasılık 2^-12; en küçük boyutla birlikte ortalama
+# ~6 KB, tekdüze metinde daha büyük parçalar). Sınır yalnızca yerel
+# içeriğe bağlı olduğundan araya bayt eklenince sonraki parçalar kaymaz.
+_CHUNK_TABLES = [bytes(hashlib.blake2b(bytes([shift, value]), digest_size=1).digest()[0]
+                       for value in range(256))
+                 for shift in range(CHUNK_WINDOW)]
+_CHUNK_BOUNDARY = re.compile(rb"\x00[\x00-\x0f]")
+
+
+def rolling_hashes(block):
+    """block[i:i + CHUNK_WINDOW] penceresinin 8 bitlik özeti, her i için
+    
+    Özet, pencere baytlarının konuma özgü tablolarla çevrilmiş hâllerinin
+    XOR'udur; kaydırılmış kopyalar büyük tamsayı olarak XOR'lanır, böylece
+    bayt başına Python döngüsü çalışmaz.
+    """
+    count = len(block) - CHUNK_WINDOW + 1
+    if count <= 0:
+        return b""
+    mixed = 0
+    for shift, table in enumerate(_CHUNK_TABLES):
+        mixed ^= int.from_bytes(block[shift:shift + count].translate(table), "big")
+    return mixed.to_bytes(count, "big")
+
+
+def chunk_boundaries(data, min_size=CHUNK_MIN_SIZE, max_size=CHUNK_MAX_SIZE,
+                     block_size=CHUNK_BLOCK_SIZE):
+    """İçerik tanımlı parça sınırları: (başlangıç, bitiş) üret
+    
+    Kayan özet (rolling_hashes) ve sınır arama (derlenmiş desen) C
+    seviyesinde yapılır; büyük dosyalar blok blok işlenir.
+    """
+    size = len(data)
+    width = 2  # sınır deseni iki özet uzunluğunda
+    block_size = max(block_size, 2 * max_size)
+    hashes = b""
+    hashes_base = hashes_end = 0  # hashes[i], data[hashes_base + i:] penceresinin özeti
+    start = 0
+    while start < size:
+        low = max(start + min_size - width, 0)  # desen en erken burada başlayabilir
+        high = min(start + max_size, size)  # desen en geç burada biter
+        if low < hashes_base or (high > hashes_base + len(hashes) and hashes_end < size):
+            hashes_base = low
+            hashes_end = min(size, hashes_base + block_size)
+            hashes = rolling_hashes(bytes(data[hashes_base:hashes_end]))
+        
+        limit = min(high, hashes_base + len(hashes))
+        found = _CHUNK_BOUNDARY.search(hashes, low - hashes_base, limit - hashes_base) if low < limit else None
+        end = hashes_base + found.end() if found else high
+        yield start, end
+        start = end
+
+
+def chunk_digest(chunk):
+    return hashlib.blake2b(chunk, digest_size=20).hexdigest()
+
+
+def _lzma_compress(chunk, level):
+    import lzma  # yalnızca lzma seçilince yüklenir
+    return lzma.compress(chunk, preset=level)
+
+
+def _lzma_decompress(chunk):
+    import lzma
+    return lzma.decompress(chunk)
+
+
+# Parça sıkıştırma: ad -> (dosya uzantısı, sıkıştır(veri, seviye), aç(veri))
+BACKUP_CODECS = {
+    "none": ("", None, None),
+    "zlib": (".z", lambda chunk, level: zlib.compress(chunk, level), zlib.decompress),
+    "lzma": (".xz", _lzma_compress, _lzma_decompress),
+}
+
+
+class BackupStore:
+    """Tekilleştirilmiş yedek deposu: parçalar içerik özetiyle bir kez saklanır
+    
+    hdlang_backups/chunks/ab/<özet>  - parça içeriği
+    hdlang_backups/manifests/*.json  - yedek başına parça listesi ya da
+                                       son tam yedeğe karşı fark işlemleri
+    hdlang_backups/index.sqlite      - yedeklerin ve parça sayaçlarının indeksi
+    
+    Aynı dosyanın tekrar yedeklenmesi yalnızca yeni bir manifest, az
+    değişmiş bir dosya ise yalnızca değişen parçalar kadar yer tutar.
+    Parçalar seçilen codec ile sıkıştırılır (uzantı codec'i belirtir);
+    küçülmeyen parçalar sıkıştırılmadan saklanır.
+    """
+    
+    def __init__(self, root=BACKUP_DIR, compression="zlib", level=6):
+        if compression not in BACKUP_CODECS:
+            raise ValueError(f"Bilinmeyen sıkıştırma: {compression}")
+        self.root = root
+        self.compression = compression
+        self.level = level
+        self.chunk_dir = os.path.join(root, "chunks")
+        self.manifest_dir = os.path.join(root, "manifests")
+        self.index_path = os.path.join(root, "index.sqlite")
+    
+    def chunk_path(self, digest, suffix=""):
+        return os.path.join(self.chunk_dir, digest[:2], digest + suffix)
+    
+    def find_chunk(self, digest):
+        """Parçanın diskteki yolu ve codec'i; yoksa (None, None)"""
+        for name, (suffix, _, _) in BACKUP_CODECS.items():
+            path = self.chunk_path(digest, suffix)
+            if os.path.exists(path):
+                return path, name
+        return None, None
+    
+    def has_chunk(self, digest):
+        return self.find_chunk(digest)[0] is not None
+    
+    def put_chunk(self, digest, chunk):
+        """Parçayı yoksa (sıkıştırarak) yaz; diske yazılan bayt sayısını döndür"""
+        if self.has_chunk(digest):
+            return 0
+        suffix, compress, _ = BACKUP_CODECS[self.compression]
+        if compress is not None:
+            packed = compress(chunk, self.level)
+            if len(packed) < len(chunk):
+                chunk = packed
+            else:
+                suffix = ""
+        path = self.chunk_path(digest, suffix)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}_{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(chunk)
+        os.replace(temp_path, path)
+        return len(chunk)
+    
+    def get_chunk(self, digest):
+        path, codec = self.find_chunk(digest)
+        if path is None:
+            raise FileNotFoundError(f"Yedek parçası bulunamadı: {digest}")
+        with open(path, "rb") as f:
+            chunk = f.read()
+        decompress = BACKUP_CODECS[codec][2]
+        return decompress(chunk) if decompress is not None else chunk
+    
+    def backup_file(self, file_path, f=None, delta=False, full_every=BACKUP_FULL_EVERY):
+        """Dosyayı kendi eşlemesi üzerinden yedekle (arka plan işçileri için)
+        
+        f verilirse zaten açılmış dosya kullanılır; böylece işçi, açılış
+        anındaki sürümü yedekler.
+        """
+        with contextlib.ExitStack() as stack:
+            if f is None:
+                f = stack.enter_context(open(file_path, "rb"))
+            else:
+                stack.callback(f.close)
+            if os.fstat(f.fileno()).st_size:
+                data = stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            else:
+                data = b""
+            return self.backup(file_path, data, delta, full_every)
+    
+    @contextlib.contextmanager
+    def index(self):
+        """Manifest indeksine bağlantı (SQLite); blok sonunda işlem onaylanır
+        
+        Her iş parçacığı kendi bağlantısını açar. İndeks yoksa ya da eski
+        şemalıysa manifest klasöründen bir kez yeniden oluşturulur.
+        """
+        import sqlite3  # yalnızca yedekleme yapan süreçlerde yüklenir
+        
+        os.makedirs(self.root, exist_ok=True)
+        db = sqlite3.connect(self.index_path, timeout=30)
+        db.row_factory = sqlite3.Row
+        try:
+            if db.execute("PRAGMA user_version").fetchone()[0] != BACKUP_INDEX_VERSION:
+                with db:
+                    # Kilit alındıktan sonra tekrar bakılır: aynı anda açan
+                    # başka bir iş parçacığı indeksi kurmuş olabilir
+                    db.execute("BEGIN IMMEDIATE")
+                    if db.execute("PRAGMA user_version").fetchone()[0] != BACKUP_INDEX_VERSION:
+                        for table in ("backups", "chunks", "backup_chunks"):
+                            db.execute(f"DROP TABLE IF EXISTS {table}")
+                        for statement in BACKUP_INDEX_SCHEMA.split(";"):
+                            db.execute(statement)
+                        self.rebuild_index(db)
+                        db.execute(f"PRAGMA user_version = {BACKUP_INDEX_VERSION}")
+            with db:
+                yield db
+        finally:
+            db.close()
+    
+    def rebuild_index(self, db):
+        """İndeksi diskteki manifestlerden, parçalardan ve eski .backup dosyalarından kur"""
+        db.execute("DELETE FROM backups")
+        db.execute("DELETE FROM backup_chunks")
+        db.execute("DELETE FROM chunks")
+        
+        if os.path.isdir(self.chunk_dir):
+            for root, _, files in os.walk(self.chunk_dir):
+                for name in files:
+                    if not name.endswith(".tmp"):
+                        db.execute("INSERT OR IGNORE INTO chunks VALUES (?, ?, 0)",
+                                   (name.split(".", 1)[0], os.path.getsize(os.path.join(root, name))))
+        
+        if os.path.isdir(self.manifest_dir):
+            for name in os.listdir(self.manifest_dir):
+                if name.endswith(".json"):
+                    try:
+                        manifest = self.read_manifest(os.path.join(self.manifest_dir, name))
+                    except (OSError, ValueError):
+                        continue  # bozuk manifest indekslenmez
+                    self.index_manifest(db, manifest, 0)
+        
+        # Eski sürümlerin tam kopya yedekleri
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if name.endswith(".backup") and os.path.isfile(path):
+                created = datetime.datetime.fromtimestamp(os.path.getmtime(path))
+                size = os.path.getsize(path)
+                db.execute("INSERT OR REPLACE INTO backups VALUES (?, ?, NULL, ?, ?, NULL, 'legacy', NULL, ?)",
+                           (name, name.rsplit("_", 2)[0], created.isoformat(timespec="seconds"), size, size))
+    
+    def index_manifest(self, db, manifest, stored, chunk_sizes=None):
+        """Manifesti indekse ekle, kullandığı parçaların sayaçlarını artır
+        
+        Zaten indekslenmiş bir manifest için sayaçlar tekrar artırılmaz.
+        """
+        path = os.path.relpath(manifest["path"], self.root)
+        db.execute("INSERT OR REPLACE INTO backups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                   (path, manifest["name"], manifest["source"], manifest["created"], manifest["size"],
+                    manifest["digest"], manifest.get("kind", "full"), manifest.get("base"), stored))
+        chunk_sizes = chunk_sizes or {}
+        for digest in set(self.manifest_chunks(manifest)):
+            if db.execute("INSERT OR IGNORE INTO backup_chunks VALUES (?, ?)", (path, digest)).rowcount:
+                db.execute("INSERT INTO chunks VALUES (?, ?, 1) "
+                           "ON CONFLICT(digest) DO UPDATE SET refs = refs + 1",
+                           (digest, chunk_sizes.get(digest, 0)))
+    
+    def row_to_backup(self, row):
+        """İndeks satırı -> yedek sözlüğü (manifest yolu mutlak)"""
+        backup = dict(row)
+        backup["path"] = os.path.join(self.root, backup["path"])
+        return backup
+    
+    def latest_full(self, source):
+        """Kaynağın en son tam yedeği ve ona bağlı fark yedeği sayısı"""
+        with self.index() as db:
+            row = db.execute("SELECT path FROM backups WHERE source = ? AND kind = 'full' "
+                             "ORDER BY created DESC, path DESC LIMIT 1", (source,)).fetchone()
+            if row is None:
+                return None, 0
+            deltas = db.execute("SELECT COUNT(*) FROM backups WHERE base = ?",
+                                (os.path.basename(row["path"]),)).fetchone()[0]
+        try:
+            return self.read_manifest(os.path.join(self.root, row["path"])), deltas
+        except (OSError, ValueError):
+            return None, 0  # manifest silinmiş - yeni tam yedek alınır
+    
+    def backup(self, file_path, data, delta=False, full_every=BACKUP_FULL_EVERY):
+        """Dosyayı parçalayıp depola, (manifest, yeni bayt, diske yazılan bayt) döndür
+        
+        delta=True ise aynı kaynağın son tam yedeğine karşı bir fark yedeği
+        yazılır: ops listesinde [taban ofseti, uzunluk] tabandan kopyalama,
+        [özet, uzunluk] yeni parça ekleme demektir. Parça özetleri kayan
+        içerik tanımlı sınırlara bağlı olduğundan kaymış veri de tabanda
+        bulunur. Her full_every yedekte bir ya da dosyanın yarısından çoğu
+        değiştiyse yeniden tam yedek alınır; zincir en fazla taban + fark
+        olarak kalır.
+        """
+        source = os.path.abspath(file_path)
+        base, deltas = self.latest_full(source) if delta else (None, 0)
+        base_offsets = {}
+        if base is not None and deltas + 1 < full_every:
+            offset = 0
+            for digest, length in base["chunks"]:
+                base_offsets.setdefault(digest, offset)
+                offset += length
+        
+        file_hash = hashlib.blake2b(digest_size=20)
+        chunks = []
+        ops = []
+        chunk_sizes = {}  # yeni yazılan parçaların diskteki boyutu
+        spans = {}  # özet -> verideki konumu (gc'nin sildiği parça yeniden yazılır)
+        written = stored = inserted = 0
+        for start, end in chunk_boundaries(data):
+            chunk = data[start:end]
+            digest = chunk_digest(chunk)
+            file_hash.update(chunk)
+            length = end - start
+            chunks.append([digest, length])
+            spans.setdefault(digest, (start, end))
+            
+            base_offset = base_offsets.get(digest)
+            if base_offset is None:
+                size = self.put_chunk(digest, chunk)
+                if size:
+                    written += length
+                    stored += size
+                    chunk_sizes[digest] = size
+                inserted += length
+                ops.append([digest, length])
+            elif ops and isinstance(ops[-1][0], int) and sum(ops[-1]) == base_offset:
+                ops[-1][1] += length  # ardışık kopyalamalar birleşir
+            else:
+                ops.append([base_offset, length])
+        
+        now = datetime.datetime.now()
+        name = os.path.basename(file_path)
+        manifest = {
+            "version": 1,
+            "name": name,
+            "source": source,
+            "created": now.isoformat(timespec="seconds"),
+            "size": len(data),
+            "digest": file_hash.hexdigest(),
+            "compression": self.compression,
+        }
+        if base_offsets and inserted * 2 <= len(data):
+            manifest.update(kind="delta", base=os.path.basename(base["path"]), ops=ops)
+        else:
+            manifest.update(kind="full", chunks=chunks)
+        
+        os.makedirs(self.manifest_dir, exist_ok=True)
+        manifest_path = os.path.join(self.manifest_dir, f"{name}_{now.strftime('%Y%m%d_%H%M%S_%f')}.json")
+        # İndeks manifest yazılmadan açılır; ilk açılışta yeniden kurulan
+        # indeks bu manifesti henüz görmez
+        with self.index() as db:
+            # Yazma kilidi alınır, gc bu blokla çakışamaz. Parçalar kilitsiz
+            # yazıldığından bu arada başka bir işçinin prune + gc'si sayacı
+            # sıfır olan bir parçayı ya da tabanı silmiş olabilir: diskte
+            # bulunmayan parçalar yeniden yazılır, taban yoksa tam yedek alınır.
+            db.execute("BEGIN IMMEDIATE")
+            if manifest["kind"] == "delta" and db.execute(
+                    "SELECT 1 FROM backups WHERE path = ?",
+                    (os.path.relpath(base["path"], self.root),)).fetchone() is None:
+                del manifest["base"], manifest["ops"]
+                manifest.update(kind="full", chunks=chunks)
+            for digest in set(self.manifest_chunks(manifest)):
+                row = db.execute("SELECT refs FROM chunks WHERE digest = ?", (digest,)).fetchone()
+                if (row is None or row[0] <= 0) and not self.has_chunk(digest):
+                    start, end = spans[digest]
+                    size = self.put_chunk(digest, data[start:end])
+                    written += end - start
+                    stored += size
+                    chunk_sizes[digest] = size
+            
+            with open(manifest_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+            manifest["path"] = manifest_path
+            self.index_manifest(db, manifest, stored, chunk_sizes)
+        return manifest, written, stored
+    
+    def read_manifest(self, manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        manifest["path"] = manifest_path
+        return manifest
+    
+    def list_backups(self, source=None, offset=0, limit=-1):
+        """İndeksten yedekler (parça listesi olmadan), en yeni önce
+        
+        source verilirse yalnızca o kaynağın yedekleri; offset/limit ile
+        sayfa sayfa okunur.
+        """
+        query = "SELECT * FROM backups"
+        params = []
+        if source is not None:
+            query += " WHERE source = ?"
+            params.append(source)
+        query += " ORDER BY created DESC, path DESC LIMIT ? OFFSET ?"
+        with self.index() as db:
+            rows = db.execute(query, params + [limit, offset]).fetchall()
+        return [self.row_to_backup(row) for row in rows]
+    
+    def count_backups(self, source=None):
+        with self.index() as db:
+            if source is None:
+                return db.execute("SELECT COUNT(*) FROM backups").fetchone()[0]
+            return db.execute("SELECT COUNT(*) FROM backups WHERE source = ?", (source,)).fetchone()[0]
+    
+    def sources(self):
+        """Yedeği bulunan kaynak dosyalar"""
+        with self.index() as db:
+            return [row[0] for row in db.execute(
+                "SELECT DISTINCT source FROM backups WHERE source IS NOT NULL ORDER BY source")]
+    
+    def disk_usage(self):
+        """Yedeklerin kullandığı bayt (canlı parçalar + eski tam kopyalar)"""
+        with self.index() as db:
+            chunks = db.execute("SELECT COALESCE(SUM(stored), 0) FROM chunks WHERE refs > 0").fetchone()[0]
+            legacy = db.execute("SELECT COALESCE(SUM(stored), 0) FROM backups WHERE kind = 'legacy'").fetchone()[0]
+        return chunks + legacy
+    
+    def dependents(self, backup):
+        """Bu tam yedeği taban alan fark yedekleri"""
+        with self.index() as db:
+            rows = db.execute("SELECT * FROM backups WHERE base = ?",
+                              (os.path.basename(backup["path"]),)).fetchall()
+        return [self.row_to_backup(row) for row in rows]
+    
+    @staticmethod
+    def manifest_chunks(manifest):
+        """Manifestin doğrudan kullandığı parça özetleri"""
+        if manifest.get("kind", "full") == "full":
+            return [digest for digest, _ in manifest["chunks"]]
+        return [key for key, _ in manifest["ops"] if isinstance(key, str)]
+    
+    def load_chunk(self, digest, length):
+        """Parçayı oku ve özetini doğrula"""
+        chunk = self.get_chunk(digest)
+        if len(chunk) != length or chunk_digest(chunk) != digest:
+            raise ValueError(f"Bozuk yedek parçası: {digest}")
+        return chunk
+    
+    def iter_restore(self, manifest):
+        """Yedeğin içeriğini sırayla üret (fark yedeğinde taban + işlemler)"""
+        if manifest.get("kind", "full") == "full":
+            for digest, length in manifest["chunks"]:
+                yield self.load_chunk(digest, length)
+            return
+        
+        base_chunks = self.read_manifest(os.path.join(self.manifest_dir, manifest["base"]))["chunks"]
+        base_ends = list(itertools.accumulate(length for _, length in base_chunks))
+        for key, length in manifest["ops"]:
+            if isinstance(key, str):
+                yield self.load_chunk(key, length)
+                continue
+            
+            # Tabanın [key, key + length) aralığını kapsayan parçalar
+            position, end = key, key + length
+            index = bisect_right(base_ends, position)
+            while position < end:
+                digest, chunk_length = base_chunks[index]
+                chunk_start = base_ends[index] - chunk_length
+                chunk = self.load_chunk(digest, chunk_length)
+                yield chunk[position - chunk_start:end - chunk_start]
+                position = base_ends[index]
+                index += 1
+    
+    def restore(self, backup, dest_path):
+        """Yedeği dest_path'e geri yükle (atomik); yazılan boyutu döndür
+        
+        backup bir indeks satırı ya da okunmuş manifest olabilir.
+        """
+        if backup["kind"] == "legacy":
+            with atomic_replace(dest_path) as temp_path:
+                shutil.copyfile(backup["path"], temp_path)
+            return os.path.getsize(dest_path)
+        
+        manifest = backup if "chunks" in backup or "ops" in backup else self.read_manifest(backup["path"])
+        file_hash = hashlib.blake2b(digest_size=20)
+        
+        def segments():
+            for chunk in self.iter_restore(manifest):
+                file_hash.update(chunk)
+                yield chunk
+        
+        with atomic_replace(dest_path) as temp_path:
+            size = write_segments(temp_path, segments())
+            if size != manifest["size"] or file_hash.hexdigest() != manifest["digest"]:
+                raise ValueError("Geri yüklenen dosya yedekle eşleşmiyor")
+        return size
+    
+    def remove(self, backup):
+        """Yedeği sil; gc ile boşalacak bayt sayısını döndür"""
+        path = os.path.relpath(backup["path"], self.root)
+        with self.index() as db:
+            db.execute("BEGIN IMMEDIATE")  # bu tabana fark yedeği eklenirken silinmesin
+            row = db.execute("SELECT kind, stored FROM backups WHERE path = ?", (path,)).fetchone()
+            kind = row["kind"] if row is not None else backup.get("kind", "full")
+            if kind == "full" and db.execute("SELECT 1 FROM backups WHERE base = ? LIMIT 1",
+                                             (os.path.basename(path),)).fetchone():
+                raise ValueError("Bu yedeği taban alan fark yedekleri var")
+            
+            db.execute("UPDATE chunks SET refs = refs - 1 WHERE digest IN "
+                       "(SELECT digest FROM backup_chunks WHERE path = ?)", (path,))
+            freed = db.execute("SELECT COALESCE(SUM(c.stored), 0) FROM backup_chunks b "
+                               "JOIN chunks c ON c.digest = b.digest "
+                               "WHERE b.path = ? AND c.refs <= 0", (path,)).fetchone()[0]
+            if kind == "legacy" and row is not None:
+                freed += row["stored"]
+            db.execute("DELETE FROM backup_chunks WHERE path = ?", (path,))
+            db.execute("DELETE FROM backups WHERE path = ?", (path,))
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(backup["path"])
+        return freed
+    
+    def prune(self, max_age_days=0, max_per_source=0, max_bytes=0):
+        """Saklama kurallarını indeks üzerinden uygula, (silinen, boşalan bayt) döndür
+        
+        Yaşı max_age_days günü aşan ve her kaynağın en yeni max_per_source
+        yedeği dışındakiler silinir; ardından toplam boyut max_bytes altına
+        inene kadar en eski yedekler silinir (0 = kural kapalı). Kalan bir
+        fark yedeğinin tabanı hiçbir kuralla silinmez; son fark yedeği
+        silinen taban, boyut sınırı hâlâ aşılıyorsa onunla birlikte silinir.
+        """
+        backups = self.list_backups()  # en yeni önce
+        doomed = set()
+        if max_age_days:
+            cutoff = (datetime.datetime.now() - datetime.timedelta(days=max_age_days)).isoformat(timespec="seconds")
+            doomed.update(backup["path"] for backup in backups if backup["created"] < cutoff)
+        if max_per_source:
+            per_source = Counter()
+            for backup in backups:
+                key = backup["source"] or backup["name"]
+                per_source[key] += 1
+                if per_source[key] > max_per_source:
+                    doomed.add(backup["path"])
+        
+        # Kalan fark yedeklerinin tabanları (taban adı -> kalan fark sayısı)
+        base_refs = Counter(backup["base"] for backup in backups
+                            if backup["base"] and backup["path"] not in doomed)
+        doomed = {path for path in doomed if os.path.basename(path) not in base_refs}
+        
+        removed = freed = 0
+        # Fark yedekleri tabanlarından önce silinir
+        for backup in sorted(backups, key=lambda backup: backup["kind"] != "delta"):
+            if backup["path"] in doomed:
+                freed += self.remove(backup)
+                removed += 1
+        
+        if max_bytes:
+            by_name = {os.path.basename(backup["path"]): backup for backup in backups}
+            total = self.disk_usage()
+            for backup in reversed(backups):  # en eski önce
+                if total <= max_bytes:
+                    break
+                if backup["path"] in doomed or base_refs[os.path.basename(backup["path"])]:
+                    continue
+                
+                # Silinen fark yedeği tabanının son kullanıcısıysa taban da
+                # silinir (taban daha eski olduğundan zaten atlanmıştı)
+                while backup is not None and total > max_bytes:
+                    doomed.add(backup["path"])
+                    released = self.remove(backup)
+                    total -= released
+                    freed += released
+                    removed += 1
+                    base = backup["base"]
+                    backup = None
+                    if base:
+                        base_refs[base] -= 1
+                        base_backup = by_name.get(base)
+                        if base_refs[base] <= 0 and base_backup and base_backup["path"] not in doomed:
+                            backup = base_backup
+        return removed, freed
+    
+    def gc(self):
+        """Hiçbir yedeğin kullanmadığı parçaları sil, (adet, bayt) döndür"""
+        count = freed = 0
+        with self.index() as db:
+            # Yazma kilidi altında: yedeğin indekslenmesiyle çakışmaz (bkz. backup)
+            db.execute("BEGIN IMMEDIATE")
+            rows = db.execute("SELECT digest, stored FROM chunks WHERE refs <= 0").fetchall()
+            for row in rows:
+                path, _ = self.find_chunk(row["digest"])
+                if path is not None:
+                    os.remove(path)
+                    count += 1
+                    freed += row["stored"]
+            db.executemany("DELETE FROM chunks WHERE digest = ?", ((row["digest"],) for row in rows))
+        return count, freed
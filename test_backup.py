@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+Yedek deposu: geri yükleme, sayaçlar ve eşzamanlı gc
+
+    python -m pytest -q test_backup.py
+"""
+
+import os
+import random
+
+import pytest
+
+from hdlang_core import CHUNK_MAX_SIZE, CHUNK_MIN_SIZE, BackupStore, chunk_boundaries
+
+
+def random_text(rng, size):
+    """Parçalanabilir (tekdüze olmayan) metin benzeri veri"""
+    words = [bytes(rng.choice(b"abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(2, 9)))
+             for _ in range(2000)]
+    out = bytearray()
+    while len(out) < size:
+        out += rng.choice(words) + rng.choice([b" ", b"\x00", b"\n"])
+    return bytes(out[:size])
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BackupStore(str(tmp_path / "backups"))
+
+
+def restored(store, backup, tmp_path):
+    dest = tmp_path / "restored.hdlang"
+    store.restore(backup, str(dest))
+    return dest.read_bytes()
+
+
+@pytest.mark.parametrize("size", [0, 1, CHUNK_MIN_SIZE, 300_000])
+def test_chunk_boundaries_cover_data(size):
+    data = random_text(random.Random(size), size)
+    spans = list(chunk_boundaries(data))
+    assert b"".join(data[start:end] for start, end in spans) == data
+    assert all(end - start <= CHUNK_MAX_SIZE for start, end in spans)
+    assert all(end - start >= CHUNK_MIN_SIZE for start, end in spans[:-1])
+
+
+def test_chunk_boundaries_resynchronize_after_insert():
+    data = random_text(random.Random(4), 300_000)
+    edited = data[:1000] + b"inserted" + data[1000:]
+    before = {data[start:end] for start, end in chunk_boundaries(data)}
+    after = [edited[start:end] for start, end in chunk_boundaries(edited)]
+    assert sum(chunk not in before for chunk in after) <= 2
+
+
+@pytest.mark.parametrize("compression", ["none", "zlib", "lzma"])
+def test_backup_restore_round_trip(tmp_path, compression):
+    store = BackupStore(str(tmp_path / "backups"), compression)
+    path = tmp_path / "file.hdlang"
+    data = random_text(random.Random(5), 300_000)
+    path.write_bytes(data)
+
+    manifest, written, _ = store.backup_file(str(path))
+    assert written == len(data)
+    assert restored(store, manifest, tmp_path) == data
+
+    # Aynı içerik tekrar yedeklenince yeni parça yazılmaz
+    again, written, stored = store.backup_file(str(path))
+    assert (written, stored) == (0, 0)
+    assert restored(store, again, tmp_path) == data
+
+
+def test_gc_leaves_referenced_chunks(store, tmp_path):
+    path = tmp_path / "file.hdlang"
+    data = random_text(random.Random(6), 300_000)
+    path.write_bytes(data)
+    first, _, _ = store.backup_file(str(path))
+    other = data[:150_000] + random_text(random.Random(7), 150_000)
+    path.write_bytes(other)
+    second, _, _ = store.backup_file(str(path))
+
+    assert store.gc() == (0, 0)
+    store.remove(first)
+    count, freed = store.gc()
+    assert count > 0 and freed > 0
+    assert restored(store, second, tmp_path) == other
+    assert store.gc() == (0, 0)
+
+
+def test_gc_during_backup_keeps_deduplicated_chunks(store, tmp_path, monkeypatch):
+    """Başka bir işçinin prune + gc'si, yedeğin atladığı parçayı silerse"""
+    path = tmp_path / "file.hdlang"
+    data = random_text(random.Random(1), 300_000)
+    path.write_bytes(data)
+    old, _, _ = store.backup_file(str(path))
+
+    put_chunk = store.put_chunk
+    calls = []
+
+    def racing_put_chunk(digest, chunk):
+        size = put_chunk(digest, chunk)  # ilk parça zaten var - atlanır
+        if not calls:
+            store.remove(old)
+            store.gc()
+        calls.append(digest)
+        return size
+
+    monkeypatch.setattr(store, "put_chunk", racing_put_chunk)
+    manifest, _, _ = store.backup_file(str(path))
+    monkeypatch.undo()
+
+    assert restored(store, manifest, tmp_path) == data
+    assert store.gc() == (0, 0)
+    assert restored(store, manifest, tmp_path) == data
+
+
+def test_base_removed_during_delta_backup_falls_back_to_full(store, tmp_path, monkeypatch):
+    path = tmp_path / "file.hdlang"
+    data = random_text(random.Random(2), 300_000)
+    path.write_bytes(data)
+    base, _, _ = store.backup_file(str(path))
+    changed = data[:1000] + b"new text inserted here" + data[1000:]
+    path.write_bytes(changed)
+
+    put_chunk = store.put_chunk
+
+    def racing_put_chunk(digest, chunk):
+        if store.count_backups():
+            store.remove(base)
+            store.gc()
+        return put_chunk(digest, chunk)
+
+    monkeypatch.setattr(store, "put_chunk", racing_put_chunk)
+    manifest, _, _ = store.backup_file(str(path), delta=True)
+    monkeypatch.undo()
+
+    assert manifest["kind"] == "full"
+    store.gc()
+    assert restored(store, manifest, tmp_path) == changed
+
+
+def backup_versions(store, tmp_path, name, versions, seed):
+    """Dosyanın ardışık sürümlerini yedekle (ilki tam, sonrakiler fark)"""
+    path = tmp_path / name
+    data = random_text(random.Random(seed), 200_000)
+    manifests = []
+    for version in range(versions):
+        data = data[:5000 * version] + b"edit %d " % version + data[5000 * version:]
+        path.write_bytes(data)
+        manifest, _, _ = store.backup_file(str(path), delta=bool(manifests))
+        manifests.append((manifest, data))
+    return manifests
+
+
+def test_prune_by_size_removes_base_after_its_last_delta(store, tmp_path):
+    manifests = backup_versions(store, tmp_path, "file.hdlang", 3, seed=3)
+    assert [manifest["kind"] for manifest, _ in manifests] == ["full", "delta", "delta"]
+
+    removed, _ = store.prune(max_bytes=1)
+    assert removed == 3
+    assert store.count_backups() == 0
+    store.gc()
+    assert store.disk_usage() == 0
+
+
+def test_delta_backups_restore_byte_identical(store, tmp_path):
+    manifests = backup_versions(store, tmp_path, "file.hdlang", 4, seed=8)
+    assert [manifest["kind"] for manifest, _ in manifests] == ["full", "delta", "delta", "delta"]
+    for manifest, data in manifests:
+        assert restored(store, manifest, tmp_path) == data
+    # İndeks satırından (manifest diskten okunarak) geri yükleme
+    for backup, (_, data) in zip(reversed(store.list_backups()), manifests):
+        assert restored(store, backup, tmp_path) == data
+
+
+def test_delta_chain_starts_new_full_backup(store, tmp_path):
+    path = tmp_path / "file.hdlang"
+    data = random_text(random.Random(9), 200_000)
+    kinds = []
+    for version in range(5):
+        path.write_bytes(data + b"v%d" % version)
+        manifest, _, _ = store.backup_file(str(path), delta=True, full_every=3)
+        kinds.append(manifest["kind"])
+    assert kinds == ["full", "delta", "delta", "full", "delta"]
+
+    # Dosyanın çoğu değişince fark yerine tam yedek
+    path.write_bytes(random_text(random.Random(10), 200_000))
+    manifest, _, _ = store.backup_file(str(path), delta=True)
+    assert manifest["kind"] == "full"
+
+
+def chunk_refs(store):
+    with store.index() as db:
+        return {row["digest"]: row["refs"] for row in db.execute("SELECT digest, refs FROM chunks")}
+
+
+def test_chunk_refs_count_each_backup_once(store, tmp_path):
+    path = tmp_path / "file.hdlang"
+    data = random_text(random.Random(11), 300_000)
+    path.write_bytes(data)
+    first, _, _ = store.backup_file(str(path))  # indeksi ilk kez kurar
+    assert set(chunk_refs(store).values()) == {1}
+
+    second, _, _ = store.backup_file(str(path))
+    assert set(chunk_refs(store).values()) == {2}
+
+    # Diskten yeniden kurulan indeks aynı sayaçları verir
+    os.remove(store.index_path)
+    assert set(chunk_refs(store).values()) == {2}
+
+    store.remove(first)
+    store.remove(second)
+    assert set(chunk_refs(store).values()) == {0}
+    count, _ = store.gc()
+    assert count == len(set(store.manifest_chunks(first)))
+
+
+def test_prune_keeps_base_of_kept_delta(store, tmp_path):
+    manifests = backup_versions(store, tmp_path, "file.hdlang", 3, seed=12)
+    base, _ = manifests[0]
+
+    # Yalnızca en yeni yedek kalmalı, ama onun tabanı da korunur
+    removed, _ = store.prune(max_per_source=1)
+    assert removed == 1
+    kept = {os.path.basename(backup["path"]) for backup in store.list_backups()}
+    assert kept == {os.path.basename(base["path"]), os.path.basename(manifests[-1][0]["path"])}
+
+    store.gc()
+    assert restored(store, manifests[-1][0], tmp_path) == manifests[-1][1]
+    with pytest.raises(ValueError):
+        store.remove(base)
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Çıkarma motorlarının referans motorla (extract_strings_python) eşliği
+
+    python -m pytest -q test_extract.py
+"""
+
+import random
+
+import pytest
+
+from hdlang_core import (
+    EXTRACT_ENGINES, extract_strings_parallel, extract_strings_python, extract_strings_regex,
+    iter_strings_chunked,
+)
+
+FAST_ENGINES = [name for name in EXTRACT_ENGINES if name != "python"]
+
+# Sınır baytları: yazdırılabilir aralığın iki ucu ve hemen dışı, harfler ve
+# harf olmayan yazdırılabilir karakterler, ASCII dışı baytlar
+EDGE_BYTES = [0, 9, 10, 31, 32, 33, 48, 57, 64, 65, 90, 91, 96, 97, 122, 123, 126, 127, 128, 200, 255]
+
+
+def random_data(rng, size):
+    """Kısa dizilerin (özellikle 1-3 karakter) ve ayraçların karışımı"""
+    out = bytearray()
+    while len(out) < size:
+        kind = rng.random()
+        if kind < 0.4:
+            out += bytes(rng.choice(EDGE_BYTES) for _ in range(rng.randint(1, 4)))
+        elif kind < 0.8:
+            out += bytes(rng.randint(32, 126) for _ in range(rng.randint(1, 3)))
+        else:
+            out += bytes(rng.randint(32, 126) for _ in range(rng.randint(4, 40)))
+        out.append(rng.choice([0, 10, 31, 127, 255]))
+    return bytes(out[:size])
+
+
+CASES = [
+    b"",
+    b"a",
+    b"ab",            # harfli 2'li dizi - alınır
+    b"12",            # harfsiz 2'li dizi - atlanır
+    b"1a\x00a1\x00!!\x00 Z\x00--",
+    b"123\x00!!!\x00  \x00\x1f~~~\x7f",
+    b"\x20\x7e\x7f\x20\x7e\x7e",
+    b"ab" * 3 + b"\xff" + b"x",
+    b"\x00" * 10,
+    b"hello world\x00\x01\x02new game\xff",
+]
+
+
+@pytest.mark.parametrize("engine", FAST_ENGINES)
+@pytest.mark.parametrize("data", CASES)
+def test_engine_matches_reference_on_edge_cases(engine, data):
+    assert EXTRACT_ENGINES[engine](data) == extract_strings_python(data)
+
+
+@pytest.mark.parametrize("engine", FAST_ENGINES)
+def test_engine_matches_reference_on_random_data(engine):
+    rng = random.Random(engine)
+    for _ in range(200):
+        data = random_data(rng, rng.randint(0, 400))
+        assert EXTRACT_ENGINES[engine](data) == extract_strings_python(data), data
+        # Bellek eşlemeleri gibi bytes olmayan tamponlar
+        assert EXTRACT_ENGINES[engine](bytearray(data)) == extract_strings_python(data), data
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+def test_chunked_matches_whole_file(tmp_path, chunk_size):
+    rng = random.Random(chunk_size)
+    data = random_data(rng, 3000)
+    path = tmp_path / "chunked.hdlang"
+    path.write_bytes(data)
+
+    strings, positions = extract_strings_regex(data)
+    expected = [(start, end, text) for (start, end), text in zip(positions, strings)]
+    assert list(iter_strings_chunked(str(path), chunk_size)) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64])
+def test_chunked_run_spanning_many_chunks(tmp_path, chunk_size):
+    data = b"\x00ab\x01" + b"long printable run " * 100 + b"\x00x\x01" + b"tail without end" * 20
+    path = tmp_path / "long_run.hdlang"
+    path.write_bytes(data)
+
+    strings, positions = extract_strings_python(data)
+    expected = [(start, end, text) for (start, end), text in zip(positions, strings)]
+    assert list(iter_strings_chunked(str(path), chunk_size)) == expected
+
+
+@pytest.mark.parametrize("workers", [2, 3, 7])
+def test_parallel_matches_serial(tmp_path, workers):
+    rng = random.Random(workers)
+    data = random_data(rng, 5000)
+    path = tmp_path / "parallel.hdlang"
+    path.write_bytes(data)
+
+    assert extract_strings_parallel(data, str(path), workers) == extract_strings_python(data)
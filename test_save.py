@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Kaydetme: dinamik ve sabit boyut, iki düzen için gidiş-dönüş
+
+    python -m pytest -q test_save.py
+"""
+
+import os
+import struct
+
+import pytest
+
+from hdlang_core import StringTooLongError, build_string_table, save_string_table
+
+TEXTS = [f"Menu item number {i}" for i in range(40)]
+
+
+def heuristic_file():
+    return b"\x01\x02\x03\x04" + b"".join(b"\x00\x07" + text.encode() + b"\x00\x00" for text in TEXTS)
+
+
+def length_prefixed_file():
+    records = []
+    for text in TEXTS:
+        encoded = text.encode()
+        records.append(struct.pack("<I", len(encoded)) + encoded + b"\x00" * (-len(encoded) % 4))
+    return b"HDLG" + struct.pack("<I", len(TEXTS)) + b"".join(records)
+
+
+LAYOUTS = {"heuristic": heuristic_file, "length_prefixed": length_prefixed_file}
+
+
+def open_table(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    table, _ = build_string_table(str(path), data, use_cache=False)
+    return table
+
+
+@pytest.fixture(params=sorted(LAYOUTS))
+def source(request, tmp_path):
+    path = tmp_path / "source.hdlang"
+    path.write_bytes(LAYOUTS[request.param]())
+    assert open_table(path).layout.name == request.param
+    return path
+
+
+@pytest.mark.parametrize("use_source", [False, True])
+def test_fixed_save_round_trip(source, tmp_path, use_source):
+    table = open_table(source)
+    table.set(0, "Short")
+    table.set(5, "Menu item NUMBER 5")  # orijinalle aynı uzunluk
+    output = tmp_path / "fixed.hdlang"
+
+    size = save_string_table(table, str(output), dynamic=False,
+                             source_path=str(source) if use_source else None)
+
+    assert size == os.path.getsize(source) == os.path.getsize(output)
+    expected = ["Short", *TEXTS[1:5], "Menu item NUMBER 5", *TEXTS[6:]]
+    saved = open_table(output)
+    assert saved.layout.name == table.layout.name
+    assert [saved.get(index) for index in range(len(saved))] == expected
+
+
+def test_dynamic_save_round_trip(source, tmp_path):
+    table = open_table(source)
+    table.set(0, "A much longer replacement text than the original one")
+    table.set(3, "Tiny")
+    table.set(len(TEXTS) - 1, "Last entry, longer than before")
+    output = tmp_path / "dynamic.hdlang"
+
+    save_string_table(table, str(output), dynamic=True)
+
+    expected = list(TEXTS)
+    expected[0] = "A much longer replacement text than the original one"
+    expected[3] = "Tiny"
+    expected[-1] = "Last entry, longer than before"
+    saved = open_table(output)
+    assert saved.layout.name == table.layout.name
+    assert [saved.get(index) for index in range(len(saved))] == expected
+
+
+def test_unmodified_save_is_byte_identical(source, tmp_path):
+    table = open_table(source)
+    for dynamic in (True, False):
+        output = tmp_path / f"copy_{dynamic}.hdlang"
+        save_string_table(table, str(output), dynamic=dynamic)
+        assert output.read_bytes() == source.read_bytes()
+
+
+def test_fixed_save_rejects_overflow_and_keeps_target(source, tmp_path):
+    table = open_table(source)
+    table.set(2, "This text is far too long for the original record")
+    output = tmp_path / "existing.hdlang"
+    output.write_bytes(b"previous contents")
+
+    with pytest.raises(StringTooLongError):
+        save_string_table(table, str(output), dynamic=False, source_path=str(source))
+
+    assert output.read_bytes() == b"previous contents"
+    assert sorted(os.listdir(tmp_path)) == ["existing.hdlang", "source.hdlang"]
+
+
+def test_failed_write_leaves_target_untouched(source, tmp_path, monkeypatch):
+    table = open_table(source)
+    table.set(0, "Changed")
+    original = source.read_bytes()
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("hdlang_core.write_segments", fail)
+    with pytest.raises(OSError):
+        save_string_table(table, str(source), dynamic=True)
+
+    assert source.read_bytes() == original
+    assert os.listdir(tmp_path) == ["source.hdlang"]
@@ -20,11 +20,587 @@ from tkinter import filedialog, messagebox, ttk
 import os
 import json
 import datetime
-import tempfile
+import itertools
+import mmap
 import threading
+import queue
+import time
+import multiprocessing
+from array import array
+from bisect import bisect_left
+from concurrent.futures import as_completed
 import webbrowser
+import re
 from tkinter import font
 
+# Dosya işleme, string modeli, arama ve yedekleme Tk gerektirmeyen çekirdekte
+from hdlang_core import (
+    BACKUP_DIR, BACKUP_FULL_EVERY, BackupStore, NgramIndex, StringTable, StringTooLongError,
+    apply_replacements, build_string_table, clear_index_cache, compile_pattern,
+    find_hdlang_files, get_extract_engine, iter_strings_chunked, map_file, modified_path,
+    plan_replacements, process_pool, rank_similar, save_string_table, scan_string_table,
+    search_file, search_lines, table_options,
+)
+
+# Arayüz sabitleri
+SEARCH_SYNC_LINES = 50000  # bundan az satır taranacaksa arama iş parçacığına gitmez
+REPLACE_PREVIEW_LIMIT = 2000  # önizlemede gösterilen en fazla string
+REPLACE_SCOPES = {"Tümü": "all", "Seçili": "selected", "Değiştirilmiş": "modified"}
+BACKUP_PAGE_SIZE = 200  # yedek yönetiminde sayfa başına satır
+
+
+# Arka plan işleri
+class TaskCancelled(Exception):
+    """Arka plan işi kullanıcı tarafından iptal edildi"""
+
+
+class BackgroundTask:
+    """İşi ayrı bir iş parçacığında çalıştır, mesajları kuyrukla Tk döngüsüne aktar
+    
+    work(task) fonksiyonu task.post(...) ile ilerleme mesajı gönderir ve
+    task.check() ile iptal isteğini denetler. Kuyruk Tk tarafında after()
+    ile yoklanır; böylece geri çağrılar ve widget güncellemeleri her zaman
+    ana iş parçacığında çalışır.
+    """
+    
+    def __init__(self, window, work, on_message=None, on_done=None, on_error=None,
+                 on_cancel=None, poll_ms=50, daemon=True):
+        self.window = window
+        self.work = work
+        self.on_message = on_message
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_cancel = on_cancel
+        self.poll_ms = poll_ms
+        self.messages = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=daemon)
+        self.finished = False
+    
+    @property
+    def running(self):
+        return not self.finished
+    
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+    
+    def start(self):
+        self.thread.start()
+        self.window.after(self.poll_ms, self._poll)
+        return self
+    
+    def wait(self):
+        """İş bitene kadar bekle ve kalan mesajları hemen işle"""
+        self.thread.join()
+        self._poll()
+    
+    def cancel(self):
+        self.cancel_event.set()
+    
+    def check(self):
+        """İptal istendiyse işi durdur (iş parçacığı içinden çağrılır)"""
+        if self.cancel_event.is_set():
+            raise TaskCancelled()
+    
+    def post(self, *message):
+        self.messages.put(("message", message))
+    
+    def _run(self):
+        try:
+            result = self.work(self)
+        except TaskCancelled:
+            self.messages.put(("cancelled", None))
+        except Exception as e:
+            self.messages.put(("error", e))
+        else:
+            self.messages.put(("done", result))
+    
+    def _poll(self):
+        if self.finished:
+            return
+        
+        try:
+            while True:
+                kind, payload = self.messages.get_nowait()
+                if kind == "message":
+                    if self.on_message:
+                        self.on_message(*payload)
+                    continue
+                
+                self.finished = True
+                if kind == "done" and self.on_done:
+                    self.on_done(payload)
+                elif kind == "error" and self.on_error:
+                    self.on_error(payload)
+                elif kind == "cancelled" and self.on_cancel:
+                    self.on_cancel()
+                return
+        except queue.Empty:
+            pass
+        
+        self.window.after(self.poll_ms, self._poll)
+
+
+# Değişiklik sonrası yenileme zamanlayıcısı
+class UpdateScheduler:
+    """Art arda gelen değişikliklerin yenilemelerini birleştir
+    
+    Her alt sistem register() ile bir ad, öncelik ve gecikme kaydeder;
+    schedule() yalnızca bekleyenler kümesine ekler. Aynı gecikmedeki işler
+    tek bir after() zamanlayıcısını paylaşır ve her yeni değişiklikte
+    zamanlayıcı ertelenir (debounce); gecikmesi 0 olanlar after_idle ile
+    olay kuyruğu boşalınca çalışır. Bir turda işler öncelik sırasıyla
+    (küçük önce) çağrılır. Sürekli yazmada yenilemenin hiç gelmemesini
+    önlemek için bir grup en fazla max_wait_ms ertelenir.
+    """
+    
+    def __init__(self, window, delay_ms=150, max_wait_ms=1000):
+        self.window = window
+        self.delay_ms = delay_ms
+        self.max_wait_ms = max_wait_ms
+        self.tasks = {}  # ad -> (öncelik, geri çağrı, gecikme)
+        self.pending = set()
+        self.timers = {}  # gecikme -> (after kimliği, ilk istek zamanı)
+    
+    def register(self, name, callback, priority=0, delay_ms=None):
+        """Alt sistem kaydet; delay_ms None ise varsayılan gecikme kullanılır"""
+        self.tasks[name] = (priority, callback, delay_ms)
+    
+    def delay_of(self, name):
+        delay = self.tasks[name][2]
+        return self.delay_ms if delay is None else delay
+    
+    def schedule(self, *names):
+        """İşleri beklemeye al; zamanlayıcıları birleştir/ertele"""
+        for delay in {self.delay_of(name) for name in names}:
+            self.pending.update(name for name in names if self.delay_of(name) == delay)
+            self.arm(delay)
+    
+    def arm(self, delay):
+        now = time.monotonic()
+        timer = self.timers.get(delay)
+        if timer is not None:
+            after_id, first = timer
+            if delay == 0 or (now - first) * 1000 >= self.max_wait_ms:
+                return  # zaten sırada / daha fazla ertelenmez
+            self.window.after_cancel(after_id)
+        else:
+            first = now
+        
+        if delay == 0:
+            after_id = self.window.after_idle(self.run_group, delay)
+        else:
+            after_id = self.window.after(delay, self.run_group, delay)
+        self.timers[delay] = (after_id, first)
+    
+    def run_group(self, delay):
+        self.timers.pop(delay, None)
+        self.run([name for name in self.pending if self.delay_of(name) == delay])
+    
+    def run(self, names):
+        """Bekleyen işleri öncelik sırasıyla çalıştır"""
+        for name in sorted(names, key=lambda name: self.tasks[name][0]):
+            if name in self.pending:
+                self.pending.discard(name)
+                self.tasks[name][1]()
+    
+    def flush(self, *names):
+        """Bekleyen işleri (verilmezse hepsini) hemen çalıştır"""
+        names = [name for name in (names or self.tasks) if name in self.pending]
+        self.run(names)
+    
+    def cancel(self, *names):
+        """Bekleyen işlerden verilenleri çıkar (iş zaten yapıldıysa)"""
+        self.pending.difference_update(names)
+    
+    def cancel_all(self):
+        """Bekleyen tüm işleri ve zamanlayıcıları iptal et"""
+        for after_id, _ in self.timers.values():
+            self.window.after_cancel(after_id)
+        self.timers.clear()
+        self.pending.clear()
+
+
+# Kaydırma çubuğu yanındaki sonuç yoğunluğu haritası
+class DensityMap(tk.Canvas):
+    """Eşleşen satırları kaydırma çubuğu boyunca ince çizgilerle gösterir
+    
+    Satırlar sıralı tutulur; her piksel satırı için ilgili satır aralığında
+    eşleşme olup olmadığı ikili aramayla bulunur. Çizim maliyeti eşleşme
+    sayısına değil haritanın yüksekliğine bağlıdır. Tıklanınca o konuma
+    kaydırmak için on_jump(oran) çağrılır.
+    """
+    
+    def __init__(self, master, on_jump=None, color='#ffd700', **kwargs):
+        kwargs.setdefault("width", 8)
+        super().__init__(master, highlightthickness=0, bd=0, **kwargs)
+        self.on_jump = on_jump
+        self.color = color
+        self.rows = []  # sıralı, 0 tabanlı eşleşen satırlar
+        self.total = 0
+        self.bind("<Configure>", lambda e: self.redraw())
+        self.bind("<Button-1>", self.on_click)
+    
+    def set_marks(self, rows, total):
+        """Sıralı satır listesini ve toplam satır sayısını ayarla"""
+        self.rows = rows
+        self.total = total
+        self.redraw()
+    
+    def redraw(self):
+        self.delete("all")
+        height = self.winfo_height()
+        rows, total = self.rows, self.total
+        if not rows or total <= 0 or height <= 1:
+            return
+        
+        width = self.winfo_width()
+        run_start = None
+        for y in range(height + 1):
+            marked = False
+            if y < height:
+                low = y * total // height
+                high = max(low + 1, (y + 1) * total // height)
+                i = bisect_left(rows, low)
+                marked = i < len(rows) and rows[i] < high
+            
+            # Ardışık işaretli pikselleri tek dikdörtgende birleştir
+            if marked and run_start is None:
+                run_start = y
+            elif not marked and run_start is not None:
+                self.create_rectangle(1, run_start, width - 1, max(y, run_start + 2),
+                                      fill=self.color, width=0)
+                run_start = None
+    
+    def on_click(self, event):
+        if self.on_jump and self.winfo_height() > 0:
+            self.on_jump(event.y / self.winfo_height())
+
+
+# Sanal liste görünümü
+class VirtualStringList(tk.Frame):
+    """Yalnızca görünen satırları çizen sanal string listesi
+    
+    Satırlar doğrudan StringTable'dan okunur; kaydırma sadece ilk görünen
+    satırın indeksini değiştirir, bu yüzden açılış ve kaydırma maliyeti
+    string sayısından bağımsızdır. Canvas öğeleri satır havuzunda yeniden
+    kullanılır. Çift tık / Enter ile satır üzerinde Entry açılıp düzenlenir.
+    """
+    
+    COLUMN_CHARS = (8, 12)  # "#" ve "Ofset" sütunlarının karakter genişliği
+    HEADERS = ("#", "Ofset", "Orijinal", "Güncel")
+    
+    def __init__(self, master, on_edit=None, on_select=None, font_size=12, **kwargs):
+        super().__init__(master, **kwargs)
+        self.table = StringTable()
+        self.on_edit = on_edit  # on_edit(indeks, yeni_metin)
+        self.on_select = on_select  # on_select(indeks)
+        self.top = 0  # ilk görünen satır
+        self.selected = None
+        self.highlighted = set()  # arama sonucu olan satırlar
+        self.highlight_rows = []  # aynı satırlar sıralı (yoğunluk haritası için)
+        self.rows = []  # satır başına (arka plan, sütun metinleri...) canvas öğeleri
+        self.editor = None
+        self.editing = None
+        self.colors = {
+            "bg": '#2b2b2b', "alt": '#313131', "fg": '#ffffff', "dim": '#888888',
+            "header": '#3c3c3c', "modified": '#ffc107', "select": '#4a90e2',
+            "highlight": '#5c5000', "grid": '#444444'
+        }
+        
+        self.header = tk.Canvas(self, highlightthickness=0, bd=0)
+        self.canvas = tk.Canvas(self, highlightthickness=0, bd=0, takefocus=1)
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        
+        self.header.pack(side=tk.TOP, fill=tk.X)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.density = DensityMap(self, on_jump=lambda fraction: self.yview("moveto", fraction),
+                                  bg=self.colors["bg"])
+        self.density.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        self.canvas.bind("<Configure>", lambda e: self.redraw())
+        self.canvas.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.canvas.bind("<Button-4>", self.on_mouse_wheel)
+        self.canvas.bind("<Button-5>", self.on_mouse_wheel)
+        self.canvas.bind("<Button-1>", self.on_click)
+        self.canvas.bind("<Double-Button-1>", self.on_double_click)
+        self.canvas.bind("<Return>", lambda e: self.begin_edit(self.selected))
+        self.canvas.bind("<Up>", lambda e: self.move_selection(-1))
+        self.canvas.bind("<Down>", lambda e: self.move_selection(1))
+        self.canvas.bind("<Prior>", lambda e: self.move_selection(-self.visible_rows()))
+        self.canvas.bind("<Next>", lambda e: self.move_selection(self.visible_rows()))
+        self.canvas.bind("<Home>", lambda e: self.select(0))
+        self.canvas.bind("<End>", lambda e: self.select(len(self.table) - 1))
+        
+        self.set_font(font_size)
+    
+    # Yerleşim
+    def set_font(self, font_size):
+        """Yazı tipini ve buna bağlı satır yüksekliğini ayarla"""
+        self.font = font.Font(family='Consolas', size=font_size)
+        self.row_height = self.font.metrics("linespace") + 4
+        self.char_width = max(1, self.font.measure("0"))
+        self.header.configure(height=self.row_height)
+        self.reset_rows()
+    
+    def set_colors(self, bg, fg, header):
+        """Tema renklerini uygula"""
+        self.colors.update(bg=bg, fg=fg, header=header,
+                           alt=header if bg == '#ffffff' else '#313131')
+        self.canvas.configure(bg=bg)
+        self.density.configure(bg=bg)
+        self.reset_rows()
+    
+    def reset_rows(self):
+        """Satır havuzunu boşalt (yazı tipi/renk değişince yeniden oluşturulur)"""
+        self.canvas.delete("all")
+        self.rows = []
+        self.redraw()
+    
+    def column_bounds(self):
+        """Sütunların (sol, sağ) piksel sınırları"""
+        width = max(self.canvas.winfo_width(), 1)
+        x = 0
+        bounds = []
+        for chars in self.COLUMN_CHARS:
+            bounds.append((x, x + chars * self.char_width))
+            x += chars * self.char_width
+        half = max((width - x) // 2, self.char_width)
+        bounds.append((x, x + half))
+        bounds.append((x + half, max(width, x + 2 * half)))
+        return bounds
+    
+    def visible_rows(self):
+        return max(1, self.canvas.winfo_height() // self.row_height)
+    
+    # Veri
+    def set_table(self, table):
+        """Gösterilecek string tablosunu değiştir - O(1), satırlar çizimde okunur"""
+        self.cancel_edit()
+        self.table = table
+        self.top = 0
+        self.selected = None
+        self.set_highlight(())
+    
+    def set_highlight(self, rows):
+        """Arama sonucu olan satırları işaretle"""
+        self.highlighted = set(rows)
+        self.highlight_rows = sorted(self.highlighted)
+        self.density.set_marks(self.highlight_rows, len(self.table))
+        self.redraw()
+    
+    def add_highlight(self, rows):
+        """İşaretli satırlara yenilerini ekle (akan arama sonuçları sırayla gelir)"""
+        for row in rows:
+            if row not in self.highlighted:
+                self.highlighted.add(row)
+                self.highlight_rows.append(row)
+        self.density.set_marks(self.highlight_rows, len(self.table))
+        self.redraw()
+    
+    # Çizim
+    def redraw(self):
+        """Yalnızca görünen satırları çiz"""
+        count = len(self.table)
+        visible = self.visible_rows()
+        self.top = max(0, min(self.top, count - visible))
+        bounds = self.column_bounds()
+        self.draw_header(bounds)
+        
+        # Havuzda her görünür satır (+1 yarım satır) için öğe olsun
+        while len(self.rows) < visible + 1:
+            self.rows.append(self.create_row())
+        
+        colors = self.colors
+        for slot, items in enumerate(self.rows):
+            index = self.top + slot
+            y = slot * self.row_height
+            if index >= count:
+                for item in items:
+                    self.canvas.itemconfigure(item, state=tk.HIDDEN)
+                continue
+            
+            modified = self.table.is_modified(index)
+            if index == self.selected:
+                background = colors["select"]
+            elif index in self.highlighted:
+                background = colors["highlight"]
+            else:
+                background = colors["alt"] if index % 2 else colors["bg"]
+            
+            rect, *texts = items
+            self.canvas.coords(rect, 0, y, bounds[-1][1], y + self.row_height)
+            self.canvas.itemconfigure(rect, fill=background, state=tk.NORMAL)
+            
+            values = (str(index + 1), f"0x{self.table.starts[index]:08X}",
+                      self.table.original_at(index), self.table.get(index))
+            for column, (item, value, (left, right)) in enumerate(zip(texts, values, bounds)):
+                if column == 3 and modified:
+                    fill = colors["modified"]
+                elif column < 2:
+                    fill = colors["dim"]
+                else:
+                    fill = colors["fg"]
+                self.canvas.coords(item, left + 4, y + 2)
+                self.canvas.itemconfigure(item, text=self.clip(value, right - left - 8),
+                                          fill=fill, state=tk.NORMAL)
+        
+        # Kaydırma çubuğu: görünen aralığın toplam içindeki payı
+        if count:
+            self.scrollbar.set(self.top / count, min(1.0, (self.top + visible) / count))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+    
+    def create_row(self):
+        rect = self.canvas.create_rectangle(0, 0, 0, 0, width=0)
+        texts = [self.canvas.create_text(0, 0, anchor=tk.NW, font=self.font)
+                 for _ in self.HEADERS]
+        return (rect, *texts)
+    
+    def draw_header(self, bounds):
+        self.header.delete("all")
+        self.header.configure(bg=self.colors["header"])
+        for title, (left, right) in zip(self.HEADERS, bounds):
+            self.header.create_text(left + 4, 2, anchor=tk.NW, text=title, font=self.font,
+                                    fill=self.colors["fg"])
+            self.header.create_line(right, 0, right, self.row_height, fill=self.colors["grid"])
+    
+    def clip(self, text, width):
+        """Metni sütuna sığacak kadar kısalt (uzun stringler bütünüyle çizilmez)"""
+        limit = max(1, width // self.char_width)
+        text = text.replace("\n", "⏎")
+        return text if len(text) <= limit else text[:limit - 1] + "…"
+    
+    # Kaydırma ve seçim
+    def yview(self, *args):
+        """Kaydırma çubuğu komutu (moveto / scroll)"""
+        count = len(self.table)
+        visible = self.visible_rows()
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * count)
+        elif args[0] == "scroll":
+            step = visible if args[2] == "pages" else 1
+            self.top += int(args[1]) * step
+        self.cancel_edit()
+        self.redraw()
+    
+    def scroll(self, rows):
+        self.top += rows
+        self.cancel_edit()
+        self.redraw()
+    
+    def on_mouse_wheel(self, event):
+        if event.num == 4:  # Linux yukarı
+            self.scroll(-3)
+        elif event.num == 5:  # Linux aşağı
+            self.scroll(3)
+        elif event.delta:
+            self.scroll(int(-1 * (event.delta / 120) * 3))
+        return "break"
+    
+    def row_at(self, y):
+        index = self.top + int(y // self.row_height)
+        return index if index < len(self.table) else None
+    
+    def see(self, index):
+        """Satırı görünür alana getir"""
+        visible = self.visible_rows()
+        if index < self.top:
+            self.top = index
+        elif index >= self.top + visible:
+            self.top = index - visible + 1
+    
+    def select(self, index):
+        """Satırı seç ve görünür yap"""
+        if not len(self.table):
+            return
+        index = max(0, min(index, len(self.table) - 1))
+        self.selected = index
+        self.see(index)
+        self.redraw()
+        if self.on_select:
+            self.on_select(index)
+    
+    def move_selection(self, delta):
+        self.select(0 if self.selected is None else self.selected + delta)
+        return "break"
+    
+    def on_click(self, event):
+        self.canvas.focus_set()
+        index = self.row_at(event.y)
+        if index is not None:
+            self.select(index)
+    
+    def on_double_click(self, event):
+        index = self.row_at(event.y)
+        if index is not None:
+            self.begin_edit(index)
+    
+    # Düzenleme
+    def begin_edit(self, index):
+        """Satırın güncel metni üzerinde Entry aç"""
+        if index is None or not len(self.table):
+            return
+        self.commit_edit()
+        self.select(index)
+        
+        left, right = self.column_bounds()[3]
+        y = (index - self.top) * self.row_height
+        self.editing = index
+        self.editor = tk.Entry(self.canvas, font=self.font, relief=tk.FLAT,
+                               bg=self.colors["bg"], fg=self.colors["fg"],
+                               insertbackground=self.colors["fg"])
+        self.editor.insert(0, self.table.get(index))
+        self.editor.place(x=left, y=y, width=right - left, height=self.row_height)
+        self.editor.focus_set()
+        self.editor.select_range(0, tk.END)
+        
+        self.editor.bind("<Return>", lambda e: self.commit_edit(focus=True))
+        self.editor.bind("<Escape>", lambda e: self.cancel_edit(focus=True))
+        self.editor.bind("<Tab>", lambda e: self.edit_next(1))
+        self.editor.bind("<Shift-Tab>", lambda e: self.edit_next(-1))
+        self.editor.bind("<FocusOut>", lambda e: self.commit_edit())
+    
+    def commit_edit(self, focus=False):
+        """Açık düzenlemeyi tabloya yaz"""
+        if self.editor is None:
+            return "break"
+        index, text = self.editing, self.editor.get()
+        self.close_editor(focus)
+        if text != self.table.get(index) and self.on_edit:
+            self.on_edit(index, text)
+        self.redraw()
+        return "break"
+    
+    def cancel_edit(self, focus=False):
+        """Açık düzenlemeyi kaydetmeden kapat"""
+        if self.editor is not None:
+            self.close_editor(focus)
+        return "break"
+    
+    def close_editor(self, focus):
+        editor, self.editor, self.editing = self.editor, None, None
+        editor.destroy()
+        if focus:
+            self.canvas.focus_set()
+    
+    def edit_next(self, delta):
+        """Tab ile sonraki/önceki satırı düzenle (çeviri akışı için)"""
+        index = self.editing
+        self.commit_edit()
+        if index is not None and 0 <= index + delta < len(self.table):
+            self.begin_edit(index + delta)
+        return "break"
+    
+    def selected_text(self):
+        """Seçili satırın güncel metni"""
+        if self.selected is None or self.selected >= len(self.table):
+            return None
+        return self.table.get(self.selected)
+
+
 class GelistirilmisHDLangEditor:
     def __init__(self):
         self.window = tk.Tk()
@@ -41,33 +617,86 @@ class GelistirilmisHDLangEditor:
         # Ana değişkenler
         self.file_path = None
         self.file_data = None
-        self.strings_positions = []
-        self.original_strings = []
-        self.current_strings = []
+        self.file_stat = None  # açılıştaki (boyut, mtime) - kaynak değişti mi?
+        self.strings = StringTable()  # konumlar + orijinal/güncel stringler
         self.search_results = []
         self.current_search_index = 0
         self.is_modified = False
+        self.list_mode = False  # True: sanal liste görünümü, False: metin alanı
+        self.match_lines = []  # arama sonucu olan satırlar (0 tabanlı, sıralı)
+        self.highlight_span = None  # şu an etiketlenmiş (ilk, son) satır aralığı
+        self.search_index = None  # NgramIndex - arka planda oluşturulur
+        self.index_task = None
+        self.search_task = None  # arka planda süren tam tarama
+        self.last_search = None  # (küçük harf sorgu, eşleşen satırlar, tablo, tablo sürümü)
         
         # Ayarlar
         self.settings = {
             "dynamic_sizing": True,
             "auto_backup": True,
+            "backup_on_save": True,  # kaydedilen dosyanın fark yedeğini al
+            "backup_full_every": 10,  # her N fark yedeğinde bir tam yedek
+            "backup_keep_days": 30,  # saklama kuralları (0 = kapalı)
+            "backup_keep_per_file": 50,
+            "backup_max_mb": 0,
+            "backup_auto_prune": False,  # her yedekten sonra kuralları uygula
+            "backup_compression": "zlib",  # none / zlib / lzma
+            "backup_level": 6,  # sıkıştırma seviyesi (0-9)
             "theme": "dark",
             "font_size": 12,
             "auto_save": False,
-            "backup_interval": 5  # dakika
+            "backup_interval": 5,  # dakika
+            "extract_engine": "auto",  # auto / regex / numpy / python
+            "use_mmap": True,  # dosyayı kopyalamadan bellek eşlemesiyle aç
+            "stream_threshold_mb": 512,  # bu boyutun üstü parça parça taranır
+            "stream_chunk_mb": 8,
+            "extract_workers": 1,  # 1 = tek çekirdek, 0 = tüm çekirdekler
+            "parallel_min_mb": 32,  # paralel tarama için en küçük dosya boyutu
+            "index_cache": True,  # çıkarma sonuçlarını hdlang_cache/ altında sakla
+            "cache_max_mb": 512,
+            "format_mode": "auto",  # auto: yapısal tablo, bulunamazsa sezgisel / heuristic
+            "list_view_threshold": 100000,  # bu sayıdan çok string sanal listede açılır (0 = kapalı)
+            "update_delay_ms": 150,  # yazarken istatistik/model yenileme gecikmesi
+            "similar_top_k": 20  # benzerlik aramasında gösterilen sonuç sayısı
         }
         
         self.load_settings()
+        
+        # Değişiklik sonrası yenilemeler tek seferde çalışır
+        self.scheduler = UpdateScheduler(self.window, self.settings.get("update_delay_ms", 150))
+        self.scheduler.register("gutter", self.update_line_numbers, priority=0, delay_ms=0)
+        self.scheduler.register("highlight", self.update_visible_highlights, priority=1, delay_ms=0)
+        self.scheduler.register("density", self.update_density_map, priority=2, delay_ms=0)
+        self.scheduler.register("model", self.sync_strings_from_text, priority=10)
+        self.scheduler.register("stats", self.update_stats, priority=20)
+        self.scheduler.register("autosave", self.restart_auto_save_timer, priority=30)
+        
         self.create_ui()
         self.apply_theme()
         self.center_window()
         
+        # Arka planda süren kaydetme ve yedekleme işleri
+        self.save_task = None
+        self.backup_tasks = []
+        
         # Otomatik kaydetme için timer
         self.auto_save_timer = None
         if self.settings["auto_save"]:
             self.start_auto_save_timer()
     
+    # String tablosunun liste görünümleri
+    @property
+    def strings_positions(self):
+        return self.strings.positions
+    
+    @property
+    def original_strings(self):
+        return self.strings.original
+    
+    @property
+    def current_strings(self):
+        return self.strings.current
+    
     def center_window(self):
         """Pencereyi ekranın ortasına yerleştir"""
         self.window.update_idletasks()
@@ -152,6 +781,8 @@ class GelistirilmisHDLangEditor:
         menubar.add_cascade(label="🔧 Araçlar", menu=tools_menu)
         tools_menu.add_command(label="⚙️ Ayarlar", command=self.show_settings)
         tools_menu.add_command(label="📦 Yedeklemeler", command=self.manage_backups)
+        tools_menu.add_command(label="📂 Klasörde Ara (Ctrl+Shift+F)", command=self.search_in_folder,
+                               accelerator="Ctrl+Shift+F")
         tools_menu.add_separator()
         tools_menu.add_command(label="🧹 Cache Temizle", command=self.clear_cache)
         
@@ -219,6 +850,22 @@ class GelistirilmisHDLangEditor:
                                     bg='#d9534f', fg='white', relief='flat', padx=10)
         self.replace_btn.pack(side=tk.LEFT, padx=2)
         
+        # Değiştirme seçenekleri: düzenli ifade ve kapsam
+        self.regex_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(middle_group, text=".*", variable=self.regex_var,
+                      bg='#3c3c3c', fg='white', selectcolor='#3c3c3c',
+                      font=('Consolas', 10)).pack(side=tk.LEFT, padx=2)
+        
+        # Benzerlik modu: arama kutusu benzer stringleri sıralar
+        self.similar_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(middle_group, text="≈", variable=self.similar_var,
+                      bg='#3c3c3c', fg='white', selectcolor='#3c3c3c',
+                      font=('Consolas', 10)).pack(side=tk.LEFT, padx=2)
+        
+        self.replace_scope_var = tk.StringVar(value="Tümü")
+        ttk.Combobox(middle_group, textvariable=self.replace_scope_var, values=list(REPLACE_SCOPES),
+                    state="readonly", width=12).pack(side=tk.LEFT, padx=2)
+        
         # Sağ grup - Durum göstergeleri
         right_group = tk.Frame(toolbar_frame, bg='#3c3c3c')
         right_group.pack(side=tk.RIGHT, padx=5)
@@ -331,11 +978,14 @@ class GelistirilmisHDLangEditor:
         # Satır numaraları ve metin alanı çerçevesi
         text_frame = tk.Frame(right_panel, bg='#2b2b2b', relief=tk.SUNKEN, bd=1)
         text_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Satır numaraları
-        self.line_numbers_area = tk.Text(text_frame, width=6, padx=5, takefocus=0, border=0,
-                                        background='#2b2b2b', foreground='#666', state=tk.DISABLED, 
-                                        wrap=tk.NONE, font=('Consolas', self.settings["font_size"]))
+        self.text_frame = text_frame
+        
+        # Satır numaraları - yalnızca görünen satırlar çizilen canvas
+        self.gutter_font = font.Font(family='Consolas', size=self.settings["font_size"])
+        self.gutter_fg = '#666'
+        self.gutter_digits = 0
+        self.line_numbers_area = tk.Canvas(text_frame, width=50, takefocus=0, bd=0,
+                                           highlightthickness=0, background='#2b2b2b')
         self.line_numbers_area.pack(side=tk.LEFT, fill=tk.Y)
         
         # Ana metin alanı
@@ -349,11 +999,28 @@ class GelistirilmisHDLangEditor:
         v_scrollbar = tk.Scrollbar(text_frame, orient=tk.VERTICAL, command=self.on_text_scroll)
         h_scrollbar = tk.Scrollbar(right_panel, orient=tk.HORIZONTAL, command=self.text_area.xview)
         
-        self.text_area.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.v_scrollbar = v_scrollbar
+        self.text_area.configure(yscrollcommand=self.on_text_yview, xscrollcommand=h_scrollbar.set)
         
         v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Arama sonuçlarının dosya içindeki dağılımı
+        self.density_map = DensityMap(text_frame, on_jump=self.text_area.yview_moveto, bg='#2b2b2b')
+        self.density_map.pack(side=tk.RIGHT, fill=tk.Y)
+        
         self.text_area.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         h_scrollbar.pack(fill=tk.X)
+        self.h_scrollbar = h_scrollbar
+        
+        # Çok büyük dosyalar için sanal liste görünümü (gerekince metin alanının yerine geçer)
+        self.list_view = VirtualStringList(right_panel, on_edit=self.on_list_edit,
+                                           on_select=self.on_list_select,
+                                           font_size=self.settings["font_size"],
+                                           relief=tk.SUNKEN, bd=1)
+        
+        # Arama vurguları (sonradan tanımlanan etiket öndedir: güncel sonuç üstte)
+        self.text_area.tag_configure("search_highlight", background="#ffd700", foreground="#000000")
+        self.text_area.tag_configure("current_highlight", background="#ff6600", foreground="#ffffff")
         
         # Metin değişikliklerini izle
         self.text_area.bind("<<Modified>>", self.on_text_change)
@@ -364,6 +1031,7 @@ class GelistirilmisHDLangEditor:
         # Scroll senkronizasyonu
         self.text_area.bind("<MouseWheel>", self.on_mouse_wheel)
         self.line_numbers_area.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.text_area.bind("<Configure>", lambda e: self.update_line_numbers())
         
         # Drag & Drop desteği
         self.text_area.drop_target_register('DND_Files')
@@ -388,6 +1056,11 @@ class GelistirilmisHDLangEditor:
                                       font=('Arial', 9))
         self.progress_label.pack(side=tk.LEFT, padx=20)
         
+        # Kaydetme sürerken görünen iptal butonu
+        self.save_cancel_btn = tk.Button(status_frame, text="✖ İptal", command=self.cancel_save,
+                                        bg='#dc3545', fg='white', relief='flat', padx=8,
+                                        font=('Arial', 8))
+        
         # Sağ bilgiler
         right_info = tk.Frame(status_frame, bg='#3c3c3c')
         right_info.pack(side=tk.RIGHT, padx=10, pady=5)
@@ -414,6 +1087,7 @@ class GelistirilmisHDLangEditor:
         self.context_menu.add_command(label="🔄 Seç Tümü", command=self.select_all)
         self.context_menu.add_separator()
         self.context_menu.add_command(label="🔍 Bu Metni Ara", command=self.search_selected)
+        self.context_menu.add_command(label="≈ Benzer Stringleri Bul", command=self.search_similar_selected)
     
     def setup_keyboard_shortcuts(self):
         """Klavye kısayollarını ayarla"""
@@ -422,6 +1096,7 @@ class GelistirilmisHDLangEditor:
             '<Control-s>': self.save_hdlang,
             '<Control-n>': self.new_file,
             '<Control-f>': self.focus_search,
+            '<Control-F>': self.search_in_folder,  # Ctrl+Shift+F
             '<Control-h>': self.focus_replace,
             '<Control-a>': self.select_all,
             '<Control-z>': lambda e: self.text_area.edit_undo(),
@@ -457,58 +1132,136 @@ class GelistirilmisHDLangEditor:
         # Metin alanları güncelle
         if hasattr(self, 'text_area'):
             self.text_area.configure(bg=bg_color, fg=fg_color)
-            self.line_numbers_area.configure(bg=bg_secondary, fg='#888888')
+            self.gutter_fg = '#888888'
+            self.line_numbers_area.configure(bg=bg_secondary)
+            self.update_line_numbers()
             self.file_info_text.configure(bg=bg_color, fg=fg_color)
             self.stats_text.configure(bg=bg_color, fg=fg_color)
+            self.list_view.set_colors(bg_color, fg_color, bg_secondary)
+            self.density_map.configure(bg=bg_color)
+    
+    def iter_strings_streaming(self, file_path):
+        """Dosyayı parça parça tarayarak (başlangıç, bitiş, metin) kayıtları üret"""
+        engine = get_extract_engine(self.settings.get("extract_engine", "auto"))
+        chunk_size = int(self.settings.get("stream_chunk_mb", 8) * 1024 * 1024)
+        return iter_strings_chunked(file_path, chunk_size, engine)
+    
+    def extract_strings_streaming(self, file_path, data):
+        """Büyük dosyayı akış halinde çıkar, ilk stringleri tarama bitmeden göster"""
+        starts = array('Q')
+        ends = array('Q')
+        file_size = os.path.getsize(file_path) or 1
+        
+        # Sanal liste büyüyen konum dizilerini doğrudan okur
+        self.show_view(list_mode=True)
+        self.list_view.set_table(StringTable(data, starts, ends))
+        
+        for start, end, _ in self.iter_strings_streaming(file_path):
+            starts.append(start)
+            ends.append(end)
+            
+            if len(starts) % 5000 == 0:
+                self.list_view.redraw()
+                self.progress_label.config(text=f"📖 %{int(end / file_size * 100)}")
+                self.window.update_idletasks()
+        
+        self.progress_label.config(text="")
+        return starts, ends
     
-    def extract_strings_with_positions(self, data):
-        """Gelişmiş string çıkarma - daha akıllı algılama"""
-        strings = []
-        positions = []
-        i = 0
-        
-        while i < len(data):
-            if 32 <= data[i] <= 126:  # ASCII yazdırılabilir karakterler
-                start = i
-                while i < len(data) and 32 <= data[i] <= 126:
-                    i += 1
-                
-                # En az 2 karakter uzunluğundaki stringleri al
-                if i - start >= 2:
-                    try:
-                        string_content = data[start:i].decode("ascii", errors="ignore")
-                        # Sadece anlamlı stringler (en az bir harf içeren)
-                        if any(c.isalpha() for c in string_content) or len(string_content) >= 3:
-                            strings.append(string_content)
-                            positions.append((start, i))
-                    except:
-                        pass
-            else:
-                i += 1
+    def map_file(self, file_path):
+        """Dosyayı salt okunur bellek eşlemesiyle aç (kopya oluşturmadan)"""
+        return map_file(file_path, self.settings.get("use_mmap", True))
+    
+    def close_file_data(self, data=None):
+        """Bellek eşlemesini serbest bırak"""
+        data = self.file_data if data is None else data
+        if isinstance(data, mmap.mmap):
+            try:
+                data.close()
+            except BufferError:
+                pass  # Arka plandaki kaydetme hâlâ okuyor - iş bitince serbest kalır
+    
+    def get_file_stat(self, file_path):
+        """Dosyanın (boyut, mtime) bilgisi"""
+        try:
+            stat = os.stat(file_path)
+            return stat.st_size, stat.st_mtime_ns
+        except OSError:
+            return None
+    
+    def source_unchanged(self):
+        """Açılan dosya diskte açılıştan beri değişmedi mi"""
+        return self.file_stat is not None and self.get_file_stat(self.file_path) == self.file_stat
+    
+    def ensure_editable_data(self):
+        """Eşlenmiş dosyanın üzerine yazılmadan önce veriyi belleğe al
         
-        return strings, positions
+        Düzenlemeler StringTable katmanında tutulur; kopya yalnızca yerinde
+        kaydetme ve açık dosyaya geri yüklemede gerekir.
+        """
+        if self.file_data is None or isinstance(self.file_data, bytearray):
+            return
+        
+        data = self.file_data
+        self.file_data = bytearray(data)
+        if self.strings.data is data:
+            self.strings.data = self.file_data
+        self.close_file_data(data)
+    
+    def backup_store(self):
+        """Ayarlardaki sıkıştırma ile yedek deposu"""
+        return BackupStore(BACKUP_DIR, self.settings.get("backup_compression", "zlib"),
+                           self.settings.get("backup_level", 6))
     
-    def create_backup(self, file_path, data):
-        """Otomatik yedekleme oluştur"""
+    def create_backup(self, file_path, delta=False):
+        """Otomatik yedekleme oluştur (arka planda - açılış/kaydetme beklemez)"""
         if not self.settings["auto_backup"]:
             return None
         
         try:
-            backup_dir = 'hdlang_backups'
-            os.makedirs(backup_dir, exist_ok=True)
-            
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = os.path.basename(file_path)
-            backup_path = os.path.join(backup_dir, f"{filename}_{timestamp}.backup")
-            
-            with open(backup_path, 'wb') as f:
-                f.write(data)
-            
-            self.update_status(f"💾 Yedekleme oluşturuldu: {os.path.basename(backup_path)}")
-            return backup_path
+            store = self.backup_store()
+            # Dosya burada açılır: işçi, açılış anındaki sürümü yedekler
+            f = open(file_path, "rb")
         except Exception as e:
             messagebox.showwarning("Yedekleme Hatası", f"Yedekleme oluşturulamadı: {e}")
             return None
+        
+        name = os.path.basename(file_path)
+        full_every = self.settings.get("backup_full_every", BACKUP_FULL_EVERY)
+        started = time.perf_counter()
+        
+        retention = self.backup_retention() if self.settings.get("backup_auto_prune", False) else None
+        
+        def work(task):
+            # İçerik adresli depo: yalnızca daha önce görülmemiş parçalar yazılır
+            result = store.backup_file(file_path, f, delta, full_every)
+            if retention:
+                store.prune(**retention)
+                store.gc()
+            return result
+        
+        def finished():
+            if task in self.backup_tasks:
+                self.backup_tasks.remove(task)
+        
+        def on_done(result):
+            finished()
+            manifest, written, stored = result
+            elapsed = time.perf_counter() - started
+            kind = "Fark yedeği" if manifest["kind"] == "delta" else "Yedekleme"
+            ratio = f", oran %{stored * 100 / written:.0f}" if written else ""
+            self.update_status(f"💾 {kind} oluşturuldu: {name} "
+                               f"({written:,} / {manifest['size']:,} byte yeni → {stored:,} byte{ratio}, {elapsed:.2f} sn)")
+        
+        def on_error(error):
+            finished()
+            messagebox.showwarning("Yedekleme Hatası", f"Yedekleme oluşturulamadı: {error}")
+        
+        task = BackgroundTask(self.window, work, on_done=on_done, on_error=on_error,
+                              daemon=False)  # Çıkışta yarım manifest kalmasın
+        self.backup_tasks.append(task)
+        task.start()
+        return task
     
     # Ana işlem fonksiyonları
     def open_hdlang(self, event=None):
@@ -524,155 +1277,209 @@ class GelistirilmisHDLangEditor:
         if not file_path:
             return
         
+        self.load_hdlang(file_path)
+    
+    def load_hdlang(self, file_path):
+        """Verilen HDLang dosyasını yükle (önbellek, akış ve paralel tarama ile)"""
+        data = None
+        threshold = self.settings.get("stream_threshold_mb", 512) * 1024 * 1024
+        streaming = False
         try:
-            # Dosyayı yükle
-            with open(file_path, "rb") as f:
-                data = f.read()
+            # Dosyayı yükle (kopyasız bellek eşlemesi)
+            data = self.map_file(file_path)
+            
+            # Yedekleme oluştur - arka planda, tarama ile aynı anda
+            self.create_backup(file_path)
+            
+            options = table_options(self.settings)
             
-            # Yedekleme oluştur
-            backup_path = self.create_backup(file_path, data)
+            def scan(data):
+                # Bilinmeyen dosya: sezgisel tarama - çok büyük dosyalar parça parça taranır
+                nonlocal streaming
+                streaming = len(data) >= threshold
+                if streaming:
+                    starts, ends = self.extract_strings_streaming(file_path, data)
+                    return StringTable(data, starts, ends)
+                return scan_string_table(data, file_path, options["engine_name"],
+                                         options["workers"], options["parallel_min_size"])
             
-            # Stringleri çıkar
-            strings, positions = self.extract_strings_with_positions(data)
+            # Önbellek -> yapısal tablo -> sezgisel tarama (komut satırıyla aynı yol)
+            table, _ = build_string_table(file_path, data, scan=scan, **options)
             
-            # Verileri kaydet
+            # Verileri kaydet - önceki dosyanın eşlemesini bırak
+            self.close_file_data()
             self.file_path = file_path
-            self.file_data = bytearray(data)
-            self.strings_positions = positions
-            self.original_strings = strings.copy()
-            self.current_strings = strings.copy()
+            self.file_data = data
+            self.file_stat = self.get_file_stat(file_path)
+            self.strings = table
             self.is_modified = False
             
-            # UI'yi güncelle
-            self.update_text_area()
+            # UI'yi güncelle - büyük tablolar sanal listede açılır
+            self.show_strings()
+            self.start_search_index()
             self.update_file_info()
             self.update_stats()
-            self.update_status(f"✅ Dosya yüklendi: {os.path.basename(file_path)} ({len(strings)} string)")
+            self.update_status(f"✅ Dosya yüklendi: {os.path.basename(file_path)} ({len(table)} string)")
             
             self.file_name_label.config(text=f"📄 {os.path.basename(file_path)}")
-            self.file_status.config(text=f"📄 {len(strings)} string", bg='#28a745')
+            self.file_status.config(text=f"📄 {len(table)} string", bg='#28a745')
             
             # Son açılan dosyayı kaydet
             self.save_recent_file(file_path)
             
         except Exception as e:
+            if data is not self.file_data:
+                self.close_file_data(data)
+            if streaming:
+                # Yarım kalan akışı geri al, önceki dosyayı göster
+                self.show_strings()
             messagebox.showerror("Hata", f"Dosya açılamadı:\n{str(e)}")
             self.update_status("❌ Hata: Dosya açılamadı")
     
-    def save_hdlang(self, event=None):
-        """HDLang dosyası kaydet - DİNAMİK BOYUTLANDIRMA İLE"""
+    def save_hdlang(self, event=None, background=True, quiet=False):
+        """HDLang dosyası kaydet - DİNAMİK BOYUTLANDIRMA İLE (arka planda)"""
         if not self.file_path or not self.file_data:
             messagebox.showerror("Hata", "Önce bir dosya açmalısınız.")
             return
         
-        # Metin alanından güncel stringleri al
-        content = self.text_area.get("1.0", tk.END).strip()
-        lines = content.split("\n") if content else []
+        if self.save_task and self.save_task.running:
+            self.update_status("⏳ Kaydetme zaten sürüyor...")
+            return
         
-        # Boş satırları filtrele
-        lines = [line.strip() for line in lines if line.strip()]
+        # Metin alanındaki son düzenlemeleri string tablosuna aktar
+        line_count = self.sync_strings_from_text()
+        self.scheduler.cancel("model")
+        string_count = len(self.strings)
         
-        if len(lines) != len(self.strings_positions):
+        if line_count != string_count:
+            # Tabloda eksik satırlar boş string olarak tutulur, fazlası kırpılır
             if not messagebox.askyesno("Uyarı", 
                 f"Satır sayısı değişti!\n\n"
-                f"Orijinal: {len(self.strings_positions)} string\n"
-                f"Yeni: {len(lines)} string\n\n"
+                f"Orijinal: {string_count} string\n"
+                f"Yeni: {line_count} string\n\n"
                 f"Dinamik boyutlandırma ile devam etmek istiyor musunuz?\n\n"
                 f"⚠️  DİKKAT: Bu dosya yapısını değiştirebilir!"):
                 return
-            
-            # Eksik satırları boş string olarak ekle
-            while len(lines) < len(self.strings_positions):
-                lines.append("")
-            # Fazla satırları kırp
-            lines = lines[:len(self.strings_positions)]
         
-        try:
-            self.update_status("💾 Kaydediliyor...")
-            self.window.update()
-            
-            if self.settings["dynamic_sizing"]:
-                # *** DİNAMİK BOYUTLANDIRMA - STRING UZUNLUĞU SINIRI YOK! ***
-                modified_data = bytearray()
-                last_end = 0
-                total_saved = 0
-                
-                for i, (new_string, (start, end)) in enumerate(zip(lines, self.strings_positions)):
-                    # Önceki bölümü kopyala
-                    modified_data.extend(self.file_data[last_end:start])
-                    
-                    # Yeni stringi UTF-8 olarak kodla (daha fazla karakter desteği)
-                    encoded = new_string.encode("utf-8", errors="ignore")
-                    modified_data.extend(encoded)
-                    
-                    total_saved += len(encoded)
-                    last_end = end
-                    
-                    # İlerleme göster
-                    if i % 10 == 0:
-                        progress = int((i / len(lines)) * 100)
-                        self.progress_label.config(text=f"💾 %{progress}")
-                        self.window.update()
-                
-                # Kalan veriyi ekle
-                modified_data.extend(self.file_data[last_end:])
-                
-                success_msg = "🚀 Dinamik boyutlandırma kullanıldı - uzunluk sınırı yok!"
-                
-            else:
-                # Klasik sistem - sabit boyut (orijinal davranış)
-                modified_data = bytearray(self.file_data)
-                
-                for new_string, (start, end) in zip(lines, self.strings_positions):
-                    encoded = new_string.encode("ascii", errors="ignore")
-                    length = end - start
-                    
-                    if len(encoded) > length:
-                        messagebox.showerror("Hata", 
-                            f"❌ '{new_string}' metni çok uzun!\n\n"
-                            f"Orijinal uzunluk: {length} karakter\n"
-                            f"Yeni uzunluk: {len(encoded)} karakter\n\n"
-                            f"💡 Çözüm: Ayarlar menüsünden 'Dinamik Boyutlandırma'yı etkinleştirin!")
-                        return
-                    
-                    # Padding ile doldur
-                    encoded_padded = encoded + b"\x00" * (length - len(encoded))
-                    modified_data[start:end] = encoded_padded
-                
-                success_msg = "📝 Sabit boyut ile kaydedildi"
-            
-            # Dosyayı kaydet
-            save_path = self.file_path.replace(".hdlang", "_modified.hdlang")
-            with open(save_path, "wb") as f:
-                f.write(modified_data)
-            
-            # Başarı mesajı
-            file_size = len(modified_data)
-            message = f"✅ Dosya başarıyla kaydedildi!\n\n"
-            message += f"📁 {save_path}\n"
-            message += f"📊 Boyut: {file_size:,} byte\n"
-            message += f"📝 String sayısı: {len(lines)}\n\n"
-            message += success_msg
-            
-            messagebox.showinfo("Başarılı ✅", message)
-            
-            self.update_status(f"✅ Kaydedildi: {os.path.basename(save_path)}")
-            self.progress_label.config(text="")
-            self.is_modified = False
-            self.modified_label.config(text="")
-            
-            # Güncel stringleri kaydet
-            self.current_strings = lines.copy()
-            self.update_stats()
+        save_path = modified_path(self.file_path)
+        
+        # Değişmemiş kaynak dosya sabit boyut modunda diskten kopyalanıp yamalanır
+        source_path = self.file_path if self.source_unchanged() else None
+        if os.path.abspath(save_path) == os.path.abspath(self.file_path):
+            # Eşlenmiş dosyanın üzerine yazmadan önce belleğe al
+            self.ensure_editable_data()
+            source_path = None
+        
+        # İş parçacığı düzenlemelerin sabit bir kopyası üzerinde çalışır;
+        # kaydetme sürerken yapılan düzenlemeler onu etkilemez
+        snapshot = self.strings.snapshot()
+        dynamic = self.settings["dynamic_sizing"]
+        
+        def work(task):
+            def progress(done, total):
+                task.check()
+                task.post(done, total)
             
-        except Exception as e:
-            messagebox.showerror("Hata", f"❌ Dosya kaydedilirken hata oluştu:\n{str(e)}")
-            self.update_status("❌ Hata: Kaydetme başarısız")
-            self.progress_label.config(text="")
+            # Yalnızca değişen stringler yeniden kodlanır (delta kaydetme)
+            return save_string_table(snapshot, save_path, dynamic, source_path, progress)
+        
+        self.save_task = BackgroundTask(
+            self.window, work,
+            on_message=self.show_save_progress,
+            on_done=lambda file_size: self.on_save_done(save_path, file_size, snapshot, dynamic, quiet),
+            on_error=self.on_save_error,
+            on_cancel=self.on_save_cancelled,
+            daemon=False  # Çıkışta yarım kalmasın
+        )
+        
+        self.update_status("💾 Kaydediliyor...")
+        self.save_cancel_btn.pack(side=tk.LEFT)
+        self.save_btn.config(state=tk.DISABLED)
+        self.save_task.start()
+        
+        if not background:
+            self.save_task.wait()
+    
+    def on_save_done(self, save_path, file_size, snapshot, dynamic, quiet=False):
+        """Arka plan kaydetmesi başarıyla bitti"""
+        self.finish_save_ui()
+        
+        # Kaydetme sürerken yeni düzenleme yapılmadıysa dosya artık temiz;
+        # henüz tabloya aktarılmamış tuş vuruşları önce aktarılır
+        self.scheduler.flush("model")
+        if self.strings.edits == snapshot.edits and self.strings.data is snapshot.data:
+            self.mark_as_modified(False)
+        self.update_stats()
+        
+        # Kaydedilen sürümün fark yedeği (otomatik kaydetmeler dahil)
+        if self.settings.get("backup_on_save", True):
+            self.create_backup(save_path, delta=True)
+        
+        if quiet:
+            self.update_status(f"💿 Otomatik kaydedildi: {os.path.basename(save_path)}")
+            return
+        
+        if dynamic:
+            # *** DİNAMİK BOYUTLANDIRMA - STRING UZUNLUĞU SINIRI YOK! ***
+            success_msg = "🚀 Dinamik boyutlandırma kullanıldı - uzunluk sınırı yok!"
+        else:
+            # Klasik sistem - sabit boyut (orijinal davranış)
+            success_msg = "📝 Sabit boyut ile kaydedildi"
+        
+        # Başarı mesajı
+        message = f"✅ Dosya başarıyla kaydedildi!\n\n"
+        message += f"📁 {save_path}\n"
+        message += f"📊 Boyut: {file_size:,} byte\n"
+        message += f"📝 String sayısı: {len(snapshot)}\n\n"
+        message += success_msg
+        
+        self.update_status(f"✅ Kaydedildi: {os.path.basename(save_path)}")
+        messagebox.showinfo("Başarılı ✅", message)
+    
+    def on_save_error(self, error):
+        """Arka plan kaydetmesi hata ile bitti"""
+        self.finish_save_ui()
+        
+        if isinstance(error, StringTooLongError):
+            messagebox.showerror("Hata", 
+                f"❌ '{error.text}' metni çok uzun!\n\n"
+                f"Orijinal uzunluk: {error.limit} karakter\n"
+                f"Yeni uzunluk: {error.actual} karakter\n\n"
+                f"💡 Çözüm: Ayarlar menüsünden 'Dinamik Boyutlandırma'yı etkinleştirin!")
+            self.update_status("❌ Hata: Metin sabit boyuta sığmıyor")
+            return
+        
+        messagebox.showerror("Hata", f"❌ Dosya kaydedilirken hata oluştu:\n{str(error)}")
+        self.update_status("❌ Hata: Kaydetme başarısız")
+    
+    def on_save_cancelled(self):
+        """Kaydetme iptal edildi - hedef dosyaya dokunulmadı"""
+        self.finish_save_ui()
+        self.update_status("✖ Kaydetme iptal edildi")
+    
+    def cancel_save(self):
+        """Süren kaydetmeyi iptal et"""
+        if self.save_task and self.save_task.running:
+            self.save_task.cancel()
+            self.update_status("⏳ Kaydetme iptal ediliyor...")
+    
+    def finish_save_ui(self):
+        """Kaydetme bitince ilerleme göstergelerini sıfırla"""
+        self.progress_label.config(text="")
+        self.save_cancel_btn.pack_forget()
+        self.save_btn.config(state=tk.NORMAL)
+    
+    def show_save_progress(self, done, total):
+        """Kaydetme ilerlemesini durum çubuğunda göster"""
+        progress = int(done * 100 / total) if total else 100
+        self.progress_label.config(text=f"💾 %{progress}")
     
     def save_as_text(self, event=None):
         """Metin dosyası olarak kaydet"""
-        content = self.text_area.get("1.0", tk.END).strip()
+        if self.list_mode:
+            content = "\n".join(self.current_strings)
+        else:
+            content = self.text_area.get("1.0", tk.END).strip()
         if not content:
             messagebox.showwarning("Uyarı", "Kaydetmek için metin yok.")
             return
@@ -706,6 +1513,47 @@ class GelistirilmisHDLangEditor:
             messagebox.showerror("Hata", f"❌ Metin dosyası kaydedilirken hata:\n{str(e)}")
     
     # Arama ve değiştirme fonksiyonları
+    def start_search_index(self):
+        """Aktif tablo için trigram arama indeksini arka planda oluştur"""
+        self.stop_search_index()
+        if not len(self.strings):
+            return
+        
+        index = NgramIndex(self.strings)
+        
+        def on_done(result):
+            if index.table is self.strings:
+                self.search_index = index
+        
+        self.index_task = BackgroundTask(self.window, lambda task: index.build(task.check),
+                                         on_done=on_done,
+                                         on_error=lambda e: index.detach(),
+                                         on_cancel=index.detach).start()
+    
+    def stop_search_index(self):
+        """Süren indeks oluşturmayı iptal et, eski indeksi bırak"""
+        if self.index_task and self.index_task.running:
+            self.index_task.cancel()
+        if self.search_index:
+            self.search_index.detach()
+        self.index_task = None
+        self.search_index = None
+    
+    def search_lines_for(self, keyword):
+        """Aranacak satır numaraları: önceki sonuçlar, indeks adayları ya da tümü"""
+        keyword_lower = keyword.lower()
+        last = self.last_search
+        if (last and last[0] in keyword_lower and last[2] is self.strings
+                and last[3] == self.strings.version):
+            # Sorgu öncekini içeriyor: yalnızca önceki eşleşmeler yeniden süzülür
+            return last[1]
+        
+        candidates = self.search_index.candidates(keyword) if self.search_index else None
+        if candidates is None:
+            # İndeks yok ya da sorgu trigramdan kısa: tüm tablo taranır
+            return range(1, len(self.strings) + 1)
+        return [index + 1 for index in candidates]
+    
     def search_text(self, event=None):
         """Gelişmiş metin arama"""
         keyword = self.search_var.get().strip()
@@ -713,44 +1561,269 @@ class GelistirilmisHDLangEditor:
             messagebox.showwarning("Uyarı", "Aranacak kelime girin.")
             return
         
+        if self.similar_var.get():
+            self.search_similar(keyword)
+            return
+        
+        # Eski taramayı iptal et, bekleyen düzenlemeleri tabloya aktar
+        self.cancel_search()
+        self.scheduler.flush("model")
+        
         # Önceki aramaları temizle
         self.text_area.tag_remove("search_highlight", "1.0", tk.END)
         self.text_area.tag_remove("current_highlight", "1.0", tk.END)
+        self.list_view.set_highlight(())
         self.search_results = []
+        self.current_search_index = 0
+        self.reset_highlights()
         
-        content = self.text_area.get("1.0", tk.END)
-        lines = content.split("\n")
+        table = self.strings
+        version = table.version
+        lines = self.search_lines_for(keyword)
         
-        # Tüm eşleşmeleri bul
-        for line_num, line in enumerate(lines, 1):
-            start_pos = 0
-            while True:
-                pos = line.lower().find(keyword.lower(), start_pos)
-                if pos == -1:
-                    break
-                
-                self.search_results.append((line_num, pos, len(keyword)))
-                start_pos = pos + 1
+        if len(lines) <= SEARCH_SYNC_LINES:
+            # Az satır (iyileştirme / indeks adayları): hemen doğrula
+            results = search_lines(table, lines, keyword)
+            self.add_search_batch(results, len(lines), len(lines))
+            self.finish_search(keyword, results, table, version)
+            return
         
-        if self.search_results:
-            # İlk sonuca git
-            self.current_search_index = 0
+        # Tam tarama iş parçacığında; sonuçlar parça parça akar
+        task = BackgroundTask(
+            self.window, lambda task: search_lines(table, lines, keyword, task.post, task.check),
+            on_message=lambda batch, done: task is self.search_task and self.add_search_batch(batch, done, len(lines)),
+            on_done=lambda results: task is self.search_task and self.finish_search(keyword, results, table, version),
+            on_error=lambda e: task is self.search_task and self.update_status(f"❌ Arama başarısız: {e}")
+        )
+        self.search_task = task
+        self.update_status(f"🔍 '{keyword}' aranıyor...")
+        task.start()
+    
+    def add_search_batch(self, batch, done, total):
+        """Taramadan gelen yeni sonuçları ekle ve vurgula"""
+        first = not self.search_results
+        self.search_results.extend(batch)
+        self.highlight_results(batch)
+        
+        if first and self.search_results:
+            # İlk sonuç gelir gelmez ona git
             self.jump_to_search_result()
-            
-            # Tüm sonuçları vurgula
-            self.highlight_all_results(keyword)
-            
+            self.add_search_navigation()
+        
+        if done < total:
+            self.update_status(f"🔍 {len(self.search_results)} sonuç... (%{done * 100 // total})")
+    
+    def finish_search(self, keyword, results, table, version):
+        """Tarama bitti - sonuçları bir sonraki iyileştirme için sakla"""
+        self.search_task = None
+        lines = sorted({line_num for line_num, _, _ in results})
+        self.last_search = (keyword.lower(), lines, table, version)
+        
+        if self.search_results:
             message = f"🔍 {len(self.search_results)} sonuç bulundu"
             self.update_status(message)
-            self.progress_label.config(text=f"1/{len(self.search_results)}")
-            
-            # Sonraki/önceki butonları ekle
-            self.add_search_navigation()
-            
+            self.progress_label.config(text=f"{self.current_search_index + 1}/{len(self.search_results)}")
         else:
             self.update_status(f"🔍 '{keyword}' bulunamadı")
             messagebox.showinfo("Arama Sonucu", f"'{keyword}' bulunamadı.")
     
+    def cancel_search(self):
+        """Süren arka plan taramasını iptal et"""
+        if self.search_task and self.search_task.running:
+            self.search_task.cancel()
+        self.search_task = None
+    
+    def search_similar(self, query, exclude=None):
+        """Sorguya benzer stringleri sırala ve sonuç penceresinde göster"""
+        self.scheduler.flush("model")
+        top_k = self.settings.get("similar_top_k", 20)
+        
+        results = self.search_index.similar(query, top_k, exclude) if self.search_index else None
+        if results is None:
+            if len(self.strings) > SEARCH_SYNC_LINES:
+                self.update_status("⏳ Arama indeksi hazırlanıyor, biraz sonra tekrar deneyin")
+                return
+            # Küçük tablo ya da trigramdan kısa sorgu: hepsini sırala
+            items = ((index, text) for index, text in enumerate(self.current_strings) if index != exclude)
+            results = rank_similar(query, items, top_k)
+        
+        self.show_similar_results(query, results)
+        self.update_status(f"≈ '{query}' için {len(results)} benzer string")
+    
+    def search_similar_selected(self):
+        """Bulunulan satıra (stringe) benzer stringleri bul"""
+        if self.list_mode:
+            index = self.list_view.selected
+        else:
+            index = int(self.text_area.index(tk.INSERT).split(".")[0]) - 1
+        if index is None or not 0 <= index < len(self.strings):
+            return
+        self.search_similar(self.strings.get(index), exclude=index)
+    
+    def show_similar_results(self, query, results):
+        """Benzerlik sonuçlarını listele (pencere varsa yeniden kullanılır)"""
+        window = getattr(self, 'similar_window', None)
+        if window is None or not window.winfo_exists():
+            window = self.similar_window = tk.Toplevel(self.window)
+            window.geometry("700x400")
+            window.configure(bg='#2b2b2b')
+            
+            tree = ttk.Treeview(window, columns=("score", "line", "text"), show="headings")
+            tree.heading("score", text="Benzerlik")
+            tree.heading("line", text="#")
+            tree.heading("text", text="Metin")
+            tree.column("score", width=80, stretch=False)
+            tree.column("line", width=70, stretch=False)
+            tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            
+            def on_open(event):
+                values = tree.item(tree.focus(), "values")
+                if values:
+                    self.goto_string(int(values[1]) - 1)
+            
+            tree.bind("<Double-Button-1>", on_open)
+            tree.bind("<Return>", on_open)
+            window.tree = tree
+        
+        window.title(f"≈ Benzer: {query[:40]}")
+        tree = window.tree
+        tree.delete(*tree.get_children())
+        for score, index, text in results:
+            tree.insert("", tk.END, values=(f"%{score * 100:.0f}", index + 1, text))
+        window.lift()
+    
+    def search_in_folder(self, event=None):
+        """Klasördeki tüm .hdlang dosyalarında süreç havuzuyla ara"""
+        keyword = self.search_var.get().strip()
+        if not keyword:
+            messagebox.showwarning("Uyarı", "Aranacak kelime girin.")
+            self.focus_search()
+            return
+        
+        folder = filedialog.askdirectory(title="Aranacak Klasörü Seçin")
+        if not folder:
+            return
+        
+        files = find_hdlang_files(folder)
+        if not files:
+            messagebox.showinfo("Sonuç", "Klasörde .hdlang dosyası bulunamadı.")
+            return
+        
+        # İşçiler ayarları değil yalnızca bu seçenekleri görür; her işçi tek dosyayı seri tarar
+        options = dict(table_options(self.settings), workers=1)
+        workers = min(len(files), os.cpu_count() or 1)
+        
+        # Sonuç penceresi
+        results_window = tk.Toplevel(self.window)
+        results_window.title(f"📂 Klasörde Ara: '{keyword}'")
+        results_window.geometry("900x550")
+        results_window.configure(bg='#2b2b2b')
+        
+        status_label = tk.Label(results_window, text=f"🔍 {len(files)} dosya taranıyor...",
+                                bg='#2b2b2b', fg='white', font=('Arial', 10))
+        status_label.pack(fill=tk.X, padx=10, pady=5)
+        
+        tree_frame = tk.Frame(results_window, bg='#2b2b2b')
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=10)
+        
+        tree = ttk.Treeview(tree_frame, columns=("line", "text"), show="tree headings")
+        tree.heading("#0", text="Dosya")
+        tree.heading("line", text="#")
+        tree.heading("text", text="Metin")
+        tree.column("#0", width=260)
+        tree.column("line", width=70, stretch=False)
+        
+        scrollbar = tk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        targets = {}  # ağaç öğesi -> (dosya, string indeksi)
+        summary = {"files": 0, "matches": 0}
+        
+        def work(task):
+            # spawn: bu iş parçacığı ve Tk çalışırken fork güvenli değil
+            with process_pool(workers) as pool:
+                futures = {pool.submit(search_file, (path, keyword, options)): path for path in files}
+                try:
+                    for future in as_completed(futures):
+                        task.check()
+                        try:
+                            task.post(future.result(), None)
+                        except Exception as e:
+                            task.post(None, (futures[future], e))
+                finally:
+                    for future in futures:
+                        future.cancel()
+        
+        def on_result(result, error):
+            if not results_window.winfo_exists():
+                return  # pencere kapatıldı, kalan sonuçlar atlanır
+            summary["files"] += 1
+            if error:
+                path, e = error
+                tree.insert("", tk.END, text=f"❌ {os.path.basename(path)}", values=("", str(e)))
+            else:
+                path, string_count, match_count, matches = result
+                if matches:
+                    summary["matches"] += match_count
+                    parent = tree.insert("", tk.END, open=True,
+                                         text=f"📄 {os.path.relpath(path, folder)} ({match_count})")
+                    targets[parent] = (path, matches[0][0])
+                    for index, text in matches:
+                        item = tree.insert(parent, tk.END, values=(index + 1, text))
+                        targets[item] = (path, index)
+            status_label.config(text=f"🔍 {summary['files']}/{len(files)} dosya · "
+                                     f"{summary['matches']:,} sonuç")
+        
+        def on_done(result):
+            if not results_window.winfo_exists():
+                return
+            status_label.config(text=f"✅ {len(files)} dosya tarandı · {summary['matches']:,} sonuç")
+        
+        def on_open(event):
+            target = targets.get(tree.focus())
+            if target:
+                self.open_at_string(*target)
+        
+        def on_close():
+            task.cancel()
+            results_window.destroy()
+        
+        tree.bind("<Double-Button-1>", on_open)
+        tree.bind("<Return>", on_open)
+        results_window.protocol("WM_DELETE_WINDOW", on_close)
+        
+        task = BackgroundTask(self.window, work, on_message=on_result, on_done=on_done,
+                              on_error=lambda e: results_window.winfo_exists() and
+                                                 status_label.config(text=f"❌ Hata: {e}")).start()
+    
+    def open_at_string(self, file_path, index):
+        """Dosyayı aç (açık değilse) ve verilen stringe git"""
+        if os.path.abspath(file_path) != os.path.abspath(self.file_path or ""):
+            if self.is_modified and not self.ask_save_changes():
+                return
+            self.load_hdlang(file_path)
+            if os.path.abspath(file_path) != os.path.abspath(self.file_path or ""):
+                return  # açılamadı
+        self.goto_string(index)
+    
+    def goto_string(self, index):
+        """Verilen stringi görünür yap ve seç"""
+        if not 0 <= index < len(self.strings):
+            return
+        if self.list_mode:
+            self.list_view.select(index)
+            return
+        
+        line = index + 1
+        self.text_area.tag_remove(tk.SEL, "1.0", tk.END)
+        self.text_area.tag_add(tk.SEL, f"{line}.0", f"{line}.end")
+        self.text_area.mark_set(tk.INSERT, f"{line}.0")
+        self.text_area.see(f"{line}.0")
+        self.text_area.focus_set()
+        self.update_cursor_position()
+    
     def on_search_change(self, event=None):
         """Arama kutusu değiştiğinde otomatik ara"""
         keyword = self.search_var.get().strip()
@@ -759,16 +1832,58 @@ class GelistirilmisHDLangEditor:
         elif len(keyword) == 0:
             self.clear_search()
     
-    def highlight_all_results(self, keyword):
-        """Tüm arama sonuçlarını vurgula"""
-        # Highlight tag'lerini yapılandır
-        self.text_area.tag_configure("search_highlight", background="#ffd700", foreground="#000000")
-        self.text_area.tag_configure("current_highlight", background="#ff6600", foreground="#ffffff")
+    def highlight_results(self, results):
+        """Yeni arama sonuçlarını vurgula (metin alanında yalnızca görünen kısım etiketlenir)"""
+        if self.list_mode:
+            self.list_view.add_highlight(line_num - 1 for line_num, _, _ in results)
+            return
         
-        for line_num, pos, length in self.search_results:
-            start_index = f"{line_num}.{pos}"
-            end_index = f"{line_num}.{pos + length}"
-            self.text_area.tag_add("search_highlight", start_index, end_index)
+        # Sonuçlar satır sırasıyla gelir; her satır bir kez eklenir
+        match_lines = self.match_lines
+        for line_num, _, _ in results:
+            if not match_lines or match_lines[-1] != line_num - 1:
+                match_lines.append(line_num - 1)
+        
+        self.highlight_span = None  # görünen aralık yeniden etiketlensin
+        self.scheduler.schedule("highlight", "density")
+    
+    def reset_highlights(self):
+        """Arama vurgularını ve yoğunluk haritasını sıfırla"""
+        self.text_area.tag_remove("search_highlight", "1.0", tk.END)
+        self.match_lines = []
+        self.highlight_span = None
+        self.density_map.set_marks([], 0)
+    
+    def update_visible_highlights(self):
+        """Görünen satırların (ve çevresinin) eşleşmelerini etiketle"""
+        if self.list_mode or not self.search_results:
+            return
+        
+        first = int(self.text_area.index("@0,0").split(".")[0])
+        last = int(self.text_area.index(f"@0,{self.text_area.winfo_height()}").split(".")[0])
+        span = self.highlight_span
+        if span and span[0] <= first and last <= span[1]:
+            return  # görünen alan zaten etiketli
+        
+        # Kaydırırken her satırda yeniden etiketlememek için pay bırak
+        margin = max(50, last - first)
+        low, high = max(1, first - margin), last + margin
+        self.text_area.tag_remove("search_highlight", "1.0", tk.END)
+        
+        # Sonuçlar (satır, konum, uzunluk) sırasında: aralık ikili aramayla bulunur
+        results = self.search_results
+        start = bisect_left(results, (low,))
+        stop = bisect_left(results, (high + 1,))
+        for line_num, pos, length in itertools.islice(results, start, stop):
+            self.text_area.tag_add("search_highlight", f"{line_num}.{pos}", f"{line_num}.{pos + length}")
+        self.highlight_span = (low, high)
+    
+    def update_density_map(self):
+        """Kaydırma çubuğu yanındaki sonuç haritasını güncelle"""
+        if self.list_mode:
+            return
+        total = int(self.text_area.index("end-1c").split(".")[0])
+        self.density_map.set_marks(self.match_lines, total)
     
     def jump_to_search_result(self):
         """Arama sonucuna git"""
@@ -776,6 +1891,12 @@ class GelistirilmisHDLangEditor:
             return
         
         line_num, pos, length = self.search_results[self.current_search_index]
+        
+        if self.list_mode:
+            self.list_view.select(line_num - 1)
+            self.progress_label.config(text=f"{self.current_search_index + 1}/{len(self.search_results)}")
+            return
+        
         start_index = f"{line_num}.{pos}"
         end_index = f"{line_num}.{pos + length}"
         
@@ -821,7 +1942,7 @@ class GelistirilmisHDLangEditor:
             self.jump_to_search_result()
     
     def replace_text(self, event=None):
-        """Gelişmiş metin değiştirme"""
+        """Gelişmiş metin değiştirme - string tablosu üzerinde tek geçiş, önizlemeli"""
         find_text = self.search_var.get().strip()
         replace_text = self.replace_var.get()
         
@@ -829,47 +1950,134 @@ class GelistirilmisHDLangEditor:
             messagebox.showwarning("Uyarı", "Değiştirilecek kelime girin.")
             return
         
-        content = self.text_area.get("1.0", tk.END)
+        # Derlenmiş desen önbellekten gelir (büyük/küçük harf duyarsız)
+        try:
+            pattern = compile_pattern(find_text, regex=self.regex_var.get())
+        except re.error as e:
+            messagebox.showerror("Hata", f"❌ Geçersiz düzenli ifade:\n{str(e)}")
+            return
         
-        # Case insensitive replacement
-        import re
-        pattern = re.compile(re.escape(find_text), re.IGNORECASE)
-        new_content = pattern.sub(replace_text, content)
+        # Metin alanındaki son düzenlemeler önce tabloya aktarılır
+        self.sync_strings_from_text()
+        self.scheduler.cancel("model")
         
-        # Değişiklik sayısını hesapla
-        replacement_count = len(pattern.findall(content))
+        indices = self.replace_scope_indices()
+        try:
+            changes, replacement_count = plan_replacements(
+                self.strings, pattern, replace_text, indices, literal=not self.regex_var.get())
+        except re.error as e:
+            messagebox.showerror("Hata", f"❌ Geçersiz yeni metin şablonu:\n{str(e)}")
+            return
         
-        if replacement_count > 0:
-            # Onay al
-            if messagebox.askyesno("Onay", 
-                f"'{find_text}' → '{replace_text}'\n\n"
-                f"{replacement_count} değişiklik yapılacak.\n\n"
-                f"Devam etmek istiyor musunuz?"):
-                
-                # Metni güncelle
-                self.text_area.delete("1.0", tk.END)
-                self.text_area.insert("1.0", new_content)
-                
-                # Satır numaralarını güncelle
-                self.update_line_numbers()
-                self.mark_as_modified()
-                
-                message = f"✅ {replacement_count} değişiklik yapıldı"
-                self.update_status(message)
-                messagebox.showinfo("Başarılı", message)
-        else:
+        if not changes:
             messagebox.showinfo("Sonuç", f"'{find_text}' bulunamadı.")
+            return
+        
+        self.show_replace_preview(find_text, replace_text, changes, replacement_count)
+    
+    def replace_scope_indices(self):
+        """Seçili kapsamdaki string indeksleri (None = tümü)"""
+        scope = REPLACE_SCOPES.get(self.replace_scope_var.get(), "all")
+        if scope == "modified":
+            return self.strings.modified_indices()
+        if scope == "selected":
+            if self.list_mode:
+                selected = self.list_view.selected
+                return [] if selected is None else [selected]
+            try:
+                first = int(self.text_area.index(tk.SEL_FIRST).split(".")[0])
+                last = int(self.text_area.index(tk.SEL_LAST).split(".")[0])
+            except tk.TclError:
+                return []  # seçim yok
+            return range(first - 1, min(last, len(self.strings)))
+        return None
+    
+    def show_replace_preview(self, find_text, replace_text, changes, replacement_count):
+        """Etkilenecek stringleri listele, onaylanınca uygula"""
+        preview = tk.Toplevel(self.window)
+        preview.title("↔️ Değiştirme Önizlemesi")
+        preview.geometry("800x500")
+        preview.configure(bg='#2b2b2b')
+        preview.transient(self.window)
+        
+        tk.Label(preview, text=f"'{find_text}' → '{replace_text}': "
+                              f"{len(changes):,} string, {replacement_count:,} değişiklik",
+                bg='#2b2b2b', fg='white', font=('Arial', 11, 'bold')).pack(pady=10)
+        
+        list_frame = tk.Frame(preview, bg='#2b2b2b')
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=10)
+        
+        tree = ttk.Treeview(list_frame, columns=("line", "before", "after"), show="headings")
+        tree.heading("line", text="#")
+        tree.heading("before", text="Önce")
+        tree.heading("after", text="Sonra")
+        tree.column("line", width=70, stretch=False)
+        
+        scrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Önizleme çok büyük listelerde ilk kayıtlarla sınırlı
+        for index, before, after, _ in changes[:REPLACE_PREVIEW_LIMIT]:
+            tree.insert("", tk.END, values=(index + 1, before, after))
+        if len(changes) > REPLACE_PREVIEW_LIMIT:
+            tree.insert("", tk.END, values=("…", f"{len(changes) - REPLACE_PREVIEW_LIMIT:,} string daha", ""))
+        
+        def apply():
+            preview.destroy()
+            self.apply_replacements(changes, replacement_count)
+        
+        button_frame = tk.Frame(preview, bg='#2b2b2b')
+        button_frame.pack(pady=10)
+        
+        tk.Button(button_frame, text="✅ Uygula", command=apply,
+                 bg='#28a745', fg='white', padx=15).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="İptal", command=preview.destroy,
+                 bg='#6c757d', fg='white', padx=15).pack(side=tk.LEFT, padx=5)
+    
+    def apply_replacements(self, changes, replacement_count):
+        """Değişiklikleri tabloya yaz; görünümde yalnızca değişen satırları güncelle"""
+        self.mark_as_modified()
+        apply_replacements(self.strings, changes)
+        
+        if self.list_mode:
+            self.list_view.redraw()
+        else:
+            # Tüm değişiklikler tek geri alma adımı olsun
+            text_area = self.text_area
+            text_area.configure(autoseparators=False)
+            text_area.edit_separator()
+            for index, _, after, _ in changes:
+                line = index + 1
+                text_area.delete(f"{line}.0", f"{line}.end")
+                text_area.insert(f"{line}.0", after)
+            text_area.edit_separator()
+            text_area.configure(autoseparators=True)
+            
+            # Tablo zaten güncel: metin alanından yeniden senkron gerekmez
+            text_area.edit_modified(False)
+            self.scheduler.schedule("gutter", "highlight")
+        
+        self.scheduler.schedule("stats", "autosave")
+        
+        message = f"✅ {replacement_count} değişiklik yapıldı"
+        self.update_status(message)
+        messagebox.showinfo("Başarılı", message)
     
     def clear_search(self, event=None):
         """Aramayı temizle"""
+        self.cancel_search()
+        self.last_search = None
         self.search_var.set("")
         self.replace_var.set("")
         self.search_results = []
         self.current_search_index = 0
         
         # Vurguları temizle
-        self.text_area.tag_remove("search_highlight", "1.0", tk.END)
+        self.reset_highlights()
         self.text_area.tag_remove("current_highlight", "1.0", tk.END)
+        self.list_view.set_highlight(())
         
         # Navigasyon butonlarını kaldır
         if hasattr(self, 'search_nav_frame'):
@@ -879,28 +2087,85 @@ class GelistirilmisHDLangEditor:
         self.update_status("🔍 Arama temizlendi")
     
     # UI güncelleme fonksiyonları
+    def use_list_view(self, count):
+        """Bu kadar string sanal liste görünümünde mi gösterilmeli?"""
+        threshold = self.settings.get("list_view_threshold", 100000)
+        return bool(threshold) and count >= threshold
+    
+    def show_view(self, list_mode):
+        """Metin alanı ile sanal liste görünümü arasında geçiş yap"""
+        if list_mode == self.list_mode:
+            return
+        self.list_mode = list_mode
+        if list_mode:
+            self.text_frame.pack_forget()
+            self.h_scrollbar.pack_forget()
+            self.list_view.pack(fill=tk.BOTH, expand=True)
+        else:
+            self.list_view.pack_forget()
+            self.text_frame.pack(fill=tk.BOTH, expand=True)
+            self.h_scrollbar.pack(fill=tk.X)
+    
+    def show_strings(self):
+        """Aktif string tablosunu boyutuna uygun görünümde göster"""
+        if self.use_list_view(len(self.strings)):
+            # Metin alanı boşaltılır; düzenlemeler liste üzerinden tabloya yazılır
+            self.text_area.delete("1.0", tk.END)
+            self.text_area.edit_modified(False)
+            self.text_area.edit_reset()
+            self.show_view(list_mode=True)
+            self.list_view.set_table(self.strings)
+            self.update_line_numbers()
+            self.mark_as_modified(False)
+        else:
+            self.show_view(list_mode=False)
+            self.list_view.set_table(StringTable())
+            self.update_text_area()
+    
     def update_text_area(self):
         """Metin alanını güncelle"""
         self.text_area.delete("1.0", tk.END)
         
-        for line in self.current_strings:
-            self.text_area.insert(tk.END, line + "\n")
+        if len(self.strings):
+            self.text_area.insert(tk.END, "\n".join(self.current_strings) + "\n")
+        
+        # Yükleme bir düzenleme sayılmaz (eşlenmiş veri kopyalanmasın)
+        self.text_area.edit_modified(False)
         
         self.update_line_numbers()
         self.mark_as_modified(False)
     
     def update_line_numbers(self):
-        """Satır numaralarını güncelle"""
-        self.line_numbers_area.config(state=tk.NORMAL)
-        self.line_numbers_area.delete("1.0", tk.END)
-        
-        content = self.text_area.get("1.0", tk.END)
-        lines = content.split("\n")
-        
-        for i in range(1, len(lines)):
-            self.line_numbers_area.insert(tk.END, f"{i:4d}\n")
-        
-        self.line_numbers_area.config(state=tk.DISABLED)
+        """Satır numaralarını yalnızca görünen satırlar için çiz (belge boyutundan bağımsız)"""
+        gutter = self.line_numbers_area
+        gutter.delete("all")
+        
+        # Genişlik en büyük satır numarasının basamak sayısına göre ayarlanır
+        last_line = int(self.text_area.index("end-1c").split(".")[0])
+        digits = max(4, len(str(last_line)))
+        if digits != self.gutter_digits:
+            self.gutter_digits = digits
+            gutter.configure(width=self.gutter_font.measure("0" * digits) + 10)
+        x = int(gutter.cget("width")) - 5
+        
+        # İlk görünen satır sarılmış bir satırın devamıysa numarası çizilmez
+        index = self.text_area.index("@0,0")
+        if not index.endswith(".0"):
+            index = self.text_area.index(f"{index} +1line linestart")
+        
+        while True:
+            info = self.text_area.dlineinfo(index)
+            if info is None:  # görünen alanın dışına çıkıldı
+                break
+            
+            line = index.split(".")[0]
+            gutter.create_text(x, info[1], anchor=tk.NE, text=line,
+                               font=self.gutter_font, fill=self.gutter_fg)
+            
+            next_index = self.text_area.index(f"{index} +1line")
+            if next_index == index:  # son satır
+                break
+            index = next_index
     
     def update_file_info(self):
         """Dosya bilgilerini güncelle"""
@@ -927,24 +2192,15 @@ class GelistirilmisHDLangEditor:
         self.stats_text.config(state=tk.NORMAL)
         self.stats_text.delete("1.0", tk.END)
         
-        if self.current_strings:
-            total_strings = len(self.current_strings)
-            modified_count = 0
-            total_chars = 0
-            max_length = 0
-            min_length = float('inf')
-            
-            for i, current in enumerate(self.current_strings):
-                total_chars += len(current)
-                max_length = max(max_length, len(current))
-                min_length = min(min_length, len(current))
-                
-                if i < len(self.original_strings):
-                    if current != self.original_strings[i]:
-                        modified_count += 1
-            
-            avg_length = total_chars / total_strings if total_strings > 0 else 0
-            min_length = min_length if min_length != float('inf') else 0
+        if len(self.strings):
+            # Artımlı özet: düzenleme başına O(1) güncellenir
+            length_stats = self.strings.stats
+            total_strings = len(self.strings)
+            modified_count = len(self.strings.edits)
+            total_chars = length_stats.total_chars
+            max_length = length_stats.max_length
+            min_length = length_stats.min_length
+            avg_length = length_stats.mean
             
             stats_text = f"📊 GENEL İSTATİSTİKLER\n"
             stats_text += f"{'='*25}\n"
@@ -988,7 +2244,8 @@ class GelistirilmisHDLangEditor:
     def update_status(self, message):
         """Durum çubuğunu güncelle"""
         self.status_label.config(text=message)
-        self.window.update()
+        # Yalnızca yeniden çiz; olay işletmek işleyicilere yeniden girişe yol açar
+        self.window.update_idletasks()
     
     def mark_as_modified(self, modified=True):
         """Dosya değişiklik durumunu işaretle"""
@@ -1012,25 +2269,48 @@ class GelistirilmisHDLangEditor:
     def on_text_change(self, event=None):
         """Metin değişikliği olayı"""
         if self.text_area.edit_modified():
-            self.update_line_numbers()
-            
-            # Güncel stringleri al
-            content = self.text_area.get("1.0", tk.END).strip()
-            self.current_strings = content.split("\n") if content else []
-            
-            self.update_stats()
             self.mark_as_modified(True)
             self.text_area.edit_modified(False)
             
-            # Otomatik kaydetme timer'ını yeniden başlat
-            if self.settings["auto_save"]:
-                self.restart_auto_save_timer()
+            # Satır numaraları, tablo senkronu, istatistikler ve otomatik kaydetme
+            # timer'ı art arda tuş vuruşlarında tek sefer yenilenir
+            self.scheduler.schedule("gutter", "model", "stats", "autosave")
+    
+    def read_text_lines(self):
+        """Metin alanındaki satırları al (son satır sonu hariç)"""
+        content = self.text_area.get("1.0", "end-1c")
+        if content.endswith("\n"):
+            content = content[:-1]
+        return content.split("\n") if content else []
+    
+    def sync_strings_from_text(self):
+        """Metin alanındaki satırları string tablosuna aktar, satır sayısını döndür"""
+        if self.list_mode:
+            # Liste görünümü düzenlemeleri tabloya doğrudan yazar
+            return len(self.strings)
+        lines = self.read_text_lines()
+        self.strings.sync(lines)
+        return len(lines)
+    
+    def on_list_edit(self, index, text):
+        """Sanal listede bir satır düzenlendi"""
+        self.mark_as_modified(True)
+        self.strings.set(index, text)
+        self.scheduler.schedule("stats", "autosave")
+    
+    def on_list_select(self, index):
+        """Sanal listede seçim değişti"""
+        self.cursor_label.config(text=f"Satır: {index + 1}, Sütun: 1")
     
     def on_text_scroll(self, *args):
         """Scroll senkronizasyonu"""
-        self.line_numbers_area.yview(*args)
         self.text_area.yview(*args)
     
+    def on_text_yview(self, first, last):
+        """Metin alanı kaydığında kaydırma çubuğunu ve satır numaralarını güncelle"""
+        self.v_scrollbar.set(first, last)
+        self.scheduler.schedule("gutter", "highlight")
+    
     def on_mouse_wheel(self, event):
         """Mouse wheel ile scroll"""
         if event.delta:  # Windows
@@ -1043,7 +2323,6 @@ class GelistirilmisHDLangEditor:
             return
         
         self.text_area.yview_scroll(delta, "units")
-        self.line_numbers_area.yview_scroll(delta, "units")
         return "break"
     
     def on_file_drop(self, event):
@@ -1052,8 +2331,9 @@ class GelistirilmisHDLangEditor:
         if files:
             file_path = files[0].strip('{}')
             if file_path.lower().endswith('.hdlang'):
-                self.file_path = file_path
-                self.open_hdlang()
+                if self.is_modified and not self.ask_save_changes():
+                    return
+                self.load_hdlang(file_path)
     
     def on_font_change(self, value):
         """Font boyutu değişikliği"""
@@ -1062,7 +2342,10 @@ class GelistirilmisHDLangEditor:
         
         new_font = ('Consolas', font_size)
         self.text_area.configure(font=new_font)
-        self.line_numbers_area.configure(font=new_font)
+        self.gutter_font.configure(size=font_size)
+        self.gutter_digits = 0  # genişliği yeni yazı tipine göre yeniden hesapla
+        self.update_line_numbers()
+        self.list_view.set_font(font_size)
         
         self.save_settings()
     
@@ -1086,6 +2369,8 @@ class GelistirilmisHDLangEditor:
     
     def select_all(self, event=None):
         """Tümünü seç"""
+        if self.list_mode:
+            return "break"
         self.text_area.tag_add(tk.SEL, "1.0", tk.END)
         self.text_area.mark_set(tk.INSERT, "1.0")
         self.text_area.see(tk.INSERT)
@@ -1094,7 +2379,7 @@ class GelistirilmisHDLangEditor:
     def copy_text(self):
         """Metni kopyala"""
         try:
-            text = self.text_area.selection_get()
+            text = self.list_view.selected_text() if self.list_mode else self.text_area.selection_get()
             self.window.clipboard_clear()
             self.window.clipboard_append(text)
         except:
@@ -1102,6 +2387,8 @@ class GelistirilmisHDLangEditor:
     
     def paste_text(self):
         """Metni yapıştır"""
+        if self.list_mode:
+            return  # Liste görünümünde satırlar yerinde düzenlenir
         try:
             text = self.window.clipboard_get()
             self.text_area.insert(tk.INSERT, text)
@@ -1110,6 +2397,8 @@ class GelistirilmisHDLangEditor:
     
     def cut_text(self):
         """Metni kes"""
+        if self.list_mode:
+            return
         try:
             text = self.text_area.selection_get()
             self.window.clipboard_clear()
@@ -1121,7 +2410,12 @@ class GelistirilmisHDLangEditor:
     def search_selected(self):
         """Seçili metni ara"""
         try:
-            selected_text = self.text_area.selection_get()
+            if self.list_mode:
+                selected_text = self.list_view.selected_text()
+            else:
+                selected_text = self.text_area.selection_get()
+            if not selected_text:
+                return
             self.search_var.set(selected_text)
             self.search_text()
         except:
@@ -1132,15 +2426,15 @@ class GelistirilmisHDLangEditor:
         if self.is_modified and not self.ask_save_changes():
             return
         
+        self.close_file_data()
         self.file_path = None
         self.file_data = None
-        self.strings_positions = []
-        self.original_strings = []
-        self.current_strings = []
+        self.file_stat = None
+        self.strings = StringTable()
         self.is_modified = False
+        self.stop_search_index()
         
-        self.text_area.delete("1.0", tk.END)
-        self.update_line_numbers()
+        self.show_strings()
         self.update_file_info()
         self.update_stats()
         self.mark_as_modified(False)
@@ -1160,9 +2454,8 @@ class GelistirilmisHDLangEditor:
                 if not result:
                     return
             
-            current_path = self.file_path
-            self.file_path = current_path
-            self.open_hdlang()
+            # Değişmemiş dosya indeks önbelleğinden anında yüklenir
+            self.load_hdlang(self.file_path)
     
     def ask_save_changes(self):
         """Değişiklikleri kaydet sorusu"""
@@ -1174,7 +2467,8 @@ class GelistirilmisHDLangEditor:
             "Değişiklikleri kaydetmek istiyor musunuz?")
         
         if result is True:  # Evet
-            self.save_hdlang()
+            # Devam etmeden önce kaydetmenin bitmesini bekle
+            self.save_hdlang(background=False)
             return True
         elif result is False:  # Hayır
             return True
@@ -1233,7 +2527,8 @@ class GelistirilmisHDLangEditor:
             self.line_numbers_area.pack_forget()
             self.line_numbers_btn.config(bg='#6c757d')
         else:
-            self.line_numbers_area.pack(side=tk.LEFT, fill=tk.Y)
+            self.line_numbers_area.pack(side=tk.LEFT, fill=tk.Y, before=self.text_area)
+            self.update_line_numbers()
             self.line_numbers_btn.config(bg='#28a745')
     
     def toggle_fullscreen(self):
@@ -1286,8 +2581,7 @@ class GelistirilmisHDLangEditor:
         """Otomatik kaydetme"""
         if self.is_modified and self.file_path:
             try:
-                self.save_hdlang()
-                self.update_status("💿 Otomatik kaydedildi")
+                self.save_hdlang(quiet=True)
             except:
                 pass
         
@@ -1350,19 +2644,35 @@ class GelistirilmisHDLangEditor:
         stats += f"📁 Dosya: {os.path.basename(self.file_path) if self.file_path else 'N/A'}\n"
         stats += f"📝 Toplam String: {total:,}\n\n"
         
-        # Uzunluk analizi
-        lengths = [len(s) for s in self.current_strings]
+        # Uzunluk analizi - panelle aynı artımlı özetten
+        length_stats = self.strings.stats
         stats += f"📏 UZUNLUK ANALİZİ\n"
         stats += f"{'-' * 30}\n"
-        stats += f"En Kısa: {min(lengths):,} karakter\n"
-        stats += f"En Uzun: {max(lengths):,} karakter\n"
-        stats += f"Ortalama: {sum(lengths)/len(lengths):.1f} karakter\n"
-        stats += f"Toplam: {sum(lengths):,} karakter\n\n"
+        stats += f"En Kısa: {length_stats.min_length:,} karakter\n"
+        stats += f"En Uzun: {length_stats.max_length:,} karakter\n"
+        stats += f"Ortalama: {length_stats.mean:.1f} karakter\n"
+        stats += f"Toplam: {length_stats.total_chars:,} karakter\n\n"
+        
+        # Yüzdelikler
+        stats += f"📐 YÜZDELİKLER\n"
+        stats += f"{'-' * 30}\n"
+        for point, length in length_stats.percentiles().items():
+            stats += f"P{point:<3} {length:>8,} karakter\n"
+        stats += "\n"
+        
+        # Uzunluk dağılımı (2'nin kuvveti aralıkları)
+        stats += f"📊 UZUNLUK DAĞILIMI\n"
+        stats += f"{'-' * 30}\n"
+        buckets = length_stats.buckets()
+        largest = max(count for _, _, count in buckets)
+        for low, high, count in buckets:
+            bar = "█" * max(1, round(count / largest * 25))
+            stats += f"{low:>6}-{high:<6} {bar} {count:,}\n"
+        stats += "\n"
         
         # Değişiklik analizi
         if self.original_strings:
-            modified = sum(1 for i, s in enumerate(self.current_strings) 
-                          if i < len(self.original_strings) and s != self.original_strings[i])
+            modified = len(self.strings.edits)
             stats += f"🔄 DEĞİŞİKLİK ANALİZİ\n"
             stats += f"{'-' * 30}\n"
             stats += f"Değiştirilmiş: {modified:,}\n"
@@ -1371,27 +2681,68 @@ class GelistirilmisHDLangEditor:
         
         return stats
     
+    def restore_backup(self, backup, parent_window):
+        """Seçili yedeği kullanıcının seçtiği konuma geri yükle"""
+        dest_path = filedialog.asksaveasfilename(
+            title="Yedeği Geri Yükle",
+            initialfile=backup["name"],
+            initialdir=os.path.dirname(backup["source"]) if backup["source"] else None,
+            defaultextension=".hdlang",
+            filetypes=[("HDLang Files", "*.hdlang"), ("All Files", "*.*")],
+            parent=parent_window
+        )
+        if not dest_path:
+            return
+        
+        # Açık dosyanın üzerine yükleniyorsa önce eşlemeyi bırak
+        is_open_file = os.path.abspath(dest_path) == os.path.abspath(self.file_path or "")
+        if is_open_file:
+            if self.is_modified and not self.ask_save_changes():
+                return
+            self.ensure_editable_data()
+        
+        try:
+            size = self.backup_store().restore(backup, dest_path)
+        except Exception as e:
+            messagebox.showerror("Hata", f"❌ Geri yükleme başarısız:\n{str(e)}", parent=parent_window)
+            return
+        
+        self.update_status(f"♻️ Geri yüklendi: {os.path.basename(dest_path)} ({size:,} byte)")
+        if is_open_file:
+            self.load_hdlang(dest_path)
+        messagebox.showinfo("Başarılı", f"✅ Yedek geri yüklendi:\n{dest_path}", parent=parent_window)
+    
     def manage_backups(self):
-        """Yedekleme yönetimi"""
-        backup_dir = 'hdlang_backups'
+        """Yedekleme yönetimi - indeksten sayfa sayfa"""
+        backup_dir = BACKUP_DIR
         if not os.path.exists(backup_dir):
             messagebox.showinfo("Bilgi", "Henüz yedekleme oluşturulmamış.")
             return
         
-        backups = [f for f in os.listdir(backup_dir) if f.endswith('.backup')]
-        if not backups:
+        store = self.backup_store()
+        if not store.count_backups():
             messagebox.showinfo("Bilgi", "Yedekleme bulunamadı.")
             return
         
         # Yedekleme listesi penceresi
         backup_window = tk.Toplevel(self.window)
         backup_window.title("📦 Yedekleme Yönetimi")
-        backup_window.geometry("700x400")
+        backup_window.geometry("800x460")
         backup_window.configure(bg='#2b2b2b')
         
         tk.Label(backup_window, text="📦 Yedekleme Dosyaları", 
                 bg='#2b2b2b', fg='white', font=('Arial', 14, 'bold')).pack(pady=10)
         
+        # Kaynak dosyaya göre süzme
+        filter_frame = tk.Frame(backup_window, bg='#2b2b2b')
+        filter_frame.pack(fill=tk.X, padx=20)
+        tk.Label(filter_frame, text="Kaynak:", bg='#2b2b2b', fg='white').pack(side=tk.LEFT)
+        all_sources = "Tümü"
+        source_var = tk.StringVar(value=all_sources)
+        source_combo = ttk.Combobox(filter_frame, textvariable=source_var, state="readonly",
+                                    values=[all_sources] + store.sources())
+        source_combo.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        
         # Liste kutusu
         listbox_frame = tk.Frame(backup_window, bg='#2b2b2b')
         listbox_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
@@ -1400,20 +2751,59 @@ class GelistirilmisHDLangEditor:
         scrollbar = tk.Scrollbar(listbox_frame, orient=tk.VERTICAL, command=listbox.yview)
         listbox.configure(yscrollcommand=scrollbar.set)
         
-        for backup in sorted(backups, reverse=True):
-            backup_path = os.path.join(backup_dir, backup)
-            size = os.path.getsize(backup_path)
-            mtime = datetime.datetime.fromtimestamp(os.path.getmtime(backup_path))
-            display_text = f"{backup} ({size:,} byte) - {mtime.strftime('%Y-%m-%d %H:%M')}"
-            listbox.insert(tk.END, display_text)
-        
         listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        # Sayfalama: yalnızca görünen sayfa indeksten okunur
+        pager_frame = tk.Frame(backup_window, bg='#2b2b2b')
+        pager_frame.pack()
+        page_label = tk.Label(pager_frame, bg='#2b2b2b', fg='#cccccc', font=('Arial', 10))
+        state = {"page": 0, "rows": []}
+        
+        def selected_source():
+            source = source_var.get()
+            return None if source == all_sources else source
+        
+        def show_page(page):
+            source = selected_source()
+            total = store.count_backups(source)
+            pages = max(1, -(-total // BACKUP_PAGE_SIZE))
+            page = min(max(page, 0), pages - 1)
+            state["page"] = page
+            state["rows"] = store.list_backups(source, page * BACKUP_PAGE_SIZE, BACKUP_PAGE_SIZE)
+            
+            listbox.delete(0, tk.END)
+            for backup in state["rows"]:
+                marker = {"delta": " Δ", "legacy": " (eski)"}.get(backup["kind"], "")
+                created = backup["created"].replace("T", " ")[:16]
+                listbox.insert(tk.END, f"{backup['name']}{marker} ({backup['size']:,} byte) - {created}")
+            
+            page_label.config(text=f"Sayfa {page + 1} / {pages}  •  {total:,} yedek  •  "
+                                   f"Disk: {store.disk_usage() / 1024 / 1024:.1f} MB")
+        
+        tk.Button(pager_frame, text="◀", command=lambda: show_page(state["page"] - 1),
+                 bg='#6c757d', fg='white', padx=10).pack(side=tk.LEFT, padx=5)
+        page_label.pack(side=tk.LEFT, padx=10)
+        tk.Button(pager_frame, text="▶", command=lambda: show_page(state["page"] + 1),
+                 bg='#6c757d', fg='white', padx=10).pack(side=tk.LEFT, padx=5)
+        
+        source_combo.bind("<<ComboboxSelected>>", lambda e: show_page(0))
+        show_page(0)
+        
+        def restore_selected():
+            selection = listbox.curselection()
+            if not selection:
+                messagebox.showwarning("Uyarı", "Geri yüklenecek yedeği seçin.", parent=backup_window)
+                return
+            self.restore_backup(state["rows"][selection[0]], backup_window)
+        
         # Butonlar
         button_frame = tk.Frame(backup_window, bg='#2b2b2b')
         button_frame.pack(pady=10)
         
+        tk.Button(button_frame, text="♻️ Geri Yükle", command=restore_selected,
+                 bg='#28a745', fg='white', padx=15).pack(side=tk.LEFT, padx=5)
+        
         tk.Button(button_frame, text="📁 Klasörü Aç", 
                  command=lambda: os.startfile(backup_dir) if os.name == 'nt' else os.system(f'open "{backup_dir}"'),
                  bg='#17a2b8', fg='white', padx=15).pack(side=tk.LEFT, padx=5)
@@ -1425,24 +2815,40 @@ class GelistirilmisHDLangEditor:
         tk.Button(button_frame, text="Kapat", command=backup_window.destroy,
                  bg='#6c757d', fg='white', padx=15).pack(side=tk.LEFT, padx=5)
     
+    def backup_retention(self):
+        """Ayarlardaki saklama kuralları (prune parametreleri)"""
+        return {
+            "max_age_days": self.settings.get("backup_keep_days", 30),
+            "max_per_source": self.settings.get("backup_keep_per_file", 50),
+            "max_bytes": self.settings.get("backup_max_mb", 0) * 1024 * 1024,
+        }
+    
     def clear_old_backups(self, parent_window):
-        """Eski yedekleri temizle"""
-        backup_dir = 'hdlang_backups'
-        if messagebox.askyesno("Onay", "30 günden eski yedekleri silmek istediğinizden emin misiniz?", parent=parent_window):
+        """Eski yedekleri saklama kurallarına göre temizle"""
+        retention = self.backup_retention()
+        rules = []
+        if retention["max_age_days"]:
+            rules.append(f"• {retention['max_age_days']} günden eski yedekler")
+        if retention["max_per_source"]:
+            rules.append(f"• Dosya başına en yeni {retention['max_per_source']} yedek dışındakiler")
+        if retention["max_bytes"]:
+            rules.append(f"• Toplam {self.settings.get('backup_max_mb', 0)} MB'ı aşan en eski yedekler")
+        if not rules:
+            messagebox.showinfo("Bilgi", "Ayarlarda saklama kuralı tanımlı değil.", parent=parent_window)
+            return
+        
+        if messagebox.askyesno("Onay", "Şu yedekler silinecek:\n\n" + "\n".join(rules) +
+                               "\n\nDevam etmek istediğinizden emin misiniz?", parent=parent_window):
             try:
-                import time
-                current_time = time.time()
-                deleted_count = 0
+                store = self.backup_store()
+                deleted_count, _ = store.prune(**retention)
                 
-                for filename in os.listdir(backup_dir):
-                    file_path = os.path.join(backup_dir, filename)
-                    if filename.endswith('.backup'):
-                        file_age = current_time - os.path.getmtime(file_path)
-                        if file_age > 30 * 24 * 3600:  # 30 gün
-                            os.remove(file_path)
-                            deleted_count += 1
+                # Artık hiçbir yedeğin kullanmadığı parçaları sil
+                chunk_count, freed = store.gc()
                 
-                messagebox.showinfo("Başarılı", f"{deleted_count} eski yedekleme silindi.", parent=parent_window)
+                messagebox.showinfo("Başarılı", f"{deleted_count} eski yedekleme silindi.\n"
+                                               f"{chunk_count} parça, {freed:,} byte boşaltıldı.",
+                                    parent=parent_window)
                 parent_window.destroy()
                 
             except Exception as e:
@@ -1451,15 +2857,13 @@ class GelistirilmisHDLangEditor:
     def clear_cache(self):
         """Cache'leri temizle"""
         try:
-            # Geçici dosyaları temizle
-            temp_files = []
-            if os.path.exists('hdlang_settings.json'):
-                temp_files.append('hdlang_settings.json')
-            
             if messagebox.askyesno("Onay", f"Cache dosyaları temizlenecek.\n\nDevam etmek istiyor musunuz?"):
-                # Burada cache temizleme işlemleri yapılır
+                # Kalıcı çıkarma indekslerini sil
+                count, freed = clear_index_cache()
                 self.update_status("🧹 Cache temizlendi")
-                messagebox.showinfo("Başarılı", "Cache başarıyla temizlendi.")
+                messagebox.showinfo("Başarılı", 
+                    f"Cache başarıyla temizlendi.\n\n"
+                    f"{count} indeks dosyası silindi ({freed:,} byte)")
         except Exception as e:
             messagebox.showerror("Hata", f"Cache temizleme hatası: {e}")
     
@@ -1715,8 +3119,16 @@ dilediğiniz kadar uzun metinler yazabilirsiniz!
     def on_closing(self):
         """Pencere kapatılırken"""
         if self.ask_save_changes():
+            # Süren bir kaydetme varsa yarıda kesme
+            if self.save_task and self.save_task.running:
+                self.save_task.wait()
+            # Beklenen görev listeden kendini siler, kaydetme de yeni fark
+            # yedeği ekleyebilir; liste boşalana kadar sırayla beklenir
+            while self.backup_tasks:
+                self.backup_tasks.pop(0).wait()
             self.stop_auto_save_timer()
             self.save_settings()
+            self.close_file_data()
             self.window.destroy()
     
     def run(self):
@@ -1733,6 +3145,9 @@ dilediğiniz kadar uzun metinler yazabilirsiniz!
 
 # Ana program
 if __name__ == "__main__":
+    # Paketlenmiş (frozen) sürümde paralel tarama işçileri için gerekli
+    multiprocessing.freeze_support()
+    
     # Gerekli dizinleri oluştur
     os.makedirs('hdlang_backups', exist_ok=True)
     